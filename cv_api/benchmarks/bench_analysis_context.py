@@ -0,0 +1,65 @@
+"""
+Benchmark du contexte d'analyse partagé (ImageAnalysisContext).
+
+Compare, étape par étape, le temps passé dans identify_visual_type et
+extract_points_with_cv lorsque chaque étape recalcule niveaux de gris et
+Canny (ancien comportement) ou lorsqu'elles partagent un même contexte.
+
+Usage (depuis cv_api/) :
+    python -m benchmarks.bench_analysis_context
+"""
+import time
+
+from vision.cv_models.analysis_context import ImageAnalysisContext
+from vision.cv_models.pointinteret import InterestPointExtractor
+
+from .charts import make_line_chart
+
+SIZES = [(600, 400), (1920, 1080), (4000, 3000)]
+REPEAT = 5
+
+
+def _best_of(func, repeat: int = REPEAT) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run():
+    extractor = InterestPointExtractor()
+    print(f"{'taille':>12} {'étape':>10} {'sans ctx (ms)':>14} {'avec ctx (ms)':>14} {'gain':>7}")
+
+    for width, height in SIZES:
+        image = make_line_chart(width, height, n_points=50)
+        targets = extractor.define_targets(extractor.identify_visual_type(image))
+
+        # Sans contexte partagé : chaque étape construit son propre contexte
+        classify_cold = _best_of(lambda: extractor.identify_visual_type(image))
+        extract_cold = _best_of(lambda: extractor.extract_points_with_cv(image, targets))
+
+        # Avec contexte partagé : l'extraction réutilise gris + Canny de la classification
+        def classify_then_extract():
+            context = ImageAnalysisContext(image)
+            t0 = time.perf_counter()
+            extractor.identify_visual_type(image, context)
+            t1 = time.perf_counter()
+            extractor.extract_points_with_cv(image, targets, context)
+            t2 = time.perf_counter()
+            return t1 - t0, t2 - t1
+
+        timings = [classify_then_extract() for _ in range(REPEAT)]
+        classify_warm = min(t[0] for t in timings)
+        extract_warm = min(t[1] for t in timings)
+
+        label = f"{width}x{height}"
+        for stage, cold, warm in (("classify", classify_cold, classify_warm),
+                                  ("cv_extract", extract_cold, extract_warm),
+                                  ("total", classify_cold + extract_cold, classify_warm + extract_warm)):
+            print(f"{label:>12} {stage:>10} {cold * 1e3:>14.2f} {warm * 1e3:>14.2f} {cold / warm:>6.2f}x")
+
+
+if __name__ == "__main__":
+    run()
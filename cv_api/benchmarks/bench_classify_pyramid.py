@@ -0,0 +1,61 @@
+"""
+Benchmark précision / latence de la classification sur pyramide.
+
+Pour chaque image du corpus (graphiques, histogrammes et bruit synthétiques
+à plusieurs résolutions, plus les images de media/uploads), compare
+identify_visual_type à pleine résolution (référence) et en mode pyramide
+pour plusieurs valeurs de classify_max_side.
+
+Usage (depuis cv_api/) :
+    python -m benchmarks.bench_classify_pyramid
+"""
+import glob
+import os
+import time
+
+import cv2
+
+from vision.cv_models.pointinteret import InterestPointExtractor
+
+from .charts import make_histogram_chart, make_line_chart, make_noise_image
+
+RESOLUTIONS = [(800, 600), (1920, 1080), (4000, 3000)]
+MAX_SIDES = [None, 1024, 512, 256]
+MEDIA_GLOB = os.path.join(os.path.dirname(__file__), "..", "media", "uploads", "**", "*.*")
+
+
+def build_corpus():
+    corpus = []
+    for width, height in RESOLUTIONS:
+        for seed in range(3):
+            corpus.append((f"line_{width}x{height}_{seed}", make_line_chart(width, height, n_points=40, seed=seed)))
+            corpus.append((f"hist_{width}x{height}_{seed}", make_histogram_chart(width, height, seed=seed)))
+        corpus.append((f"noise_{width}x{height}", make_noise_image(width, height)))
+    for path in sorted(glob.glob(MEDIA_GLOB, recursive=True)):
+        image = cv2.imread(path)
+        if image is not None:
+            corpus.append((os.path.basename(path), image))
+    return corpus
+
+
+def run():
+    corpus = build_corpus()
+    reference = {name: InterestPointExtractor().identify_visual_type(image) for name, image in corpus}
+
+    print(f"{len(corpus)} images")
+    print(f"{'max_side':>9} {'précision':>10} {'total (ms)':>11} {'p50 (ms)':>9} {'max (ms)':>9}")
+    for max_side in MAX_SIDES:
+        extractor = InterestPointExtractor(classify_max_side=max_side)
+        latencies, correct = [], 0
+        for name, image in corpus:
+            start = time.perf_counter()
+            visual_type = extractor.identify_visual_type(image)
+            latencies.append(time.perf_counter() - start)
+            correct += visual_type == reference[name]
+        latencies.sort()
+        print(f"{str(max_side):>9} {correct / len(corpus):>10.1%} {sum(latencies) * 1e3:>11.1f} "
+              f"{latencies[len(latencies) // 2] * 1e3:>9.2f} {latencies[-1] * 1e3:>9.2f}")
+
+
+if __name__ == "__main__":
+    run()
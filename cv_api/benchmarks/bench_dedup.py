@@ -0,0 +1,68 @@
+"""
+Benchmark de la suppression des doublons de filter_points.
+
+Compare la comparaison deux à deux d'origine (quadratique) à la grille
+spatiale de suppress_duplicates, de 10² à 10⁶ points, en mode x seul et en
+mode rayon 2-D. L'implémentation d'origine n'est mesurée que jusqu'à
+QUADRATIC_MAX points.
+
+Usage (depuis cv_api/) :
+    python -m benchmarks.bench_dedup
+"""
+import time
+
+import numpy as np
+
+from vision.cv_models.dedup import suppress_duplicates
+
+SIZES = [10 ** k for k in range(2, 7)]
+MIN_DISTANCE = 5
+QUADRATIC_MAX = 10 ** 4
+
+
+def quadratic_dedup(xs, min_distance, ys=None):
+    """
+    Référence : boucle d'origine de filter_points (distance |dx|, ou
+    euclidienne si ys est fourni) ; renvoie les indices gardés
+    """
+    kept = []
+    for i in range(len(xs)):
+        if ys is None:
+            duplicate = any(abs(xs[i] - xs[k]) < min_distance for k in kept)
+        else:
+            duplicate = any((xs[i] - xs[k]) ** 2 + (ys[i] - ys[k]) ** 2 < min_distance ** 2 for k in kept)
+        if not duplicate:
+            kept.append(i)
+    return kept
+
+
+def run():
+    rng = np.random.default_rng(0)
+    print(f"{'n':>9} {'quadratique (s)':>16} {'grille x (s)':>13} {'grille 2-D (s)':>15} {'gardés':>8}")
+
+    for n in SIZES:
+        # Densité constante : l'axe x grandit avec le nombre de candidats
+        xs = rng.integers(0, n * MIN_DISTANCE // 2, n)
+        ys = rng.integers(0, 1000, n)
+
+        start = time.perf_counter()
+        kept = suppress_duplicates(xs, ys, MIN_DISTANCE)
+        grid_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        suppress_duplicates(xs, ys, MIN_DISTANCE, radius_2d=True)
+        grid_2d_time = time.perf_counter() - start
+
+        if n <= QUADRATIC_MAX:
+            start = time.perf_counter()
+            reference = quadratic_dedup(xs.tolist(), MIN_DISTANCE)
+            quadratic_time = f"{time.perf_counter() - start:.4f}"
+            assert reference == kept.tolist()
+        else:
+            quadratic_time = "-"
+
+        print(f"{n:>9} {quadratic_time:>16} {grid_time:>13.4f} {grid_2d_time:>15.4f} {len(kept):>8}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,107 @@
+"""
+Suite de benchmarks du pipeline de points d'intérêt sur le corpus synthétique.
+
+Pour chaque image du corpus (courbes, histogrammes, bruit à plusieurs
+résolutions et densités) : process_image de bout en bout, avec et sans
+données, puis les étapes dépendant de l'image (classification, extraction
+CV). Les étapes dépendant des seules données (extraction statistique,
+filtrage, association, sérialisation) sont mesurées une fois par longueur
+de série.
+
+Les résultats sont enregistrés dans benchmarks/results/<commit>.json (ou
+--output) et peuvent être comparés à une exécution précédente.
+
+Usage (depuis cv_api/) :
+    python -m benchmarks.bench_pipeline [--quick] [--filter texte] [--compare ancien.json]
+"""
+import argparse
+import json
+
+from vision.cv_models.analysis_context import ImageAnalysisContext
+from vision.cv_models.digitize import digitize_curves
+from vision.cv_models.pointinteret import InterestPointExtractor
+
+from .corpus import (DENSITIES, QUICK_DENSITIES, QUICK_RESOLUTIONS, RESOLUTIONS, SERIES_LENGTHS,
+                     build_corpus)
+from .runner import MIN_TIME, BenchmarkSession, compare, format_report
+
+# Cibles couvrant tous les détecteurs CV de extract_points_with_cv
+CV_TARGETS = ["sharp_changes", "salient_points"]
+
+
+def bench_image_stages(session: BenchmarkSession, extractor: InterestPointExtractor, case, name_filter: str):
+    image = case.image()
+    data = case.extracted_data()
+    cases = [
+        ("process_image", lambda: extractor.process_image(image)),
+        ("process_image+data", lambda: extractor.process_image(image, data)),
+        # Contexte recréé à chaque appel : coût réel de la classification
+        ("classify", lambda: extractor.identify_visual_type(image)),
+        ("cv_extract", lambda: extractor.extract_points_with_cv(image, CV_TARGETS)),
+        ("digitize", lambda: digitize_curves(ImageAnalysisContext(image))),
+    ]
+    for stage, func in cases:
+        name = f"{stage}[{case.name}]"
+        if name_filter in name:
+            session.bench(name, func, group=stage, params=case.params())
+
+
+def bench_data_stages(session: BenchmarkSession, extractor: InterestPointExtractor, case, name_filter: str):
+    data = case.extracted_data()
+    y_values = data["y_values"].tolist()
+    targets = extractor.define_targets("graph2D")
+    stat_points = extractor.extract_points_with_stats(y_values, targets)
+    filtered = extractor.filter_points(stat_points, "graph2D")
+    associated = extractor.associate_with_data(filtered, data)
+    params = {"series_length": len(y_values), "points": len(stat_points)}
+    cases = [
+        ("stats_extract", lambda: extractor.extract_points_with_stats(y_values, targets), len(y_values)),
+        ("filter", lambda: extractor.filter_points(stat_points, "graph2D"), len(stat_points)),
+        ("associate", lambda: extractor.associate_with_data(filtered, data), len(filtered)),
+        ("serialize", lambda: extractor.generate_structured_output(associated), len(associated)),
+    ]
+    for stage, func, items in cases:
+        name = f"{stage}[n{len(y_values)}]"
+        if name_filter in name:
+            session.bench(name, func, group=stage, params=params, items=max(1, items))
+
+
+def run(quick: bool = False, min_time: float = MIN_TIME, track_memory: bool = True, name_filter: str = ""):
+    corpus = build_corpus(QUICK_RESOLUTIONS, QUICK_DENSITIES) if quick else build_corpus(RESOLUTIONS, DENSITIES)
+    extractor = InterestPointExtractor()
+    session = BenchmarkSession(min_time=min_time, track_memory=track_memory)
+
+    for case in corpus:
+        bench_image_stages(session, extractor, case, name_filter)
+
+    # Une série par longueur distincte suffit pour les étapes sur données
+    series_cases = {SERIES_LENGTHS[case.kind]: case for case in corpus}
+    for case in series_cases.values():
+        bench_data_stages(session, extractor, case, name_filter)
+    return session
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="corpus réduit")
+    parser.add_argument("--min-time", type=float, default=MIN_TIME, help="durée minimale par benchmark (s)")
+    parser.add_argument("--no-memory", action="store_true", help="ne pas mesurer le pic mémoire")
+    parser.add_argument("--filter", default="", help="ne lancer que les benchmarks contenant ce texte")
+    parser.add_argument("--output", help="fichier JSON des résultats (défaut : results/<commit>.json)")
+    parser.add_argument("--compare", help="résultats JSON d'une exécution précédente")
+    args = parser.parse_args()
+
+    session = run(quick=args.quick, min_time=args.min_time, track_memory=not args.no_memory,
+                  name_filter=args.filter)
+    data = session.to_dict()
+    print(format_report(data["benchmarks"]))
+    print(f"\nrésultats : {session.save(args.output)}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            print()
+            print(compare(json.load(f), data))
+
+
+if __name__ == "__main__":
+    main()
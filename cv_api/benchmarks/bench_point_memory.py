@@ -0,0 +1,77 @@
+"""
+Benchmark mémoire des points : listes de tuples contre PointArray.
+
+Mesure (tracemalloc) le pic d'allocation et la taille des points produits
+par extract_points_with_cv sur des images riches en contours, comparé à la
+construction historique de tuples (x, y, "libellé") point par point.
+
+Usage (depuis cv_api/) :
+    python -m benchmarks.bench_point_memory
+"""
+import sys
+import time
+import tracemalloc
+
+import cv2
+
+from vision.cv_models.analysis_context import ImageAnalysisContext
+from vision.cv_models.pointinteret import InterestPointExtractor
+
+from .charts import make_noise_image
+
+SIZES = [(1000, 1000), (2000, 2000)]
+TARGETS = ["salient_points"]
+
+
+def tuple_points(image, targets):
+    """Référence : construction historique des points en tuples"""
+    context = ImageAnalysisContext(image)
+    points = []
+    corners = cv2.goodFeaturesToTrack(context.gray, maxCorners=100, qualityLevel=0.01, minDistance=10)
+    if corners is not None:
+        for corner in corners:
+            x, y = corner.ravel()
+            points.append((int(x), int(y), "corner"))
+    contours, _ = cv2.findContours(context.edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    for contour in contours:
+        approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
+        for point in approx:
+            x, y = point.ravel()
+            points.append((int(x), int(y), "contour_feature"))
+    return points
+
+
+def tuples_size(points) -> int:
+    # Liste + tuples + entiers (les libellés sont partagés)
+    return sys.getsizeof(points) + sum(sys.getsizeof(p) + sys.getsizeof(p[0]) + sys.getsizeof(p[1]) for p in points)
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def run():
+    extractor = InterestPointExtractor()
+    print(f"{'taille':>10} {'mode':>10} {'points':>8} {'taille pts (Ko)':>16} {'pic (Mo)':>9} {'temps (ms)':>11}")
+    for width, height in SIZES:
+        image = make_noise_image(width, height)
+        label = f"{width}x{height}"
+
+        points, elapsed, peak = measure(lambda: tuple_points(image, TARGETS))
+        print(f"{label:>10} {'tuples':>10} {len(points):>8} {tuples_size(points) / 1024:>16.0f} "
+              f"{peak / 2 ** 20:>9.1f} {elapsed * 1e3:>11.1f}")
+        del points
+
+        points, elapsed, peak = measure(lambda: extractor.extract_points_with_cv(image, TARGETS))
+        print(f"{label:>10} {'PointArray':>10} {len(points):>8} {points.nbytes / 1024:>16.0f} "
+              f"{peak / 2 ** 20:>9.1f} {elapsed * 1e3:>11.1f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,55 @@
+"""
+Benchmark du recadrage sur la zone de tracé (locate_plot_area).
+
+Sur des graphiques annotés (titre, légende, graduations et libellés),
+compare l'extraction CV sur l'image entière et sur la zone de tracé :
+pixels traités, points candidats et durée. La localisation réutilise les
+lignes de Hough de la classification, son coût est mesuré à part.
+
+Usage (depuis cv_api/) :
+    python -m benchmarks.bench_roi
+"""
+from vision.cv_models.analysis_context import ImageAnalysisContext
+from vision.cv_models.pointinteret import InterestPointExtractor
+from vision.cv_models.roi import locate_plot_area
+
+from .charts import make_line_chart
+from .runner import measure
+
+RESOLUTIONS = [(800, 600), (1920, 1080), (3840, 2160)]
+CV_TARGETS = ["sharp_changes", "salient_points"]
+
+
+def _median_ms(timings):
+    return sorted(timings)[len(timings) // 2] * 1e3
+
+
+def run():
+    extractor = InterestPointExtractor()
+    print(f"{'image':>10} {'zone':>10} {'pixels':>7} {'points':>13} {'complet ms':>11} {'zone ms':>8} {'roi ms':>7}")
+    for width, height in RESOLUTIONS:
+        image = make_line_chart(width, height, n_points=40, seed=3, annotated=True)
+        context = ImageAnalysisContext(image)
+        extractor.identify_visual_type(image, context)
+        roi = locate_plot_area(context)
+        if roi is None:
+            print(f"{width}x{height}: zone de tracé introuvable")
+            continue
+        x0, y0, x1, y1 = roi
+
+        full_points = extractor.extract_points_with_cv(image, CV_TARGETS, ImageAnalysisContext(image))
+        roi_points = extractor.extract_points_with_cv(image, CV_TARGETS, ImageAnalysisContext(image), roi=roi)
+        # Contexte recréé à chaque appel : pas de contours ni de gris en cache
+        full, _ = measure(lambda: extractor.extract_points_with_cv(image, CV_TARGETS, ImageAnalysisContext(image)),
+                          track_memory=False)
+        cropped, _ = measure(lambda: extractor.extract_points_with_cv(image, CV_TARGETS, ImageAnalysisContext(image),
+                                                                      roi=roi), track_memory=False)
+        locate, _ = measure(lambda: locate_plot_area(context), track_memory=False)
+
+        fraction = (x1 - x0) * (y1 - y0) / (width * height)
+        print(f"{width}x{height:<5} {x1 - x0}x{y1 - y0:<5} {fraction:>6.0%} {len(full_points):>6} -> {len(roi_points):<4} "
+              f"{_median_ms(full):>11.2f} {_median_ms(cropped):>8.2f} {_median_ms(locate):>7.3f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,63 @@
+"""
+Benchmark du coût de sérialisation par 10k points.
+
+Compare la sortie historique (generate_structured_output : parcours .item()
+puis json.dumps indenté), l'encodage compact de InterestPointResult.to_json
+(orjson si installé), to_dict seul (aucune sérialisation, cas des vues) et
+la conversion en tableau structuré.
+
+Usage (depuis cv_api/) :
+    python -m benchmarks.bench_serialization
+"""
+import json
+import time
+
+import numpy as np
+
+from vision.cv_models import results
+from vision.cv_models.pointinteret import InterestPointExtractor
+from vision.cv_models.results import InterestPointResult
+
+N_POINTS = [10_000, 100_000]
+REPEAT = 5
+
+
+def _best_of(func, repeat: int = REPEAT) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def make_points(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    labels = ("maximum", "minimum", "inflection")
+    return [{"type": labels[i % 3], "x_index": int(x), "x_value": float(x), "y_value": float(y)}
+            for i, (x, y) in enumerate(zip(rng.integers(0, 10_000, n), rng.normal(size=n)))]
+
+
+def run():
+    extractor = InterestPointExtractor()
+    print(f"encodeur compact : {'orjson' if results.orjson is not None else 'json (separators)'}")
+    print(f"{'points':>8} {'mode':>22} {'ms / 10k':>10} {'octets':>10}")
+    for n in N_POINTS:
+        points = make_points(n)
+        result = InterestPointResult(points)
+        cases = [
+            ("indenté (historique)", lambda: extractor.generate_structured_output(points)),
+            ("indenté + json.loads", lambda: json.loads(extractor.generate_structured_output(points))),
+            ("to_json compact", result.to_json),
+            ("to_dict", result.to_dict),
+            ("to_array", result.to_array),
+        ]
+        for label, func in cases:
+            elapsed = _best_of(func)
+            output = func()
+            size = len(output) if isinstance(output, str) else 0
+            print(f"{n:>8} {label:>22} {elapsed * 1e3 * 10_000 / n:>10.2f} {size:>10}")
+
+
+if __name__ == "__main__":
+    run()
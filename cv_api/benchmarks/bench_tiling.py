@@ -0,0 +1,64 @@
+"""
+Benchmark de l'extraction CV par tuiles sur de très grandes images.
+
+Mesure extract_points_with_cv sur des graphiques synthétiques de 20 à
+100 mégapixels, sans tuiles puis en mode tuiles avec 1, 2, 4... threads
+(jusqu'au nombre de cœurs), et vérifie que les coins retenus ont les mêmes
+réponses que l'extraction globale (à égalité de réponse, le choix entre
+coins peut différer).
+
+Usage (depuis cv_api/) :
+    python -m benchmarks.bench_tiling [mégapixels ...]
+"""
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from vision.cv_models.analysis_context import ImageAnalysisContext
+from vision.cv_models.pointinteret import InterestPointExtractor
+
+from .charts import make_line_chart
+
+MEGAPIXELS = [20, 50, 100]
+TILE_SIZE = 2048
+TARGETS = ["salient_points"]
+
+
+def _corner_responses(points, eig):
+    corners = points[points.mask_types(["corner"])]
+    return np.sort(eig[corners.y.astype(np.int64), corners.x])
+
+
+def run(megapixels=MEGAPIXELS):
+    cores = os.cpu_count() or 1
+    thread_counts = sorted({1, 2, 4, 8, 16, cores} & set(range(1, cores + 1)))
+    print(f"{cores} cœurs")
+    print(f"{'MP':>5} {'mode':>14} {'temps (s)':>10} {'accél.':>7} {'mêmes réponses':>15}")
+
+    for mp in megapixels:
+        width = int((mp * 1e6 * 4 / 3) ** 0.5)
+        height = int(mp * 1e6 / width)
+        image = make_line_chart(width, height, n_points=200)
+        context = ImageAnalysisContext(image)
+        context.gray  # conversion exclue des mesures
+        eig = cv2.cornerMinEigenVal(context.gray, blockSize=3, ksize=3)
+
+        start = time.perf_counter()
+        reference = InterestPointExtractor().extract_points_with_cv(image, TARGETS, context)
+        baseline = time.perf_counter() - start
+        print(f"{mp:>5} {'global':>14} {baseline:>10.2f} {1.0:>7.2f} {'-':>15}")
+
+        for threads in thread_counts:
+            extractor = InterestPointExtractor(tile_size=TILE_SIZE, tile_workers=threads)
+            start = time.perf_counter()
+            points = extractor.extract_points_with_cv(image, TARGETS, context)
+            elapsed = time.perf_counter() - start
+            same = np.array_equal(_corner_responses(points, eig), _corner_responses(reference, eig))
+            print(f"{mp:>5} {f'tuiles x{threads}':>14} {elapsed:>10.2f} {baseline / elapsed:>7.2f} {str(same):>15}")
+
+
+if __name__ == "__main__":
+    run([float(arg) for arg in sys.argv[1:]] or MEGAPIXELS)
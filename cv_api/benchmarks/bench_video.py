@@ -0,0 +1,77 @@
+"""
+Benchmark du mode flux d'images (FrameStreamExtractor).
+
+Simule l'enregistrement d'un tableau de bord : une courbe qui défile de
+quelques pixels par image, avec un changement de graphique toutes les
+SCENE_LENGTH images. Compare, par image, le traitement complet
+(classification + goodFeaturesToTrack) au mode flux (reclassification au
+changement de scène, coins suivis par flot optique).
+
+Usage (depuis cv_api/) :
+    python -m benchmarks.bench_video [largeur hauteur]
+"""
+import sys
+import time
+
+import numpy as np
+
+from vision.cv_models.analysis_context import ImageAnalysisContext
+from vision.cv_models.detectors import detect_corners
+from vision.cv_models.pointinteret import InterestPointExtractor
+from vision.cv_models.video import FrameStreamExtractor
+
+from .charts import make_histogram_chart, make_line_chart
+
+N_FRAMES = 300
+SCENE_LENGTH = 150
+SCROLL = 2
+
+
+def make_recording(width: int, height: int, n_frames: int = N_FRAMES):
+    """Images d'un tableau de bord qui défile, alternant courbe et histogramme"""
+    scenes = [make_line_chart(width * 2, height, n_points=80, seed=1),
+              make_histogram_chart(width * 2, height, n_bars=40, seed=2)]
+    for i in range(n_frames):
+        scene = scenes[(i // SCENE_LENGTH) % len(scenes)]
+        offset = (i % SCENE_LENGTH) * SCROLL
+        yield np.ascontiguousarray(scene[:, offset:offset + width])
+
+
+def _per_frame(process, frames):
+    timings = []
+    for frame in frames:
+        start = time.perf_counter()
+        process(frame)
+        timings.append(time.perf_counter() - start)
+    return np.asarray(timings)
+
+
+def run(width: int = 1920, height: int = 1080):
+    frames = list(make_recording(width, height))
+    extractor = InterestPointExtractor()
+
+    def full(frame):
+        context = ImageAnalysisContext(frame)
+        extractor.identify_visual_type(frame, context)
+        detect_corners(context)
+
+    stream = FrameStreamExtractor(extractor)
+    results = []
+    cases = [
+        ("complet", full),
+        ("flux", lambda frame: results.append(stream.process_frame(frame))),
+    ]
+
+    print(f"{len(frames)} images {width}x{height}")
+    print(f"{'mode':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'images/s':>9}")
+    for name, process in cases:
+        timings = _per_frame(process, frames)
+        print(f"{name:>8} {np.percentile(timings, 50) * 1e3:>8.2f} {np.percentile(timings, 99) * 1e3:>8.2f} "
+              f"{timings.max() * 1e3:>8.2f} {len(frames) / timings.sum():>9.1f}")
+
+    print(f"reclassements : {sum(r.scene_change for r in results)}, "
+          f"détections complètes : {sum(r.redetected for r in results)}")
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,73 @@
+import cv2
+import numpy as np
+
+
+def make_line_chart(width: int = 600, height: int = 400, n_points: int = 5, seed: int = 0,
+                    annotated: bool = False) -> np.ndarray:
+    """
+    Génère un graphique 2D synthétique (axes + polyligne) de la taille demandée ;
+    avec `annotated`, ajoute titre, légende, graduations et leurs libellés
+    """
+    rng = np.random.default_rng(seed)
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+
+    margin_x, margin_y = width // 12, height // 8
+    xs = np.linspace(2 * margin_x, width - margin_x, n_points)
+    ys = rng.uniform(margin_y, height - 2 * margin_y, n_points)
+    points = np.stack([xs, ys], axis=1).astype(np.int32)
+    thickness = max(2, width // 300)
+    cv2.polylines(image, [points], False, (0, 0, 255), thickness)
+
+    # Axes
+    cv2.line(image, (margin_x, margin_y), (margin_x, height - margin_y), (0, 0, 0), thickness)
+    cv2.line(image, (margin_x, height - margin_y), (width - margin_x, height - margin_y), (0, 0, 0), thickness)
+    if annotated:
+        _annotate(image, margin_x, margin_y, thickness)
+    return image
+
+
+def _annotate(image: np.ndarray, margin_x: int, margin_y: int, thickness: int):
+    """Titre, légende et graduations autour de la zone de tracé (hors des axes)"""
+    height, width = image.shape[:2]
+    scale = height / 800
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    cv2.putText(image, "Revenue by quarter", (width // 3, margin_y // 2), font, 2 * scale, (0, 0, 0), thickness)
+
+    # Légende encadrée à droite de l'axe des x
+    x0, y0 = width - margin_x + thickness * 4, margin_y
+    cv2.rectangle(image, (x0, y0), (width - thickness * 2, y0 + margin_y), (0, 0, 0), 1)
+    cv2.line(image, (x0 + 5, y0 + margin_y // 2), (x0 + margin_x // 3, y0 + margin_y // 2), (0, 0, 255), thickness)
+    cv2.putText(image, "A", (x0 + margin_x // 3 + 5, y0 + margin_y * 2 // 3), font, scale, (0, 0, 0), 1)
+
+    tick = max(4, height // 80)
+    for i, x in enumerate(np.linspace(margin_x, width - margin_x, 9).astype(int)):
+        cv2.line(image, (x, height - margin_y), (x, height - margin_y + tick), (0, 0, 0), thickness)
+        cv2.putText(image, str(2016 + i), (x - tick * 3, height - margin_y // 3), font, scale, (0, 0, 0), 1)
+    for i, y in enumerate(np.linspace(height - margin_y, margin_y, 6).astype(int)):
+        cv2.line(image, (margin_x - tick, y), (margin_x, y), (0, 0, 0), thickness)
+        cv2.putText(image, str(20 * i), (margin_x // 6, y + tick), font, scale, (0, 0, 0), 1)
+
+
+def make_histogram_chart(width: int = 600, height: int = 400, n_bars: int = 12, seed: int = 0) -> np.ndarray:
+    """
+    Génère un histogramme synthétique (barres pleines sur fond blanc)
+    """
+    rng = np.random.default_rng(seed)
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+
+    margin_x, margin_y = width // 12, height // 8
+    bar_width = (width - 2 * margin_x) // n_bars
+    heights = rng.uniform(0.1, 1.0, n_bars) * (height - 2 * margin_y)
+    for i, bar_height in enumerate(heights):
+        x0 = margin_x + i * bar_width
+        cv2.rectangle(image, (x0 + 2, int(height - margin_y - bar_height)),
+                      (x0 + bar_width - 2, height - margin_y), (180, 120, 40), -1)
+    return image
+
+
+def make_noise_image(width: int = 600, height: int = 400, seed: int = 0) -> np.ndarray:
+    """
+    Génère une image de bruit uniforme (aucune structure de graphique)
+    """
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
@@ -0,0 +1,95 @@
+"""
+Corpus synthétique reproductible pour les benchmarks du pipeline.
+
+Chaque cas est décrit par son type (courbe, histogramme, bruit), sa
+résolution, sa densité (sommets de la polyligne, nombre de barres) et une
+graine : l'image et la série numérique associée sont régénérées à
+l'identique d'une exécution à l'autre, sans fichier à versionner.
+
+Usage (depuis cv_api/) pour écrire le corpus sur disque :
+    python -m benchmarks.corpus <répertoire>
+"""
+import json
+import os
+import sys
+from typing import Dict, List
+
+import cv2
+import numpy as np
+
+from .charts import make_histogram_chart, make_line_chart, make_noise_image
+
+RESOLUTIONS = [(640, 480), (1920, 1080), (3840, 2160)]
+DENSITIES = {"line": [5, 50, 500], "histogram": [8, 64], "noise": [0]}
+
+# Corpus réduit pour une exécution rapide (--quick)
+QUICK_RESOLUTIONS = [(640, 480), (1920, 1080)]
+QUICK_DENSITIES = {"line": [5, 200], "histogram": [12], "noise": [0]}
+
+# Longueur des séries numériques (extracted_data) associées aux images
+SERIES_LENGTHS = {"line": 2000, "histogram": 256, "noise": 2000}
+
+
+class CorpusCase:
+    """Un cas du corpus ; image et données sont générées à la demande"""
+
+    __slots__ = ("kind", "width", "height", "density", "seed")
+
+    def __init__(self, kind: str, width: int, height: int, density: int, seed: int = 0):
+        self.kind = kind
+        self.width = width
+        self.height = height
+        self.density = density
+        self.seed = seed
+
+    @property
+    def name(self) -> str:
+        suffix = f"-d{self.density}" if self.kind != "noise" else ""
+        return f"{self.kind}-{self.width}x{self.height}{suffix}"
+
+    def params(self) -> Dict:
+        return {"kind": self.kind, "width": self.width, "height": self.height,
+                "density": self.density, "seed": self.seed}
+
+    def image(self) -> np.ndarray:
+        if self.kind == "line":
+            return make_line_chart(self.width, self.height, n_points=self.density, seed=self.seed)
+        if self.kind == "histogram":
+            return make_histogram_chart(self.width, self.height, n_bars=self.density, seed=self.seed)
+        return make_noise_image(self.width, self.height, seed=self.seed)
+
+    def extracted_data(self) -> Dict:
+        """Série numérique bruitée (marche aléatoire lissée) de longueur fixe par type"""
+        n = SERIES_LENGTHS[self.kind]
+        rng = np.random.default_rng(self.seed)
+        y_values = np.convolve(rng.normal(size=n).cumsum(), np.ones(5) / 5, mode="same")
+        return {"x_values": np.arange(n, dtype=np.float64), "y_values": y_values}
+
+
+def build_corpus(resolutions=RESOLUTIONS, densities=DENSITIES, seed: int = 0) -> List[CorpusCase]:
+    return [CorpusCase(kind, width, height, density, seed)
+            for kind, kind_densities in densities.items()
+            for width, height in resolutions
+            for density in kind_densities]
+
+
+def write_corpus(directory: str, cases: List[CorpusCase]) -> str:
+    """
+    Écrit les images (PNG) et un manifest.json décrivant chaque cas
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest = []
+    for case in cases:
+        filename = f"{case.name}.png"
+        cv2.imwrite(os.path.join(directory, filename), case.image())
+        manifest.append({"name": case.name, "file": filename, **case.params()})
+    path = os.path.join(directory, "manifest.json")
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return path
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage : python -m benchmarks.corpus <répertoire>")
+    print(write_corpus(sys.argv[1], build_corpus()))
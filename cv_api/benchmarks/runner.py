@@ -0,0 +1,192 @@
+"""
+Exécuteur de benchmarks dans l'esprit de pytest-benchmark, sans dépendance.
+
+Chaque mesure passe par un échauffement, puis un nombre de tours calibré
+sur la durée du premier appel (au moins MIN_ROUNDS, au plus MAX_ROUNDS,
+environ MIN_TIME secondes au total). Le pic mémoire est relevé lors d'un
+appel séparé sous tracemalloc, pour ne pas fausser les temps.
+
+Les résultats (statistiques, métadonnées de l'environnement et commit git)
+sont enregistrés en JSON et peuvent être comparés entre deux commits :
+    python -m benchmarks.runner compare <ancien.json> <nouveau.json>
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import cv2
+import numpy as np
+
+MIN_TIME = 0.5
+MIN_ROUNDS = 5
+MAX_ROUNDS = 200
+WARMUP = 1
+
+# Écart relatif de la médiane au-delà duquel compare() signale une régression
+REGRESSION_THRESHOLD = 0.10
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+class BenchmarkResult:
+    """Temps par appel (s) et pic mémoire (octets) d'un benchmark"""
+
+    def __init__(self, name: str, group: str, params: Dict, timings: List[float], peak_bytes: int,
+                 items: int = 1):
+        self.name = name
+        self.group = group
+        self.params = params
+        self.timings = timings
+        self.peak_bytes = peak_bytes
+        # Unités traitées par appel (images, points...) pour le débit
+        self.items = items
+
+    def stats(self) -> Dict:
+        timings = np.asarray(self.timings)
+        median = float(np.median(timings))
+        return {
+            "rounds": len(timings),
+            "min": float(timings.min()),
+            "max": float(timings.max()),
+            "mean": float(timings.mean()),
+            "stddev": float(timings.std(ddof=1)) if len(timings) > 1 else 0.0,
+            "median": median,
+            "p90": float(np.percentile(timings, 90)),
+            "p99": float(np.percentile(timings, 99)),
+            "ops": self.items / median if median > 0 else float("inf"),
+            "peak_bytes": self.peak_bytes,
+        }
+
+    def to_dict(self) -> Dict:
+        return {"name": self.name, "group": self.group, "params": self.params,
+                "items": self.items, "stats": self.stats()}
+
+
+def measure(func: Callable, min_time: float = MIN_TIME, min_rounds: int = MIN_ROUNDS,
+            max_rounds: int = MAX_ROUNDS, warmup: int = WARMUP, track_memory: bool = True):
+    """
+    Mesure func() : renvoie (temps par appel, pic mémoire ou None)
+    """
+    for _ in range(warmup):
+        func()
+
+    start = time.perf_counter()
+    func()
+    first = time.perf_counter() - start
+    rounds = int(min(max_rounds, max(min_rounds, min_time / max(first, 1e-9))))
+
+    timings = [first]
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    peak_bytes = None
+    if track_memory:
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        func()
+        peak_bytes = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+        if not was_tracing:
+            tracemalloc.stop()
+    return timings, peak_bytes
+
+
+def _git_commit() -> Dict:
+    def git(*args):
+        return subprocess.run(["git", *args], capture_output=True, text=True,
+                              cwd=os.path.dirname(__file__)).stdout.strip()
+    try:
+        return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+    except OSError:
+        return {"commit": None, "dirty": None}
+
+
+def machine_info() -> Dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "opencv_threads": cv2.getNumThreads(),
+    }
+
+
+class BenchmarkSession:
+    """Ensemble de résultats d'une exécution, avec métadonnées"""
+
+    def __init__(self, min_time: float = MIN_TIME, track_memory: bool = True):
+        self.min_time = min_time
+        self.track_memory = track_memory
+        self.results: List[BenchmarkResult] = []
+
+    def bench(self, name: str, func: Callable, group: str = "", params: Dict = None,
+              items: int = 1) -> BenchmarkResult:
+        timings, peak_bytes = measure(func, min_time=self.min_time, track_memory=self.track_memory)
+        result = BenchmarkResult(name, group, params or {}, timings, peak_bytes, items)
+        self.results.append(result)
+        return result
+
+    def to_dict(self) -> Dict:
+        return {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git": _git_commit(),
+            "machine": machine_info(),
+            "benchmarks": [result.to_dict() for result in self.results],
+        }
+
+    def save(self, path: str = None) -> str:
+        data = self.to_dict()
+        if path is None:
+            commit = (data["git"]["commit"] or "unknown")[:10]
+            suffix = "-dirty" if data["git"]["dirty"] else ""
+            path = os.path.join(RESULTS_DIR, f"{commit}{suffix}.json")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        return path
+
+
+def format_report(benchmarks: List[Dict]) -> str:
+    lines = [f"{'benchmark':<48} {'médiane ms':>10} {'p90 ms':>9} {'p99 ms':>9} {'ops/s':>9} {'pic Mo':>8} {'tours':>6}"]
+    for bench in benchmarks:
+        stats = bench["stats"]
+        peak = f"{stats['peak_bytes'] / 1e6:.1f}" if stats["peak_bytes"] is not None else "-"
+        lines.append(f"{bench['name']:<48} {stats['median'] * 1e3:>10.3f} {stats['p90'] * 1e3:>9.3f} "
+                     f"{stats['p99'] * 1e3:>9.3f} {stats['ops']:>9.1f} {peak:>8} {stats['rounds']:>6}")
+    return "\n".join(lines)
+
+
+def compare(old: Dict, new: Dict, threshold: float = REGRESSION_THRESHOLD) -> str:
+    """
+    Tableau des médianes entre deux exécutions enregistrées ; les écarts
+    supérieurs à `threshold` sont marqués (+ régression, - amélioration)
+    """
+    old_by_name = {bench["name"]: bench["stats"] for bench in old["benchmarks"]}
+    lines = [f"ancien : {old['git']['commit']}  nouveau : {new['git']['commit']}",
+             f"{'benchmark':<48} {'ancien ms':>10} {'nouveau ms':>10} {'écart':>8}"]
+    for bench in new["benchmarks"]:
+        previous = old_by_name.get(bench["name"])
+        if previous is None:
+            continue
+        before, after = previous["median"], bench["stats"]["median"]
+        change = (after - before) / before if before > 0 else 0.0
+        flag = "+" if change > threshold else "-" if change < -threshold else ""
+        lines.append(f"{bench['name']:<48} {before * 1e3:>10.3f} {after * 1e3:>10.3f} {change:>+7.1%} {flag}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] != "compare":
+        sys.exit("usage : python -m benchmarks.runner compare <ancien.json> <nouveau.json>")
+    with open(sys.argv[2]) as f_old, open(sys.argv[3]) as f_new:
+        print(compare(json.load(f_old), json.load(f_new)))
@@ -14,3 +14,10 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cv_api.settings')
 
 application = get_asgi_application()
+
+# Load the CV stack and warm the extractors before the first request
+from vision.jobs import resume_jobs  # noqa: E402
+from vision.services import warm_up  # noqa: E402
+
+warm_up()
+resume_jobs()
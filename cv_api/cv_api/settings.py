@@ -129,6 +129,23 @@ import os
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Longest image side the interest-point analysis needs; larger uploads are
+# decoded at reduced resolution (IMREAD_REDUCED_*). None decodes at full size.
+INTEREST_POINT_MAX_SIDE = None
+
+# Threads used by the async views for decoding and process_image
+INTEREST_POINT_ASYNC_WORKERS = 4
+
+# Uploads are stored once per distinct content (see vision.storage)
+STORAGES = {
+    'default': {
+        'BACKEND': 'vision.storage.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
 # Django REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_PARSER_CLASSES': [
@@ -158,3 +175,81 @@ REST_FRAMEWORK = {
         'user': '1000/hour'
     }
 }
+
+# Asynchronous interest-point jobs: process pool size and backpressure limit.
+# The same worker pool serves batch uploads, capped at BATCH_MAX_FILES images;
+# zip members larger than BATCH_MAX_MEMBER_SIZE bytes (uncompressed) are rejected.
+# Workers build their extractor from INTEREST_POINT_EXTRACTORS[EXTRACTOR] and
+# are started with START_METHOD ('fork', 'spawn', 'forkserver'; None = platform default).
+INTEREST_POINT_JOBS = {
+    'WORKERS': 2,
+    'START_METHOD': None,
+    'EXTRACTOR': 'default',
+    'MAX_PENDING': 32,
+    'BATCH_MAX_FILES': 1000,
+    'BATCH_MAX_MEMBER_SIZE': 10 * 1024 * 1024,
+}
+
+# Content-addressed cache of process_image results (memory LRU + size-bounded disk tier)
+INTEREST_POINT_CACHE = {
+    'MEMORY_ITEMS': 256,
+    'DIR': os.path.join(BASE_DIR, 'cache', 'interest_points'),
+    'MAX_BYTES': 256 * 1024 * 1024,
+}
+
+# Video / screen-recording mode (vision.cv_models.video.FrameStreamExtractor):
+# full corner detection every REDETECT_INTERVAL frames (optical flow in
+# between), re-classification when the mean thumbnail difference between two
+# frames exceeds SCENE_THRESHOLD (grey levels), at most MAX_FRAMES per upload
+INTEREST_POINT_VIDEO = {
+    'REDETECT_INTERVAL': 30,
+    'SCENE_THRESHOLD': 12.0,
+    'MAX_FRAMES': 18000,
+}
+
+# Store process_image results (vision.models.ProcessedImage / InterestPoint)
+# for the query API at /api/interest-points/query/
+INTEREST_POINT_PERSIST = True
+
+# Process-wide extractors (vision.services.get_extractor): OPTIONS are
+# InterestPointExtractor keyword arguments, CACHE attaches the result cache.
+# 'digitize' reads y_values from the curve pixels of uploads sent without data
+INTEREST_POINT_EXTRACTORS = {
+    'default': {'OPTIONS': {'digitize': True}, 'CACHE': True},
+}
+
+# OpenCV runtime: internal thread count (None = OpenCV default, lower it when
+# many requests run in parallel) and optimized (SIMD) code paths
+INTEREST_POINT_OPENCV = {
+    'NUM_THREADS': None,
+    'USE_OPTIMIZED': True,
+}
+
+# Warm the extractors when the WSGI/ASGI application loads
+INTEREST_POINT_WARMUP = True
+
+# Per-stage pipeline metrics (served at /metrics/). TRACK_MEMORY enables
+# tracemalloc for per-stage peak memory, which slows every request down.
+# TRACK_RSS reports the peak resident set size: per job in the job workers,
+# since startup for the processes serving requests concurrently.
+INTEREST_POINT_METRICS = {
+    'BUCKETS': (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    'TRACK_MEMORY': False,
+    'TRACK_RSS': True,
+}
+
+# Per-request memory budget (vision.memory.MemoryBudget), checked from the
+# image header before decoding: uploads over MAX_PIXELS decoded pixels, or
+# whose estimated working set exceeds MAX_BYTES, are decoded at reduced
+# resolution; None disables a limit. Size MAX_BYTES x concurrent requests
+# (INTEREST_POINT_ASYNC_WORKERS, job workers) below the worker memory limit.
+INTEREST_POINT_MEMORY = {
+    'MAX_PIXELS': 40_000_000,
+    'MAX_BYTES': 768 * 1024 * 1024,
+}
+
+# JSON API: page size for interest-point lists (?page_size= up to MAX_PAGE_SIZE)
+INTEREST_POINT_API = {
+    'PAGE_SIZE': 500,
+    'MAX_PAGE_SIZE': 10000,
+}
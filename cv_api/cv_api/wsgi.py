@@ -14,3 +14,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cv_api.settings')
 
 application = get_wsgi_application()
+
+# Load the CV stack and warm the extractors before the first request
+from vision.jobs import resume_jobs  # noqa: E402
+from vision.services import warm_up  # noqa: E402
+
+warm_up()
+resume_jobs()
@@ -0,0 +1,147 @@
+import json
+import os
+import zipfile
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from .jobs import QueueUnavailable, get_job_queue
+from .persistence import try_persist_result
+from .services import get_pipeline_metrics
+from .uploads import save_upload_buffer, upload_buffer
+
+
+def is_zip_upload(uploaded_file):
+    return (uploaded_file.name.lower().endswith(".zip")
+            or uploaded_file.content_type in ("application/zip", "application/x-zip-compressed"))
+
+
+class UploadImages:
+    """
+    Iterate (name, buffer, error) for every image in the request: plain files
+    are exposed through upload_buffer, zip archives are expanded member by
+    member. Archive members whose declared size exceeds max_member_size are
+    not read; they come with a buffer of None and an error message.
+
+    Stops after max_files images; `truncated` then tells whether images were
+    left out.
+    """
+
+    def __init__(self, files, max_files, max_member_size=None):
+        self.files = files
+        self.max_files = max_files
+        self.max_member_size = max_member_size
+        self.truncated = False
+
+    def __iter__(self):
+        count = 0
+        for uploaded_file in self.files:
+            if is_zip_upload(uploaded_file):
+                with zipfile.ZipFile(uploaded_file) as archive:
+                    for info in archive.infolist():
+                        if info.is_dir() or os.path.basename(info.filename).startswith("."):
+                            continue
+                        if count >= self.max_files:
+                            self.truncated = True
+                            return
+                        count += 1
+                        if self.max_member_size is not None and info.file_size > self.max_member_size:
+                            yield info.filename, None, (f"Archive member is too large ({info.file_size} bytes, "
+                                                        f"limit {self.max_member_size})")
+                            continue
+                        # The declared size bounds what read() decompresses
+                        yield info.filename, memoryview(archive.read(info)), None
+            else:
+                if count >= self.max_files:
+                    self.truncated = True
+                    return
+                count += 1
+                with upload_buffer(uploaded_file) as buffer:
+                    yield uploaded_file.name, buffer, None
+
+
+def stream_batch(files, storage, max_files=1000, max_member_size=None, prefix="uploads/interest_points"):
+    """
+    Store each image, fan it out to the warm worker pool and yield one NDJSON
+    line per image as soon as it finishes (completion order, not upload order),
+    followed by a summary line. Results are persisted as they arrive. At most two jobs per worker are in flight so a
+    large archive neither floods the pool nor piles up in memory. Archive
+    members over max_member_size bytes are reported as failed without being
+    extracted; the summary tells whether max_files cut the batch short.
+
+    When a worker dies (crash, OOM kill), every image in flight on its pool
+    fails with it: those images run again one at a time on a fresh pool, so
+    only the image that kills its worker is reported as failed.
+    """
+    queue = get_job_queue()
+    window = max(1, queue.workers * 2)
+    in_flight = {}
+    broken = []
+    done_count = failed_count = 0
+
+    def line(data):
+        return json.dumps(data, separators=(",", ":")) + "\n"
+
+    def report(item, error=None, result=None):
+        nonlocal done_count, failed_count
+        index, name, file_path = item
+        data = {"index": index, "name": name, "image_path": file_path}
+        if error is None:
+            done_count += 1
+            get_pipeline_metrics().observe(result.get("profile", {}))
+            try_persist_result(storage, file_path, result)
+            data.update(status="done", result=result)
+        else:
+            failed_count += 1
+            data.update(status="failed", error=error)
+        return line(data)
+
+    def drain(return_when, retry=True):
+        finished, _ = wait(list(in_flight), return_when=return_when)
+        for future in finished:
+            item = in_flight.pop(future)
+            error = future.exception()
+            if isinstance(error, BrokenProcessPool):
+                if retry:
+                    broken.append(item)
+                    continue
+                error = "The worker processing this image exited unexpectedly"
+            if error is None:
+                yield report(item, result=future.result())
+            else:
+                yield report(item, str(error))
+
+    def start(item, alone=False):
+        try:
+            future = queue.submit_image(storage.path(item[2]))
+        except QueueUnavailable as e:
+            yield report(item, str(e))
+            return
+        in_flight[future] = item
+        if alone:
+            # Nothing else in flight: a broken pool now comes from this image
+            yield from drain(ALL_COMPLETED, retry=False)
+        elif len(in_flight) >= window:
+            yield from drain(FIRST_COMPLETED)
+
+    def retry_broken():
+        while broken:
+            while in_flight:
+                yield from drain(ALL_COMPLETED)
+            yield from start(broken.pop(0), alone=True)
+
+    images = UploadImages(files, max_files, max_member_size)
+    for index, (name, buffer, error) in enumerate(images):
+        if error is not None:
+            failed_count += 1
+            yield line({"index": index, "name": name, "status": "failed", "error": error})
+            continue
+        file_path = save_upload_buffer(storage, f"{prefix}/{os.path.basename(name)}", buffer)
+        yield from start((index, name, file_path))
+        yield from retry_broken()
+
+    while in_flight:
+        yield from drain(FIRST_COMPLETED)
+        yield from retry_broken()
+
+    yield line({"summary": True, "count": done_count + failed_count, "done": done_count, "failed": failed_count,
+                "truncated": images.truncated, "max_files": max_files})
@@ -0,0 +1,90 @@
+import cv2
+import numpy as np
+
+
+class ImageAnalysisContext:
+    """
+    Contexte d'analyse d'une image : niveaux de gris, carte des contours (Canny),
+    lignes de Hough et histogramme, calculés une seule fois puis partagés par
+    toutes les étapes du pipeline.
+    """
+
+    CANNY_LOW = 50
+    CANNY_HIGH = 150
+
+    # Paramètres HoughLinesP à pleine résolution, mis à l'échelle pour les niveaux de pyramide
+    HOUGH_THRESHOLD = 50
+    HOUGH_MIN_LINE_LENGTH = 50
+    HOUGH_MAX_LINE_GAP = 10
+
+    def __init__(self, image: np.ndarray, scale: float = 1.0):
+        self.image = image
+        # Échelle de cette image par rapport à l'image d'origine (1.0, 0.5, 0.25...)
+        self.scale = scale
+        self._levels = {}
+        self._gray = None
+        self._edges = None
+        self._lines = None
+        self._lines_computed = False
+        self._hist = None
+
+    @property
+    def gray(self) -> np.ndarray:
+        if self._gray is None:
+            image = self.image
+            self._gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        return self._gray
+
+    @property
+    def edges(self) -> np.ndarray:
+        if self._edges is None:
+            self._edges = cv2.Canny(self.gray, self.CANNY_LOW, self.CANNY_HIGH)
+        return self._edges
+
+    @property
+    def lines(self):
+        # HoughLinesP peut renvoyer None : on mémorise aussi ce cas
+        if not self._lines_computed:
+            self._lines = cv2.HoughLinesP(self.edges, 1, np.pi/180,
+                                          threshold=max(1, round(self.HOUGH_THRESHOLD * self.scale)),
+                                          minLineLength=self.HOUGH_MIN_LINE_LENGTH * self.scale,
+                                          maxLineGap=max(1.0, self.HOUGH_MAX_LINE_GAP * self.scale))
+            self._lines_computed = True
+        return self._lines
+
+    @property
+    def hist(self) -> np.ndarray:
+        if self._hist is None:
+            self._hist = cv2.calcHist([self.gray], [0], None, [256], [0, 256])
+        return self._hist
+
+    def downscaled(self, levels: int) -> "ImageAnalysisContext":
+        """
+        Contexte du niveau `levels` de la pyramide gaussienne (chaque niveau divise
+        la taille par deux), construit à partir des niveaux de gris et mémorisé
+        """
+        if levels <= 0:
+            return self
+        if levels not in self._levels:
+            parent = self.downscaled(levels - 1)
+            self._levels[levels] = ImageAnalysisContext(cv2.pyrDown(parent.gray), scale=parent.scale / 2)
+        return self._levels[levels]
+
+    def crop(self, x0: int, y0: int, x1: int, y1: int) -> "ImageAnalysisContext":
+        """
+        Contexte d'une région (vues sans copie) ; les niveaux de gris déjà
+        calculés sont réutilisés, contours et lignes sont recalculés sur la région
+        """
+        cropped = ImageAnalysisContext(self.image[y0:y1, x0:x1], scale=self.scale)
+        if self._gray is not None:
+            cropped._gray = self._gray[y0:y1, x0:x1]
+        return cropped
+    
+    @classmethod
+    def ensure(cls, image: np.ndarray, context: "ImageAnalysisContext" = None) -> "ImageAnalysisContext":
+        """
+        Renvoie le contexte fourni s'il correspond à l'image, sinon en crée un nouveau
+        """
+        if context is not None and context.image is image:
+            return context
+        return cls(image)
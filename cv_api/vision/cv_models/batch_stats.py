@@ -0,0 +1,104 @@
+import numpy as np
+from scipy import signal
+from scipy.ndimage import gaussian_filter1d
+from typing import Dict, List, Sequence, Union
+
+# Ordre des types dans la sortie, identique à extract_points_with_stats
+STAT_POINT_TYPES = ("maximum", "minimum", "inflection")
+_MAXIMUM, _MINIMUM, _INFLECTION = range(len(STAT_POINT_TYPES))
+
+
+def _group_rows(data: Union[np.ndarray, Sequence[Sequence[float]]]) -> Dict[int, tuple]:
+    """
+    Regroupe les séries par longueur : chaque groupe est empilé en un tableau 2-D
+    (séries × échantillons) pour être traité en une seule passe vectorisée.
+    """
+    if not isinstance(data, np.ndarray) and len(data) and np.ndim(data[0]) == 0:
+        # Une seule série passée comme liste de nombres
+        data = np.asarray(data)
+    if isinstance(data, np.ndarray):
+        if data.ndim > 2:
+            raise ValueError(f"Séries attendues en 1-D ou 2-D, tableau à {data.ndim} dimensions reçu")
+        # Une seule série 1-D : un bloc d'une ligne
+        block = data.reshape(1, -1) if data.ndim == 1 else data
+        return {block.shape[1]: (np.arange(block.shape[0]), block)}
+
+    rows = [np.asarray(row) for row in data]
+    for row in rows:
+        if row.ndim != 1:
+            raise ValueError(f"Séries attendues en 1-D, série à {row.ndim} dimensions reçue")
+    by_length: Dict[int, List[int]] = {}
+    for i, row in enumerate(rows):
+        by_length.setdefault(len(row), []).append(i)
+
+    groups = {}
+    for length, indices in by_length.items():
+        groups[length] = (np.asarray(indices), np.stack([rows[i] for i in indices]))
+    return groups
+
+
+def extract_stat_points_batch(data, targets: List[str], min_prominence: float,
+                              min_distance: int) -> Dict[str, np.ndarray]:
+    """
+    Extraction statistique vectorisée sur plusieurs séries.
+
+    Le lissage gaussien, les dérivées et la détection des changements de signe
+    sont calculés sur toutes les séries d'un même groupe de longueur à la fois ;
+    seul find_peaks est appelé série par série.
+
+    Renvoie un dictionnaire colonnaire de tableaux de même longueur :
+    "series" (indice de la série), "x" (indice de l'échantillon), "y" (valeur
+    lissée) et "type" (libellé du point).
+    """
+    want_extrema = "maxima" in targets or "minima" in targets or "peaks" in targets or "valleys" in targets
+    want_inflections = "inflection_points" in targets
+
+    series_parts, x_parts, y_parts, kind_parts = [], [], [], []
+
+    def add(series, x, y, kind):
+        series_parts.append(np.asarray(series, dtype=np.int64))
+        x_parts.append(np.asarray(x, dtype=np.int64))
+        y_parts.append(np.asarray(y, dtype=np.float64))
+        kind_parts.append(np.full(len(x), kind, dtype=np.uint8))
+
+    for length, (row_ids, block) in _group_rows(data).items():
+        # np.gradient exige au moins deux échantillons
+        if length < 2:
+            continue
+
+        # Lissage et dérivées sur tout le bloc (axe des échantillons)
+        smoothed = gaussian_filter1d(block, sigma=2, axis=1)
+
+        if want_extrema:
+            for row, series_id in enumerate(row_ids):
+                peaks, _ = signal.find_peaks(smoothed[row], prominence=min_prominence, distance=min_distance)
+                valleys, _ = signal.find_peaks(-smoothed[row], prominence=min_prominence, distance=min_distance)
+                add(np.full(len(peaks), series_id), peaks, smoothed[row, peaks], _MAXIMUM)
+                add(np.full(len(valleys), series_id), valleys, smoothed[row, valleys], _MINIMUM)
+
+        if want_inflections:
+            second_derivative = np.gradient(np.gradient(smoothed, axis=1), axis=1)
+            rows, idx = np.nonzero(np.diff(np.sign(second_derivative), axis=1))
+            add(row_ids[rows], idx, smoothed[rows, idx], _INFLECTION)
+
+    if not series_parts:
+        return {
+            "series": np.empty(0, dtype=np.int64),
+            "x": np.empty(0, dtype=np.int64),
+            "y": np.empty(0, dtype=np.float64),
+            "type": np.empty(0, dtype="<U10"),
+        }
+
+    series = np.concatenate(series_parts)
+    x = np.concatenate(x_parts)
+    y = np.concatenate(y_parts)
+    kind = np.concatenate(kind_parts)
+
+    # Tri stable par série puis par type : même ordre que l'appel série par série
+    order = np.lexsort((kind, series))
+    return {
+        "series": series[order],
+        "x": x[order],
+        "y": y[order],
+        "type": np.asarray(STAT_POINT_TYPES)[kind[order]],
+    }
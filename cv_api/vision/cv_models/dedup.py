@@ -0,0 +1,61 @@
+import numpy as np
+
+
+def suppress_duplicates(xs, ys, min_distance: float, radius_2d: bool = False) -> np.ndarray:
+    """
+    Suppression des doublons (points proches) par grille spatiale.
+
+    Même sémantique que la comparaison deux à deux de filter_points : les
+    points sont parcourus dans l'ordre d'entrée et un point est gardé s'il est
+    à une distance >= min_distance de tous les points déjà gardés. La distance
+    est |dx| par défaut, ou la distance euclidienne si radius_2d est vrai.
+
+    La grille a un pas de min_distance : un point ne peut entrer en conflit
+    qu'avec les cellules voisines, d'où un coût linéaire au lieu de quadratique.
+    Renvoie les indices des points gardés, dans l'ordre d'entrée.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    n = len(xs)
+    if n == 0 or min_distance <= 0:
+        return np.arange(n)
+
+    cells_x = np.floor_divide(xs, min_distance).astype(np.int64).tolist()
+    xs_list = xs.tolist()
+    kept = []
+
+    if not radius_2d:
+        # Deux points gardés sont à >= min_distance : au plus un point par cellule
+        grid = {}
+        for i, (x, cx) in enumerate(zip(xs_list, cells_x)):
+            duplicate = False
+            for c in (cx - 1, cx, cx + 1):
+                other = grid.get(c)
+                if other is not None and abs(x - other) < min_distance:
+                    duplicate = True
+                    break
+            if not duplicate:
+                grid[cx] = x
+                kept.append(i)
+        return np.asarray(kept, dtype=np.int64)
+
+    ys = np.asarray(ys, dtype=np.float64)
+    cells_y = np.floor_divide(ys, min_distance).astype(np.int64).tolist()
+    ys_list = ys.tolist()
+    limit = min_distance * min_distance
+    grid = {}
+    for i, (x, y, cx, cy) in enumerate(zip(xs_list, ys_list, cells_x, cells_y)):
+        duplicate = False
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for ox, oy in grid.get((gx, gy), ()):
+                    if (x - ox) ** 2 + (y - oy) ** 2 < limit:
+                        duplicate = True
+                        break
+                if duplicate:
+                    break
+            if duplicate:
+                break
+        if not duplicate:
+            grid.setdefault((cx, cy), []).append((x, y))
+            kept.append(i)
+    return np.asarray(kept, dtype=np.int64)
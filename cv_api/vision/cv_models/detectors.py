@@ -0,0 +1,70 @@
+import cv2
+import numpy as np
+
+from .analysis_context import ImageAnalysisContext
+from .points import PointArray
+
+
+def detect_corners(context: ImageAnalysisContext, max_corners: int = 100) -> PointArray:
+    """
+    Coins de Shi-Tomasi (goodFeaturesToTrack), triés par réponse décroissante
+    """
+    corners = cv2.goodFeaturesToTrack(context.gray, maxCorners=max_corners, qualityLevel=0.01, minDistance=10)
+    if corners is None:
+        return PointArray()
+    corners = corners.reshape(-1, 2)
+    return PointArray.of_kind(corners[:, 0], corners[:, 1].astype(np.int32), "corner")
+
+
+def detect_contour_features(context: ImageAnalysisContext) -> PointArray:
+    """
+    Sommets des contours externes (carte Canny du contexte) approximés par approxPolyDP
+    """
+    contours, _ = cv2.findContours(context.edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    approximations = [cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
+                      for contour in contours]
+    if not approximations:
+        return PointArray()
+    vertices = np.concatenate(approximations).reshape(-1, 2)
+    return PointArray.of_kind(vertices[:, 0], vertices[:, 1], "contour_feature")
+
+
+def detect_blobs(context: ImageAnalysisContext) -> PointArray:
+    """
+    Centres des blobs (SimpleBlobDetector, paramètres par défaut)
+    """
+    keypoints = cv2.SimpleBlobDetector_create().detect(context.gray)
+    return _keypoints_to_points(keypoints, "blob")
+
+
+def detect_keypoints(context: ImageAnalysisContext, max_keypoints: int = 500) -> PointArray:
+    """
+    Points clés ORB, triés par réponse décroissante
+    """
+    keypoints = cv2.ORB_create(nfeatures=max_keypoints).detect(context.gray, None)
+    keypoints = sorted(keypoints, key=lambda kp: -kp.response)
+    return _keypoints_to_points(keypoints, "keypoint")
+
+
+def _keypoints_to_points(keypoints, label: str) -> PointArray:
+    if not keypoints:
+        return PointArray()
+    coords = np.asarray([kp.pt for kp in keypoints], dtype=np.float32)
+    return PointArray.of_kind(coords[:, 0], coords[:, 1].astype(np.int32), label)
+
+
+# Détecteurs exposés par l'API (valeurs de InterestPointRequestSerializer.detection_type)
+DETECTION_TYPES = {
+    "corners": detect_corners,
+    "edges": detect_contour_features,
+    "blobs": detect_blobs,
+    "keypoints": detect_keypoints,
+}
+
+# Type de point produit par chaque détecteur
+DETECTOR_POINT_TYPES = {
+    "corners": "corner",
+    "edges": "contour_feature",
+    "blobs": "blob",
+    "keypoints": "keypoint",
+}
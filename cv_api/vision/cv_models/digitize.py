@@ -0,0 +1,164 @@
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from scipy import signal
+
+from .analysis_context import ImageAnalysisContext
+
+# Pixel « coloré » (courbe) : saturation et luminosité minimales (HSV OpenCV, 0-255) ;
+# axes, grilles, texte et fond, gris ou noirs, sont écartés
+MIN_SATURATION = 80
+MIN_VALUE = 60
+# Pixel sombre d'une courbe noire, utilisé quand aucune couleur n'est trouvée
+MAX_DARK_VALUE = 100
+# Ligne ou colonne sombre sur plus de cette fraction de la zone : grille ou axe, écartée
+MAX_LINE_FRACTION = 0.5
+# Écart maximal de teinte (0-179) entre un pixel et le centre de sa courbe
+HUE_TOLERANCE = 10
+# Fraction minimale des colonnes de la zone où la courbe est présente
+MIN_COVERAGE = 0.3
+# Indice des teintes n'appartenant à aucune courbe (table de correspondance en uint8)
+NO_CURVE = 255
+# Pixels échantillonnés pour la couleur d'une courbe
+COLOR_SAMPLES = 1000
+
+
+class DigitizedCurve:
+    """
+    Série numérisée d'une courbe : une valeur par colonne de pixels, entre
+    la première et la dernière colonne où la courbe est présente
+    """
+
+    __slots__ = ("color", "x_values", "y_values", "coverage")
+
+    def __init__(self, color: Optional[Tuple[int, int, int]], x_values: np.ndarray, y_values: np.ndarray,
+                 coverage: float):
+        # Couleur BGR médiane de la courbe (None pour une courbe sombre)
+        self.color = color
+        # Colonnes de l'image d'origine
+        self.x_values = x_values
+        # Hauteur en pixels au-dessus du bas de la zone de tracé (axe des x)
+        self.y_values = y_values
+        # Fraction des colonnes effectivement couvertes (le reste est interpolé)
+        self.coverage = coverage
+
+    def to_extracted_data(self) -> Dict:
+        """Données au format attendu par process_image (x_values, y_values)"""
+        return {"x_values": self.x_values, "y_values": self.y_values}
+
+    def to_dict(self) -> Dict:
+        return {
+            "color": "#{2:02x}{1:02x}{0:02x}".format(*self.color) if self.color is not None else None,
+            "x_range": [int(self.x_values[0]), int(self.x_values[-1])],
+            "samples": len(self.y_values),
+            "coverage": round(self.coverage, 3),
+        }
+
+
+def _hue_clusters(hist: np.ndarray, min_pixels: int, max_curves: int) -> np.ndarray:
+    """
+    Centres de teinte des courbes : pics de l'histogramme circulaire des
+    teintes, ordonnés par nombre de pixels décroissant
+    """
+    # Lissage et recherche de pics sur l'histogramme prolongé (la teinte est circulaire)
+    padded = np.concatenate([hist[-HUE_TOLERANCE:], hist, hist[:HUE_TOLERANCE]])
+    smoothed = np.convolve(padded, np.ones(5) / 5, mode="same")
+    peaks, _ = signal.find_peaks(smoothed, distance=HUE_TOLERANCE)
+    peaks = peaks[(peaks >= HUE_TOLERANCE) & (peaks < 180 + HUE_TOLERANCE)] - HUE_TOLERANCE
+
+    # Pixels attribués à chaque pic, sur ±HUE_TOLERANCE
+    offsets = np.arange(-HUE_TOLERANCE, HUE_TOLERANCE + 1)
+    counts = hist[(peaks[:, None] + offsets) % 180].sum(axis=1)
+    order = np.argsort(-counts, kind="stable")
+    return peaks[order][counts[order] >= min_pixels][:max_curves]
+
+
+def _hue_lut(centers: np.ndarray) -> np.ndarray:
+    """Table teinte -> indice de la courbe la plus proche, NO_CURVE au-delà de HUE_TOLERANCE"""
+    hues = np.arange(180)
+    distance = np.abs(hues[:, None] - centers[None, :])
+    distance = np.minimum(distance, 180 - distance)
+    lut = np.argmin(distance, axis=1).astype(np.uint8)
+    lut[distance.min(axis=1) > HUE_TOLERANCE] = NO_CURVE
+    return lut
+
+
+def _dark_mask(region: np.ndarray) -> np.ndarray:
+    """Pixels sombres hors grilles et axes (lignes/colonnes presque entièrement sombres)"""
+    gray = region if region.ndim == 2 else cv2.cvtColor(region, cv2.COLOR_BGR2GRAY)
+    mask = gray <= MAX_DARK_VALUE
+    height, width = mask.shape
+    mask[mask.sum(axis=1) > MAX_LINE_FRACTION * width, :] = False
+    mask[:, mask.sum(axis=0) > MAX_LINE_FRACTION * height] = False
+    return mask
+
+
+def digitize_curves(context: ImageAnalysisContext, plot_area: Tuple[int, int, int, int] = None,
+                    max_curves: int = 3) -> List[DigitizedCurve]:
+    """
+    Numérise les courbes d'un graphique 2D dans `plot_area` (x0, y0, x1, y1,
+    voir roi.locate_plot_area ; image entière par défaut).
+
+    Les pixels colorés sont regroupés par teinte (une courbe par pic de
+    l'histogramme des teintes, au plus `max_curves`) ; sans couleur, les
+    pixels sombres hors grilles forment une seule courbe. La position de
+    chaque courbe dans une colonne est la ligne moyenne de ses pixels,
+    calculée pour toutes les courbes en un seul passage (np.bincount sur
+    courbe × colonne) : le coût est linéaire en largeur × hauteur. Les
+    colonnes sans pixel, entre deux colonnes couvertes, sont interpolées.
+
+    Les courbes sont triées par nombre de pixels décroissant ; celles qui
+    couvrent moins de MIN_COVERAGE des colonnes sont écartées.
+    """
+    image = context.image
+    height, width = image.shape[:2]
+    x0, y0, x1, y1 = plot_area if plot_area is not None else (0, 0, width, height)
+    region = image[y0:y1, x0:x1]
+    region_height, region_width = region.shape[:2]
+    if region.size == 0:
+        return []
+    min_pixels = int(MIN_COVERAGE * region_width)
+
+    # Histogramme des teintes et masque dans OpenCV ; seuls les pixels colorés
+    # (ou sombres) sont ensuite indexés, par position à plat dans la région
+    labels = None
+    if region.ndim == 3:
+        hsv = cv2.cvtColor(region, cv2.COLOR_BGR2HSV)
+        colored = cv2.inRange(hsv, (0, MIN_SATURATION, MIN_VALUE), (255, 255, 255))
+        hist = cv2.calcHist([hsv], [0], colored, [180], [0, 180]).ravel()
+        centers = _hue_clusters(hist, min_pixels, max_curves)
+        if len(centers):
+            indices = np.flatnonzero(colored.ravel() != 0)
+            labels = _hue_lut(centers)[cv2.extractChannel(hsv, 0).ravel()[indices]]
+            keep = labels != NO_CURVE
+            indices, labels = indices[keep], labels[keep].astype(np.intp)
+    colored_curves = labels is not None
+    if not colored_curves:
+        indices = np.flatnonzero(_dark_mask(region))
+        labels = np.zeros(len(indices), dtype=np.intp)
+    rows, cols = np.divmod(indices, region_width)
+    n_curves = int(labels.max()) + 1 if len(labels) else 0
+
+    # Nombre de pixels et somme des lignes par (courbe, colonne), en un passage
+    keys = labels * region_width + cols
+    counts = np.bincount(keys, minlength=n_curves * region_width).reshape(n_curves, region_width)
+    sums = np.bincount(keys, weights=rows, minlength=n_curves * region_width).reshape(n_curves, region_width)
+
+    curves = []
+    for k in range(n_curves):
+        covered = np.flatnonzero(counts[k])
+        if len(covered) < MIN_COVERAGE * region_width:
+            continue
+        columns = np.arange(covered[0], covered[-1] + 1)
+        mean_rows = np.interp(columns, covered, sums[k, covered] / counts[k, covered])
+
+        color = None
+        if colored_curves:
+            # Couleur médiane sur un échantillon d'au plus ~COLOR_SAMPLES pixels
+            pixels = np.flatnonzero(labels == k)
+            pixels = pixels[::max(1, len(pixels) // COLOR_SAMPLES)]
+            color = tuple(int(c) for c in np.median(region[rows[pixels], cols[pixels]], axis=0))
+        curves.append(DigitizedCurve(color, columns + x0, (region_height - 1) - mean_rows,
+                                     len(covered) / region_width))
+    return curves
@@ -4,39 +4,122 @@ from scipy import signal
 from scipy.ndimage import gaussian_filter1d
 import json
 import os
+import time
 from typing import List, Dict, Tuple
+from .analysis_context import ImageAnalysisContext
+from .batch_stats import extract_stat_points_batch
+from .dedup import suppress_duplicates
+from .result_cache import ResultCache, make_cache_key
+from .results import InterestPointResult
+from .points import PointArray
+from .profiling import PipelineProfiler
+from .tiling import TILED_DETECTORS, extract_points_tiled
+from .detectors import DETECTION_TYPES, DETECTOR_POINT_TYPES
+from .digitize import digitize_curves
+from .roi import locate_plot_area
 
 class InterestPointExtractor:
-    def __init__(self, min_prominence: float = 0.1, min_distance: int = 5):
+    # Types de points conservés par filter_points selon le type de visuel
+    FILTER_KEEP_TYPES = {
+        "graph2D": ["maximum", "minimum", "inflection"],
+        "histogram": ["maximum", "minimum"],
+    }
+    
+    def __init__(self, min_prominence: float = 0.1, min_distance: int = 5, dedup_radius_2d: bool = False,
+                 cache: ResultCache = None, classify_max_side: int = None, classify_ambiguity: float = 0.5,
+                 tile_size: int = None, tile_overlap: int = 32, tile_workers: int = None,
+                 crop_plot_area: bool = False, digitize: bool = False, max_curves: int = 3,
+                 inflection_tolerance: float = 0.1):
         self.min_prominence = min_prominence
         self.min_distance = min_distance
+        # Si vrai, les doublons sont jugés sur la distance euclidienne (x, y) et non sur x seul
+        self.dedup_radius_2d = dedup_radius_2d
+        # Cache optionnel des résultats de process_image (clé : pixels + paramètres + données)
+        self.cache = cache
+        # Classification sur pyramide : côté maximal de l'image classée (None = pleine résolution)
+        self.classify_max_side = classify_max_side
+        # Marge relative autour des seuils en deçà de laquelle le résultat réduit est ambigu
+        self.classify_ambiguity = classify_ambiguity
+        # Extraction CV par tuiles en parallèle au-delà de tile_size pixels de côté (None = désactivée).
+        # Ne sert qu'à detect() (API) : le plan de process_image ne garde aucun détecteur
+        # découpable, et le découpage ne change pas les points (hors cache_params)
+        self.tile_size = tile_size
+        self.tile_overlap = tile_overlap
+        self.tile_workers = tile_workers
+        # Extraction CV limitée à la zone de tracé délimitée par les axes (voir roi.locate_plot_area) :
+        # valeur par défaut de plot_area_only pour l'API (detect). process_image n'en dépend
+        # pas : la numérisation se fait toujours dans la zone de tracé (hors cache_params)
+        self.crop_plot_area = crop_plot_area
+        # Sans y_values fournies, numérisation des courbes des graphiques 2D (voir digitize.digitize_curves)
+        self.digitize = digitize
+        self.max_curves = max_curves
+        # Séries numérisées : changements de signe de la dérivée seconde ignorés
+        # tant que |d2| reste sous cette fraction de son maximum (bruit de quantification)
+        self.inflection_tolerance = inflection_tolerance
     
-    def identify_visual_type(self, image: np.ndarray) -> str:
+    def cache_params(self) -> Dict:
+        """
+        Paramètres de l'extracteur qui influencent le résultat (pour la clé de cache)
+        """
+        return {
+            "min_prominence": self.min_prominence,
+            "min_distance": self.min_distance,
+            "dedup_radius_2d": self.dedup_radius_2d,
+            "classify_max_side": self.classify_max_side,
+            "classify_ambiguity": self.classify_ambiguity,
+            "digitize": self.digitize,
+            "max_curves": self.max_curves,
+            "inflection_tolerance": self.inflection_tolerance,
+        }
+    
+    def identify_visual_type(self, image: np.ndarray, context: ImageAnalysisContext = None) -> str:
         """
         Identifie le type de visuel (graphique 2D, histogramme, etc.)
         """
         if image is None:
             return "unknown"
         
-        # Conversion en niveaux de gris
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        # Niveaux de gris, contours et lignes de Hough partagés via le contexte
+        context = ImageAnalysisContext.ensure(image, context)
         
-        # Détection des contours
-        edges = cv2.Canny(gray, 50, 150)
+        # Mode pyramide : classification sur une image réduite, pleine résolution si ambigu
+        if self.classify_max_side:
+            levels = 0
+            while max(context.gray.shape[:2]) / 2 ** levels > self.classify_max_side:
+                levels += 1
+            if levels > 0:
+                visual_type, ambiguous = self._classify(context.downscaled(levels))
+                if not ambiguous:
+                    return visual_type
         
-        # Détection des lignes avec HoughLinesP
-        lines = cv2.HoughLinesP(edges, 1, np.pi/180, threshold=50, minLineLength=50, maxLineGap=10)
+        return self._classify(context)[0]
+    
+    def _classify(self, context: ImageAnalysisContext) -> Tuple[str, bool]:
+        """
+        Classe le visuel d'un contexte (éventuellement réduit) et indique si le
+        résultat est trop proche des seuils pour être fiable à cette échelle
+        """
+        margin = 1 + self.classify_ambiguity
+        lines = context.lines
+        n_lines = 0 if lines is None else len(lines)
+        reduced = context.scale < 1
         
-        if lines is not None and len(lines) > 10:
+        if n_lines > 10:
             # Nombre significatif de lignes détectées → probablement un graphique
-            return "graph2D"
+            return "graph2D", reduced and n_lines <= 10 * margin
+        
+        line_ambiguous = reduced and n_lines > 10 / margin
+        
+        # Vérifier si c'est un histogramme
+        # Les effectifs de l'histogramme varient en scale², leur variance en scale⁴
+        hist = context.hist
+        threshold = 1000 * context.scale ** 4  # Seuil empirique
+        variance = np.var(hist)
+        hist_ambiguous = reduced and threshold / margin < variance <= threshold * margin
+        if variance > threshold:
+            return "histogram", line_ambiguous or hist_ambiguous
         else:
-            # Vérifier si c'est un histogramme
-            hist = cv2.calcHist([gray], [0], None, [256], [0, 256])
-            if np.var(hist) > 1000:  # Seuil empirique
-                return "histogram"
-            else:
-                return "unknown"
+            return "unknown", line_ambiguous or hist_ambiguous
     
     def define_targets(self, visual_type: str) -> List[str]:
         """
@@ -49,47 +132,92 @@ class InterestPointExtractor:
         else:
             return ["salient_points"]
     
-    def extract_points_with_cv(self, image: np.ndarray, targets: List[str]) -> List[Tuple[int, int]]:
+    def plan_detectors(self, targets: List[str], visual_type: str = None, detection_type: str = None) -> List[str]:
         """
-        Extrait les points d'intérêt avec les techniques de vision par ordinateur
+        Ensemble minimal de détecteurs à exécuter. Un detection_type explicite
+        (API) désigne un seul détecteur ; sinon les détecteurs découlent des
+        cibles, puis, si visual_type est donné, seuls ceux dont les points
+        survivent à filter_points pour ce type de visuel sont gardés.
         """
-        points = []
-        if image is None:
-            return points
-            
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        if detection_type is not None:
+            return [detection_type]
         
-        # Détection des coins avec Shi-Tomasi
+        plan = []
         if "sharp_changes" in targets or "salient_points" in targets:
-            corners = cv2.goodFeaturesToTrack(gray, maxCorners=100, qualityLevel=0.01, minDistance=10)
-            if corners is not None:
-                for corner in corners:
-                    x, y = corner.ravel()
-                    points.append((int(x), int(y), "corner"))
-        
-        # Détection des contours
-        edges = cv2.Canny(gray, 50, 150)
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
-        for contour in contours:
-            # Approximation du contour
-            epsilon = 0.02 * cv2.arcLength(contour, True)
-            approx = cv2.approxPolyDP(contour, epsilon, True)
-            
-            for point in approx:
-                x, y = point.ravel()
-                points.append((int(x), int(y), "contour_feature"))
+            plan.append("corners")
+        plan.append("edges")
         
-        return points
+        if visual_type is not None:
+            keep = self.FILTER_KEEP_TYPES.get(visual_type, [])
+            plan = [name for name in plan if DETECTOR_POINT_TYPES[name] in keep]
+        return plan
     
-    def extract_points_with_stats(self, data: np.ndarray, targets: List[str]) -> List[Tuple[int, int]]:
+    def extract_points_with_cv(self, image: np.ndarray, targets: List[str],
+                               context: ImageAnalysisContext = None, detectors: List[str] = None,
+                               timings: Dict[str, float] = None, roi: Tuple[int, int, int, int] = None) -> PointArray:
         """
-        Extrait les points d'intérêt avec des techniques statistiques
+        Extrait les points d'intérêt avec les techniques de vision par ordinateur.
+        `detectors` restreint les détecteurs exécutés (par défaut ceux des cibles) ;
+        la durée de chacun est ajoutée à `timings` s'il est fourni. Avec `roi`
+        (x0, y0, x1, y1), seule cette région est traitée et les coordonnées
+        sont ramenées à l'image entière.
         """
-        points = []
+        if image is None:
+            return PointArray()
+            
+        context = ImageAnalysisContext.ensure(image, context)
+        if roi is not None:
+            x0, y0, x1, y1 = roi
+            points = self.extract_points_with_cv(image[y0:y1, x0:x1], targets, context.crop(x0, y0, x1, y1),
+                                                 detectors=detectors, timings=timings)
+            return PointArray(points.x + x0, points.y + y0, points.kind)
+        gray = context.gray
+        if detectors is None:
+            detectors = self.plan_detectors(targets)
+        if timings is None:
+            timings = {}
+        parts = []
+        
+        # Grandes images : tuiles traitées en parallèle puis fusionnées
+        if self.tile_size and max(gray.shape[:2]) > self.tile_size:
+            tiled = [name for name in detectors if name in TILED_DETECTORS]
+            if tiled:
+                start = time.perf_counter()
+                parts.append(extract_points_tiled(gray, tiled, tile_size=self.tile_size,
+                                                  overlap=self.tile_overlap, workers=self.tile_workers))
+                timings["+".join(tiled)] = time.perf_counter() - start
+            detectors = [name for name in detectors if name not in TILED_DETECTORS]
+        
+        # Coins de Shi-Tomasi, contours (carte Canny partagée avec identify_visual_type)...
+        for name in detectors:
+            start = time.perf_counter()
+            parts.append(DETECTION_TYPES[name](context))
+            timings[name] = time.perf_counter() - start
+        
+        return PointArray.concat(parts)
+    
+    def detect(self, image: np.ndarray, detection_type: str, context: ImageAnalysisContext = None,
+               timings: Dict[str, float] = None, roi: Tuple[int, int, int, int] = None) -> PointArray:
+        """
+        Exécute un seul détecteur (corners, edges, blobs ou keypoints)
+        """
+        if detection_type not in DETECTION_TYPES:
+            raise ValueError(f"Type de détection inconnu : {detection_type}")
+        return self.extract_points_with_cv(image, [], context, timings=timings, roi=roi,
+                                           detectors=self.plan_detectors([], detection_type=detection_type))
+    
+    def extract_points_with_stats(self, data: np.ndarray, targets: List[str],
+                                  inflection_tolerance: float = 0.0) -> PointArray:
+        """
+        Extrait les points d'intérêt avec des techniques statistiques.
+        Avec inflection_tolerance > 0, seuls les échantillons où |d2| dépasse
+        cette fraction de max |d2| comptent pour les changements de signe ;
+        l'inflexion est placée entre les deux échantillons de signes opposés.
+        """
+        parts = []
         
         if data is None or len(data) == 0:
-            return points
+            return PointArray()
         
         # Conversion des données NumPy en liste Python
         if isinstance(data, np.ndarray):
@@ -109,160 +237,233 @@ class InterestPointExtractor:
             peak_indices, _ = signal.find_peaks(smoothed_data, prominence=self.min_prominence, distance=self.min_distance)
             valley_indices, _ = signal.find_peaks(-smoothed_data, prominence=self.min_prominence, distance=self.min_distance)
             
-            for idx in peak_indices:
-                # Conversion des types NumPy en types Python natifs
-                points.append((int(idx), float(smoothed_data[idx]), "maximum"))
-            
-            for idx in valley_indices:
-                # Conversion des types NumPy en types Python natifs
-                points.append((int(idx), float(smoothed_data[idx]), "minimum"))
+            # Valeurs lissées conservées en float64
+            parts.append(PointArray.of_kind(peak_indices, smoothed_data[peak_indices].astype(np.float64), "maximum"))
+            parts.append(PointArray.of_kind(valley_indices, smoothed_data[valley_indices].astype(np.float64), "minimum"))
         
         # Détection des points d'inflexion
         if "inflection_points" in targets:
             # Les points d'inflexion sont où la dérivée seconde change de signe
-            sign_changes = np.where(np.diff(np.sign(second_derivative)))[0]
-            for idx in sign_changes:
-                # Conversion des types NumPy en types Python natifs
-                points.append((int(idx), float(smoothed_data[idx]), "inflection"))
+            if inflection_tolerance > 0:
+                magnitude = np.abs(second_derivative)
+                strong = np.flatnonzero(magnitude > inflection_tolerance * magnitude.max())
+                change = np.flatnonzero(np.diff(np.sign(second_derivative[strong])))
+                sign_changes = (strong[change] + strong[change + 1]) // 2
+            else:
+                sign_changes = np.where(np.diff(np.sign(second_derivative)))[0]
+            parts.append(PointArray.of_kind(sign_changes, smoothed_data[sign_changes].astype(np.float64), "inflection"))
         
-        return points
+        return PointArray.concat(parts)
+    
+    def extract_points_with_stats_batch(self, data, targets: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Extrait les points d'intérêt statistiques de plusieurs séries à la fois.
+        `data` est un tableau 2-D (séries × échantillons) ou une liste de séries
+        de longueurs différentes ; la sortie est colonnaire (voir batch_stats).
+        """
+        return extract_stat_points_batch(data, targets, self.min_prominence, self.min_distance)
     
-    def filter_points(self, points: List[Tuple], visual_type: str) -> List[Tuple]:
+    def filter_points(self, points: PointArray, visual_type: str) -> PointArray:
         """
         Filtre les points d'intérêt pour éliminer les faux positifs
         """
-        filtered_points = []
+        points = PointArray.from_tuples(points)
         
-        # Filtrage basé sur le type de visuel
-        if visual_type == "graph2D":
-            # Pour les graphiques 2D, on garde les points avec une certaine prominence
-            for point in points:
-                if point[2] in ["maximum", "minimum", "inflection"]:
-                    filtered_points.append(point)
-        elif visual_type == "histogram":
-            # Pour les histogrammes, on garde les pics et vallées significatifs
-            for point in points:
-                if point[2] in ["maximum", "minimum"]:
-                    filtered_points.append(point)
-        
-        # Suppression des doublons (points proches)
-        unique_points = []
-        for point in filtered_points:
-            is_duplicate = False
-            for unique_point in unique_points:
-                if abs(point[0] - unique_point[0]) < self.min_distance:
-                    is_duplicate = True
-                    break
-            if not is_duplicate:
-                unique_points.append(point)
-        
-        return unique_points
+        # Filtrage basé sur le type de visuel : extrema et inflexions pour les
+        # graphiques 2D, pics et vallées pour les histogrammes
+        keep = self.FILTER_KEEP_TYPES.get(visual_type)
+        filtered_points = points[points.mask_types(keep)] if keep else PointArray()
+        
+        # Suppression des doublons (points proches) par grille spatiale
+        keep = suppress_duplicates(filtered_points.x, filtered_points.y,
+                                   self.min_distance, radius_2d=self.dedup_radius_2d)
+        
+        return filtered_points[keep]
     
-    def associate_with_data(self, points: List[Tuple], extracted_data: Dict) -> List[Dict]:
+    def associate_with_data(self, points: PointArray, extracted_data: Dict,
+                            interpolate: bool = False, x_scale: float = 1.0) -> List[Dict]:
         """
-        Associe les points visuels aux valeurs concrètes extraites
+        Associe les points visuels aux valeurs concrètes extraites.
+        La position d'un point dans x_values est x * x_scale ; si interpolate
+        est vrai, les positions tombant entre deux échantillons sont
+        interpolées linéairement (x_values numériques), sinon tronquées.
         """
-        associated_points = []
-        
-        for point in points:
-            x_idx, y_val, point_type = point
+        points = PointArray.from_tuples(points)
+        x_idx = points.x
+        x_out = x_idx.tolist()
+        
+        # Indexation vectorisée dans x_values, avec masque des positions hors bornes
+        if extracted_data and "x_values" in extracted_data and len(points):
+            x_values = np.asarray(extracted_data["x_values"])
+            positions = x_idx * x_scale if x_scale != 1.0 else x_idx
             
-            # Trouver la valeur x correspondante
-            if extracted_data and "x_values" in extracted_data and x_idx < len(extracted_data["x_values"]):
-                x_val = extracted_data["x_values"][x_idx]
-                # Conversion des types NumPy en types Python natifs
-                if hasattr(x_val, 'item'):
-                    x_val = x_val.item()
+            if interpolate:
+                in_bounds = (positions >= 0) & (positions <= len(x_values) - 1)
+                mapped = np.interp(positions[in_bounds], np.arange(len(x_values)), x_values)
             else:
-                x_val = x_idx
-            
-            # Conversion des types NumPy en types Python natifs
-            if hasattr(y_val, 'item'):
-                y_val = y_val.item()
+                positions = np.floor(positions).astype(np.int64) if x_scale != 1.0 else positions
+                in_bounds = (positions >= 0) & (positions < len(x_values))
+                mapped = x_values[positions[in_bounds]]
             
-            associated_points.append({
-                "type": point_type,
-                "x_index": x_idx,
-                "x_value": x_val,
-                "y_value": y_val
-            })
-        
-        return associated_points
+            if in_bounds.all():
+                x_out = mapped.tolist()
+            elif in_bounds.any():
+                x_out = np.asarray(x_out, dtype=object)
+                x_out[in_bounds] = mapped.tolist()
+                x_out = x_out.tolist()
+        
+        return [
+            {"type": point_type, "x_index": x, "x_value": x_val, "y_value": y_val}
+            for x, x_val, y_val, point_type in zip(x_idx.tolist(), x_out, points.y.tolist(), points.labels().tolist())
+        ]
     
     def generate_structured_output(self, points: List[Dict]) -> str:
         """
         Génère un format JSON contenant les informations sur les points d'intérêt
         """
-        # Conversion des types NumPy en types Python natifs
-        serializable_points = []
-        for point in points:
-            serializable_point = {}
-            for key, value in point.items():
-                if hasattr(value, 'item'):
-                    serializable_point[key] = value.item()
-                else:
-                    serializable_point[key] = value
-            serializable_points.append(serializable_point)
-        
-        output = {
-            "interest_points": serializable_points,
-            "count": len(serializable_points),
-            "extraction_method": "combined_cv_statistical"
-        }
+        # Conversion des types NumPy en types Python natifs faite par l'encodeur
+        return InterestPointResult(points).to_json(indent=2)
+    
+    def process_image(self, image: np.ndarray, extracted_data: Dict = None, output: str = "json",
+                      profiler: PipelineProfiler = None):
+        """
+        Pipeline complet de traitement d'image pour l'extraction des points d'intérêt.
+        output="json" renvoie la chaîne JSON indentée, output="result" un
+        InterestPointResult dont la sérialisation est laissée à l'appelant.
+        Les mesures par étape sont ajoutées à `profiler` s'il est fourni.
+        """
+        if output not in ("json", "result"):
+            raise ValueError(f"Mode de sortie inconnu : {output}")
+        if profiler is None:
+            profiler = PipelineProfiler()
+        
+        result = self.analyze_image(image, extracted_data, profiler)
+        if output == "result":
+            return result
         
-        return json.dumps(output, indent=2)
+        # Étape 7: Génération de la sortie structurée
+        with profiler.stage("serialize"):
+            if result.error is not None:
+                return json.dumps(result.to_dict())
+            return self.generate_structured_output(result.points)
     
-    def process_image(self, image: np.ndarray, extracted_data: Dict = None) -> str:
+    def analyze_image(self, image: np.ndarray, extracted_data: Dict = None,
+                      profiler: PipelineProfiler = None) -> InterestPointResult:
         """
-        Pipeline complet de traitement d'image pour l'extraction des points d'intérêt
+        Étapes 2 à 6 du pipeline, sans sérialisation
         """
+        if profiler is None:
+            profiler = PipelineProfiler()
+        
         # Vérifier si l'image est valide
         if image is None:
-            return json.dumps({"error": "Image non valide ou impossible à charger"})
+            return InterestPointResult(error="Image non valide ou impossible à charger")
+        
+        # Résultat déjà calculé pour ces pixels et ces paramètres : aucun appel OpenCV
+        cache_key = None
+        if self.cache is not None:
+            with profiler.stage("cache_lookup") as stage:
+                cache_key = make_cache_key(image, self.cache_params(), extracted_data)
+                cached = self.cache.get(cache_key)
+                cached_result = InterestPointResult.from_json(cached) if cached is not None else None
+                stage.points = cached_result.count if cached_result is not None else None
+            if cached_result is not None:
+                return cached_result
+        
+        # Contexte partagé : niveaux de gris, contours, lignes et histogramme calculés une fois
+        context = ImageAnalysisContext(image)
         
         # Étape 2: Identification du type de visuel
-        visual_type = self.identify_visual_type(image)
-        
         # Étape 3: Définition des cibles
-        targets = self.define_targets(visual_type)
-        
-        # Étape 4: Extraction des points avec techniques combinées
-        cv_points = self.extract_points_with_cv(image, targets)
+        with profiler.stage("classify"):
+            visual_type = self.identify_visual_type(image, context)
+            targets = self.define_targets(visual_type)
+        
+        # Étape 4: Extraction des points avec techniques combinées, limitée aux
+        # détecteurs dont les points peuvent survivre au filtrage
+        detectors = self.plan_detectors(targets, visual_type)
+        timings = {}
+        with profiler.stage("cv_extract") as stage:
+            cv_points = self.extract_points_with_cv(image, targets, context, detectors=detectors,
+                                                    timings=timings)
+            stage.points = len(cv_points)
+        
+        # Sans données fournies, séries lues sur les pixels des courbes ; la
+        # première (la plus grande) remplace extracted_data, les autres suivent
+        # le même chemin et leurs points portent l'indice de leur courbe
+        curves = []
+        if self.digitize and visual_type == "graph2D" and not (extracted_data and "y_values" in extracted_data):
+            with profiler.stage("digitize") as stage:
+                curves = digitize_curves(context, locate_plot_area(context), max_curves=self.max_curves)
+                stage.points = sum(len(curve.y_values) for curve in curves)
+        datasets = [curve.to_extracted_data() for curve in curves] or [extracted_data]
         
         # Si des données numériques sont disponibles, extraction statistique
-        stat_points = []
-        if extracted_data and "y_values" in extracted_data:
-            y_data = extracted_data["y_values"]
-            # Conversion des types NumPy en types Python natifs
-            if hasattr(y_data, 'tolist'):
-                y_data = y_data.tolist()
-            stat_points = self.extract_points_with_stats(y_data, targets)
-        
-        # Combinaison des points
-        all_points = cv_points + stat_points
-        
-        # Étape 5: Filtrage des points
-        filtered_points = self.filter_points(all_points, visual_type)
+        stat_points = [[] for _ in datasets]
+        if datasets[0] and "y_values" in datasets[0]:
+            with profiler.stage("stats_extract") as stage:
+                for i, data in enumerate(datasets):
+                    y_data = data["y_values"]
+                    # Conversion des types NumPy en types Python natifs
+                    if hasattr(y_data, 'tolist'):
+                        y_data = y_data.tolist()
+                    # Les séries lues sur les pixels sont bruitées au pixel près
+                    stat_points[i] = self.extract_points_with_stats(
+                        y_data, targets, self.inflection_tolerance if curves else 0.0)
+                stage.points = sum(len(points) for points in stat_points)
+        
+        # Combinaison des points (les points CV avec la première série)
+        stat_points[0] = cv_points + stat_points[0]
+        
+        # Étape 5: Filtrage des points, série par série
+        with profiler.stage("filter") as stage:
+            filtered = [self.filter_points(points, visual_type) for points in stat_points]
+            stage.points = sum(len(points) for points in filtered)
         
         # Étape 6: Association avec les données extraites
-        if extracted_data:
-            associated_points = self.associate_with_data(filtered_points, extracted_data)
-        else:
-            # Conversion des points en format de dictionnaire si pas de données extraites
-            associated_points = []
-            for p in filtered_points:
-                x_val, y_val = p[0], p[1]
-                # Conversion des types NumPy en types Python natifs
-                if hasattr(x_val, 'item'):
-                    x_val = x_val.item()
-                if hasattr(y_val, 'item'):
-                    y_val = y_val.item()
-                associated_points.append({"x": x_val, "y": y_val, "type": p[2]})
+        with profiler.stage("associate") as stage:
+            if datasets[0]:
+                associated_points = []
+                for i, (points, data) in enumerate(zip(filtered, datasets)):
+                    associated = self.associate_with_data(points, data)
+                    if curves:
+                        for point in associated:
+                            point["curve"] = i
+                    associated_points.extend(associated)
+            else:
+                # Conversion des points en format de dictionnaire si pas de données extraites
+                associated_points = filtered[0].to_dicts()
+            stage.points = len(associated_points)
         
-        # Étape 7: Génération de la sortie structurée
-        json_output = self.generate_structured_output(associated_points)
+        result = InterestPointResult(associated_points, visual_type=visual_type, detector_timings=timings,
+                                     curves=[curve.to_dict() for curve in curves])
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, result.to_json())
         
-        return json_output
+        return result
+    
+    def warm_up(self):
+        """
+        Exécute chaque étape une fois sur une petite image synthétique (sans
+        passer par le cache) pour charger les modules et initialiser OpenCV
+        avant la première requête
+        """
+        image = np.full((120, 160, 3), 255, dtype=np.uint8)
+        cv2.line(image, (10, 110), (150, 110), (0, 0, 0), 2)
+        cv2.polylines(image, [np.array([[20, 90], [60, 30], [100, 70], [140, 20]], np.int32)],
+                      False, (0, 0, 255), 2)
+        context = ImageAnalysisContext(image)
+        self.identify_visual_type(image, context)
+        for detection_type in DETECTION_TYPES:
+            self.detect(image, detection_type, context)
+        if self.digitize:
+            digitize_curves(context, locate_plot_area(context), max_curves=self.max_curves)
+        
+        data = {"x_values": list(range(64)), "y_values": np.sin(np.linspace(0, 6, 64)).tolist()}
+        points = self.extract_points_with_stats(data["y_values"], self.define_targets("graph2D"))
+        points = self.filter_points(points, "graph2D")
+        self.generate_structured_output(self.associate_with_data(points, data))
 
 # Exemple d'utilisation
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+import numpy as np
+from typing import Dict, Iterable, List, Tuple
+
+# Codes uint8 des types de points (l'indice dans POINT_TYPES est le code)
+# (nouveaux types ajoutés en fin de tuple pour garder les codes existants)
+POINT_TYPES = ("corner", "contour_feature", "maximum", "minimum", "inflection", "blob", "keypoint")
+TYPE_CODES = {label: code for code, label in enumerate(POINT_TYPES)}
+_LABELS = np.asarray(POINT_TYPES, dtype=object)
+
+X_DTYPE = np.int32
+Y_DTYPE = np.float32
+KIND_DTYPE = np.uint8
+
+
+class PointArray:
+    """
+    Conteneur colonnaire de points d'intérêt : x (int32), y (float32 par
+    défaut) et code de type (uint8), à la place de listes de tuples
+    (x, y, "libellé").
+
+    Se comporte comme une séquence de tuples (x, y, libellé) pour le code
+    existant : len(), itération, indexation entière ; l'indexation par
+    tranche, masque ou tableau d'indices renvoie un PointArray.
+    """
+
+    __slots__ = ("x", "y", "kind")
+
+    def __init__(self, x=None, y=None, kind=None):
+        self.x = np.asarray(x if x is not None else [], dtype=X_DTYPE)
+        # y flottant garde sa précision (float64 pour les valeurs statistiques) ;
+        # les coordonnées entières (pixels) passent en Y_DTYPE
+        y = np.asarray(y) if y is not None else np.empty(0, dtype=Y_DTYPE)
+        y_dtype = np.result_type(y.dtype, Y_DTYPE) if y.dtype.kind == "f" else Y_DTYPE
+        self.y = y.astype(y_dtype, copy=False)
+        self.kind = np.asarray(kind if kind is not None else [], dtype=KIND_DTYPE)
+
+    @classmethod
+    def of_kind(cls, x, y, label: str) -> "PointArray":
+        """Points d'un même type"""
+        x = np.asarray(x)
+        return cls(x, y, np.full(len(x), TYPE_CODES[label], dtype=KIND_DTYPE))
+
+    @classmethod
+    def from_tuples(cls, points: Iterable[Tuple]) -> "PointArray":
+        if isinstance(points, PointArray):
+            return points
+        points = list(points)
+        if not points:
+            return cls()
+        xs, ys, labels = zip(*points)
+        return cls(xs, np.asarray(ys, dtype=np.float64), [TYPE_CODES[label] for label in labels])
+
+    @classmethod
+    def concat(cls, arrays: Iterable["PointArray"]) -> "PointArray":
+        arrays = [cls.from_tuples(a) for a in arrays]
+        if not arrays:
+            return cls()
+        return cls(np.concatenate([a.x for a in arrays]),
+                   np.concatenate([a.y for a in arrays]),
+                   np.concatenate([a.kind for a in arrays]))
+
+    def labels(self) -> np.ndarray:
+        return _LABELS[self.kind]
+
+    def mask_types(self, labels: Iterable[str]) -> np.ndarray:
+        """Masque booléen des points dont le type est dans `labels`"""
+        codes = [TYPE_CODES[label] for label in labels]
+        return np.isin(self.kind, codes)
+
+    def to_tuples(self) -> List[Tuple]:
+        return list(zip(self.x.tolist(), self.y.tolist(), self.labels().tolist()))
+
+    def to_dicts(self) -> List[Dict]:
+        """Format de sortie sans données extraites : {"x", "y", "type"}"""
+        return [{"x": x, "y": y, "type": t} for x, y, t in self.to_tuples()]
+
+    @property
+    def nbytes(self) -> int:
+        return self.x.nbytes + self.y.nbytes + self.kind.nbytes
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __iter__(self):
+        return iter(self.to_tuples())
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.x[index].item(), self.y[index].item(), POINT_TYPES[self.kind[index]]
+        return PointArray(self.x[index], self.y[index], self.kind[index])
+
+    def __add__(self, other) -> "PointArray":
+        return PointArray.concat([self, other])
+
+    def __radd__(self, other) -> "PointArray":
+        return PointArray.concat([other, self])
+
+    def __repr__(self) -> str:
+        return f"PointArray({len(self)} points)"
@@ -0,0 +1,127 @@
+import re
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows : pas de getrusage
+    resource = None
+
+# Étapes instrumentées du pipeline, dans l'ordre d'exécution
+PIPELINE_STAGES = ("decode", "cache_lookup", "classify", "cv_extract", "digitize", "stats_extract",
+                   "filter", "associate", "serialize")
+
+
+class StageRecord:
+    """Mesure d'une étape : durée (s), points produits et pic mémoire (octets)"""
+
+    __slots__ = ("name", "seconds", "points", "peak_bytes")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.points = None
+        self.peak_bytes = None
+
+    def to_dict(self) -> Dict:
+        data = {"stage": self.name, "seconds": round(self.seconds, 6)}
+        if self.points is not None:
+            data["points"] = self.points
+        if self.peak_bytes is not None:
+            data["peak_bytes"] = self.peak_bytes
+        return data
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Pic de mémoire résidente du processus, en octets : VmHWM sous Linux
+    (remis à zéro par reset_peak_rss), ru_maxrss (pic depuis le démarrage)
+    ailleurs, None si indisponible
+    """
+    try:
+        with open("/proc/self/status") as f:
+            match = re.search(r"^VmHWM:\s+(\d+) kB", f.read(), re.MULTILINE)
+        if match:
+            return int(match.group(1)) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en octets sous macOS, en kilo-octets ailleurs
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def reset_peak_rss() -> bool:
+    """Ramène VmHWM à la mémoire résidente courante (Linux) ; faux si non pris en charge"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class PipelineProfiler:
+    """
+    Instrumentation par étape d'un appel au pipeline :
+
+        with profiler.stage("filter") as stage:
+            points = ...
+            stage.points = len(points)
+
+    La durée est mesurée avec perf_counter. Avec track_memory, le pic
+    d'allocations Python/NumPy de l'étape est relevé via tracemalloc (démarré
+    au besoin et laissé actif, au prix d'un ralentissement global) ; ce pic
+    est commun au processus et inclut donc les requêtes concurrentes.
+
+    Avec track_rss, to_dict relève le pic de mémoire résidente du processus
+    (peak_rss_bytes), la mesure pertinente face au OOM killer. Ce pic est
+    celui du processus depuis son démarrage ; avec reset_rss, il est remis à
+    zéro à la création et devient celui de l'appel (rss_scope indique
+    lequel des deux est rapporté : "process" ou "call"). La remise à zéro vaut
+    pour tout le processus : elle est réservée aux processus qui ne traitent
+    qu'un appel à la fois (workers du pool), sans quoi elle fausserait la
+    mesure des requêtes concurrentes.
+    """
+
+    def __init__(self, track_memory: bool = False, track_rss: bool = False, reset_rss: bool = False):
+        self.track_memory = track_memory
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.track_rss = track_rss
+        # "call" seulement si VmHWM a bien été remis à zéro (Linux)
+        self.rss_scope = "call" if track_rss and reset_rss and reset_peak_rss() else "process"
+        self.stages: List[StageRecord] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        record = StageRecord(name)
+        if self.track_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            if self.track_memory:
+                record.peak_bytes = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+            self.stages.append(record)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(record.seconds for record in self.stages)
+
+    def to_dict(self) -> Dict:
+        data = {
+            "stages": [record.to_dict() for record in self.stages],
+            "total_seconds": round(self.total_seconds, 6),
+        }
+        if self.track_rss:
+            data["peak_rss_bytes"] = peak_rss_bytes()
+            data["rss_scope"] = self.rss_scope
+        return data
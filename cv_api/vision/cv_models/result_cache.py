@@ -0,0 +1,205 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import numpy as np
+
+# Après dépassement de disk_max_bytes, le disque est ramené à cette fraction de la
+# borne : l'éviction (qui parcourt le répertoire) n'a pas lieu à chaque écriture
+DISK_LOW_WATER = 0.9
+# Écritures entre deux recomptages du répertoire : les autres processus (workers
+# du pool) écrivent dans le même répertoire sans mettre à jour _disk_bytes
+DISK_RECOUNT_EVERY = 64
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value):
+    # Conversion des types NumPy pour la sérialisation de la clé
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Type non sérialisable : {type(value)}")
+
+
+def image_digest(image: np.ndarray) -> str:
+    """
+    Empreinte rapide des pixels décodés (blake2b sur le tampon brut, forme et type)
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(str((image.shape, image.dtype.str)).encode())
+    h.update(memoryview(np.ascontiguousarray(image)).cast("B"))
+    return h.hexdigest()
+
+
+def make_cache_key(image: np.ndarray, params: Dict, extracted_data: Optional[Dict] = None) -> str:
+    """
+    Clé de cache : empreinte des pixels + paramètres de l'extracteur + données extraites
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(image_digest(image).encode())
+    h.update(json.dumps(params, sort_keys=True, default=_json_default).encode())
+    h.update(json.dumps(extracted_data, sort_keys=True, default=_json_default).encode())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    Cache des sorties JSON de process_image, adressé par contenu.
+
+    Deux niveaux : un LRU en mémoire (memory_items entrées) et, si disk_dir est
+    fourni, un répertoire sur disque borné à disk_max_bytes (les fichiers les
+    moins récemment utilisés sont évincés en premier, jusqu'à DISK_LOW_WATER
+    de la borne). Le répertoire peut être partagé entre processus : la taille
+    occupée est recomptée toutes les DISK_RECOUNT_EVERY écritures.
+    """
+
+    def __init__(self, memory_items: int = 256, disk_dir: str = None, disk_max_bytes: int = 256 * 1024 * 1024):
+        self.memory_items = memory_items
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits_memory = 0
+        self.hits_disk = 0
+        self.misses = 0
+        self._disk_bytes = 0
+        self._disk_writes = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _disk_entries(self):
+        """(chemin, taille, mtime) des entrées du cache disque"""
+        entries = []
+        for entry in os.scandir(self.disk_dir):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                # Évincé entre-temps par un autre processus
+                continue
+            entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits_memory += 1
+                return value
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    value = f.read()
+                os.utime(path)
+            except OSError:
+                value = None
+            if value is not None:
+                with self._lock:
+                    self.hits_disk += 1
+                    self._remember(key, value)
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._remember(key, value)
+
+        if self.disk_dir:
+            path = self._disk_path(key)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(value)
+                previous = os.path.getsize(path) if os.path.exists(path) else 0
+                os.replace(tmp_path, path)
+            except OSError:
+                # Disque plein, droits… : le résultat est déjà calculé, il reste
+                # servi par le niveau mémoire
+                logger.warning("Écriture du cache disque impossible : %s", path, exc_info=True)
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                return
+            with self._lock:
+                self._disk_bytes += len(value.encode("utf-8")) - previous
+                self._disk_writes += 1
+                recount = self._disk_writes >= DISK_RECOUNT_EVERY
+                if recount:
+                    self._disk_writes = 0
+            if recount:
+                disk_bytes = sum(size for _, size, _ in self._disk_entries())
+                with self._lock:
+                    self._disk_bytes = disk_bytes
+            if self._disk_bytes > self.disk_max_bytes:
+                self._evict_disk()
+
+    def _remember(self, key: str, value: str) -> None:
+        # Appelé avec self._lock
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        """
+        Évince les fichiers les moins récemment utilisés jusqu'à repasser sous
+        DISK_LOW_WATER × disk_max_bytes
+        """
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        target = int(self.disk_max_bytes * DISK_LOW_WATER)
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Déjà évincé par un autre processus
+                pass
+            except OSError:
+                continue
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
+            self._disk_writes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits_memory": self.hits_memory,
+                "hits_disk": self.hits_disk,
+                "misses": self.misses,
+                "memory_items": len(self._memory),
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def clear(self) -> None:
+        """Vide les deux niveaux (le répertoire disque est partagé entre processus)"""
+        with self._lock:
+            self._memory.clear()
+        if self.disk_dir:
+            for path, _, _ in self._disk_entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        with self._lock:
+            self._disk_bytes = 0
+            self._disk_writes = 0
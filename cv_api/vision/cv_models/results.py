@@ -0,0 +1,132 @@
+import json
+from typing import Dict, List
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # encodeur optionnel, json standard sinon
+    orjson = None
+
+EXTRACTION_METHOD = "combined_cv_statistical"
+
+# Champs des points exprimés en pixels de l'image analysée (voir InterestPointResult.rescaled) ;
+# x_value et y_value ne sont des pixels que pour les séries lues sur les courbes numérisées
+_PIXEL_KEYS = ("x", "y")
+_DIGITIZED_KEYS = ("x", "y", "x_value", "y_value")
+
+# Tableau structuré NumPy des points (voir InterestPointResult.to_array)
+POINT_DTYPE = np.dtype([("type", "U16"), ("x", np.float64), ("y", np.float64)])
+
+
+def _json_default(value):
+    # Conversion des types NumPy en types Python natifs
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Type non sérialisable : {type(value)}")
+
+
+def encode_json(data, indent: int = None) -> str:
+    """
+    Sérialisation JSON : compacte (orjson si disponible) ou indentée
+    """
+    if indent is None:
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+        return json.dumps(data, separators=(",", ":"), default=_json_default)
+    return json.dumps(data, indent=indent, default=_json_default)
+
+
+class InterestPointResult:
+    """
+    Résultat structuré de process_image : la sérialisation est une étape
+    explicite (to_dict, to_json, to_array) laissée à l'appelant.
+    """
+
+    def __init__(self, points: List[Dict] = None, visual_type: str = None, error: str = None,
+                 extraction_method: str = EXTRACTION_METHOD, detector_timings: Dict[str, float] = None,
+                 curves: List[Dict] = None, decode_factor: float = 1):
+        self.points = points if points is not None else []
+        self.visual_type = visual_type
+        self.error = error
+        self.extraction_method = extraction_method
+        # Durée (s) de chaque détecteur CV exécuté ; absent = détecteur ignoré par la planification
+        self.detector_timings = detector_timings if detector_timings is not None else {}
+        # Courbes numérisées (DigitizedCurve.to_dict), indexées par le champ "curve" des points
+        self.curves = curves if curves is not None else []
+        # Réduction appliquée au décodage ; les coordonnées sont déjà ramenées à l'image d'origine
+        self.decode_factor = decode_factor
+
+    @property
+    def count(self) -> int:
+        return len(self.points)
+
+    def to_dict(self) -> Dict:
+        if self.error is not None:
+            return {"error": self.error}
+        data = {
+            "interest_points": self.points,
+            "count": self.count,
+            "extraction_method": self.extraction_method,
+        }
+        if self.visual_type is not None:
+            data["visual_type"] = self.visual_type
+        if self.detector_timings:
+            data["detector_timings"] = self.detector_timings
+        if self.curves:
+            data["curves"] = self.curves
+        if self.decode_factor != 1:
+            data["decode_factor"] = self.decode_factor
+        return data
+
+    def rescaled(self, decode_factor: float) -> "InterestPointResult":
+        """
+        Résultat calculé sur une image décodée réduite de `decode_factor`,
+        ramené aux pixels de l'image d'origine : coordonnées x, y et
+        colonnes des courbes sont multipliées, ainsi que x_value et y_value
+        quand elles viennent de courbes numérisées ; les valeurs des données
+        fournies par l'appelant et x_index (position dans la série) sont
+        conservés
+        """
+        if self.error is not None or decode_factor == 1:
+            return self
+
+        def scale(value):
+            return value * decode_factor if isinstance(value, (int, float)) else value
+
+        keys = _DIGITIZED_KEYS if self.curves else _PIXEL_KEYS
+        points = [{key: scale(value) if key in keys else value for key, value in point.items()}
+                  for point in self.points]
+        curves = [dict(curve, x_range=[scale(x) for x in curve["x_range"]]) if "x_range" in curve else curve
+                  for curve in self.curves]
+        return InterestPointResult(points, self.visual_type, extraction_method=self.extraction_method,
+                                   detector_timings=self.detector_timings, curves=curves,
+                                   decode_factor=self.decode_factor * decode_factor)
+
+    def to_json(self, indent: int = None) -> str:
+        return encode_json(self.to_dict(), indent=indent)
+
+    def to_array(self) -> np.ndarray:
+        """
+        Points sous forme de tableau structuré (type, x, y) ; x vaut x_value
+        lorsque les points sont associés à des données, sinon la coordonnée x
+        """
+        array = np.empty(self.count, dtype=POINT_DTYPE)
+        for i, point in enumerate(self.points):
+            array[i] = (point["type"], point.get("x_value", point.get("x")), point.get("y_value", point.get("y")))
+        return array
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "InterestPointResult":
+        if "error" in data:
+            return cls(error=data["error"])
+        return cls(points=data.get("interest_points", []),
+                   visual_type=data.get("visual_type"),
+                   extraction_method=data.get("extraction_method", EXTRACTION_METHOD),
+                   detector_timings=data.get("detector_timings"),
+                   curves=data.get("curves"),
+                   decode_factor=data.get("decode_factor", 1))
+
+    @classmethod
+    def from_json(cls, text: str) -> "InterestPointResult":
+        return cls.from_dict(json.loads(text))
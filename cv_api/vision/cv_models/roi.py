@@ -0,0 +1,54 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .analysis_context import ImageAnalysisContext
+
+# Pente maximale (|dy| / |dx|) d'un segment « horizontal », environ 2 degrés
+AXIS_SLOPE_TOLERANCE = 0.035
+# Longueur minimale d'un axe, en fraction de la largeur (axe x) ou de la hauteur (axe y)
+MIN_AXIS_FRACTION = 0.3
+# Marge retirée le long des axes (épaisseur du trait, graduations), en fraction du petit côté
+AXIS_MARGIN_FRACTION = 0.005
+# Surface minimale de la zone de tracé, en fraction de l'image
+MIN_AREA_FRACTION = 0.1
+
+
+def locate_plot_area(context: ImageAnalysisContext) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Zone de tracé délimitée par les axes dominants trouvés par HoughLinesP
+    (lignes du contexte, déjà calculées par identify_visual_type) : l'axe des
+    x est le plus bas des longs segments horizontaux, l'axe des y le plus à
+    gauche des longs segments verticaux. La zone s'étend de l'axe des y à
+    l'extrémité droite de l'axe des x, et du haut de l'axe des y à l'axe des
+    x, ce qui écarte titre, légende à droite, graduations et marges.
+
+    Renvoie (x0, y0, x1, y1) en pixels de l'image d'origine (x1, y1 exclus),
+    ou None si les deux axes ne sont pas trouvés.
+    """
+    lines = context.lines
+    if lines is None:
+        return None
+
+    # Coordonnées ramenées à l'image d'origine pour un niveau de pyramide
+    height, width = (np.asarray(context.gray.shape[:2]) / context.scale).astype(int)
+    x_a, y_a, x_b, y_b = (lines.reshape(-1, 4).astype(np.float64) / context.scale).T
+    dx, dy = np.abs(x_b - x_a), np.abs(y_b - y_a)
+
+    horizontal = np.flatnonzero((dy <= AXIS_SLOPE_TOLERANCE * dx) & (dx >= MIN_AXIS_FRACTION * width))
+    vertical = np.flatnonzero((dx <= AXIS_SLOPE_TOLERANCE * dy) & (dy >= MIN_AXIS_FRACTION * height))
+    if len(horizontal) == 0 or len(vertical) == 0:
+        return None
+
+    x_axis = horizontal[np.argmax((y_a + y_b)[horizontal])]
+    y_axis = vertical[np.argmin((x_a + x_b)[vertical])]
+    margin = max(2, round(AXIS_MARGIN_FRACTION * min(height, width)))
+
+    x0 = int(round((x_a[y_axis] + x_b[y_axis]) / 2)) + margin
+    y1 = int(round((y_a[x_axis] + y_b[x_axis]) / 2)) - margin
+    x1 = min(width, int(max(x_a[x_axis], x_b[x_axis])) + 1)
+    y0 = max(0, int(min(y_a[y_axis], y_b[y_axis])))
+
+    if x1 <= x0 or y1 <= y0 or (x1 - x0) * (y1 - y0) < MIN_AREA_FRACTION * width * height:
+        return None
+    return x0, y0, x1, y1
@@ -0,0 +1,164 @@
+import numpy as np
+from scipy import signal
+from scipy.ndimage import gaussian_filter1d
+from typing import List, Tuple
+
+from .pointinteret import InterestPointExtractor
+
+# Même lissage que extract_points_with_stats (truncate=4.0 par défaut)
+SIGMA = 2
+RADIUS = int(4.0 * SIGMA + 0.5)
+
+
+class StreamingInterestPointExtractor:
+    """
+    Extraction statistique incrémentale pour des séries qui grandissent.
+
+    Chaque appel à update() reçoit un nouveau bloc d'échantillons et renvoie
+    uniquement les points nouvellement confirmés (mêmes tuples que
+    extract_points_with_stats). Un indice est confirmé dès que la fenêtre de
+    lissage gaussien (RADIUS échantillons de part et d'autre) est complète ;
+    la fin de série est traitée par flush().
+
+    Les inflexions sont identiques au calcul sur l'historique complet. Les
+    extrema sont recherchés sur les `window` derniers échantillons lissés et
+    émis quand aucun voisin à moins de min_distance ne peut encore les
+    supprimer ; un pic dont la prominence dépend d'un historique plus ancien
+    que la fenêtre peut être manqué. Le coût par mise à jour est en
+    O(window + bloc), indépendant de la longueur de l'historique.
+    """
+
+    def __init__(self, extractor: InterestPointExtractor = None, targets: List[str] = None, window: int = 1024):
+        self.extractor = extractor or InterestPointExtractor()
+        self.targets = targets if targets is not None else self.extractor.define_targets("graph2D")
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self.n = 0
+        # Données brutes conservées à partir de l'indice absolu _raw_start
+        self._raw = np.empty(0)
+        self._raw_start = 0
+        # Valeurs lissées confirmées à partir de _smooth_start, jusqu'à _smooth_end (exclu)
+        self._smooth = np.empty(0)
+        self._smooth_start = 0
+        self._smooth_end = 0
+        # Dérivée seconde confirmée jusqu'à _d2_end (exclu), dernière valeur conservée
+        self._d2_end = 0
+        self._last_d2 = None
+        self._emitted_extrema = set()
+        self._finished = False
+
+    def update(self, chunk) -> List[Tuple]:
+        """
+        Ajoute un bloc d'échantillons et renvoie les points nouvellement confirmés
+        """
+        if self._finished:
+            raise ValueError("flush() a déjà été appelé ; utiliser reset() pour une nouvelle série")
+        chunk = np.asarray(chunk)
+        if len(chunk) == 0:
+            return []
+        self._raw = np.concatenate([self._raw, chunk]) if self.n else chunk.copy()
+        self.n += len(chunk)
+        return self._advance(final=False)
+
+    def flush(self) -> List[Tuple]:
+        """
+        Termine la série : confirme les derniers échantillons (bord droit)
+        """
+        if self._finished:
+            return []
+        self._finished = True
+        if self.n < 2:
+            return []
+        return self._advance(final=True)
+
+    def _advance(self, final: bool) -> List[Tuple]:
+        n = self.n
+        smooth_limit = n if final else n - RADIUS
+        if smooth_limit <= self._smooth_end:
+            return []
+
+        # Lissage des indices nouvellement confirmés, avec RADIUS échantillons de contexte
+        a = max(0, self._smooth_end - RADIUS)
+        b = min(n, smooth_limit + RADIUS)
+        segment = self._raw[a - self._raw_start:b - self._raw_start]
+        smoothed = gaussian_filter1d(segment, sigma=SIGMA)
+        new_values = smoothed[self._smooth_end - a:smooth_limit - a]
+        self._smooth = np.concatenate([self._smooth, new_values]) if len(self._smooth) else new_values.copy()
+        self._smooth_end = smooth_limit
+
+        points = []
+        want_extrema = any(t in self.targets for t in ("maxima", "minima", "peaks", "valleys"))
+        if want_extrema:
+            points.extend(self._confirm_extrema(final))
+        if "inflection_points" in self.targets:
+            points.extend(self._confirm_inflections(final))
+
+        self._trim()
+        points.sort(key=lambda p: p[0])
+        return points
+
+    def _smooth_slice(self, start: int, stop: int) -> np.ndarray:
+        return self._smooth[start - self._smooth_start:stop - self._smooth_start]
+
+    def _confirm_extrema(self, final: bool) -> List[Tuple]:
+        min_distance = self.extractor.min_distance
+        ws = max(self._smooth_start, self._smooth_end - self.window)
+        values = self._smooth_slice(ws, self._smooth_end)
+        points = []
+        for sign, label in ((1, "maximum"), (-1, "minimum")):
+            indices, _ = signal.find_peaks(sign * values, prominence=self.extractor.min_prominence,
+                                           distance=min_distance)
+            for idx in indices:
+                abs_idx = ws + int(idx)
+                # Près du bord gauche de la fenêtre, un voisin plus ancien a pu être ignoré
+                if ws > 0 and abs_idx < ws + min_distance:
+                    continue
+                # Un voisin plus haut pourrait encore arriver à moins de min_distance
+                if not final and abs_idx + min_distance >= self._smooth_end:
+                    continue
+                key = (abs_idx, label)
+                if key not in self._emitted_extrema:
+                    self._emitted_extrema.add(key)
+                    points.append((abs_idx, float(values[idx]), label))
+        return points
+
+    def _confirm_inflections(self, final: bool) -> List[Tuple]:
+        d2_limit = self._smooth_end if final else self._smooth_end - 2
+        if d2_limit <= self._d2_end or self._smooth_end < 2:
+            return []
+
+        # Dérivée seconde sur [d2_end, d2_limit) avec 2 échantillons de contexte à gauche
+        lo = max(0, self._d2_end - 2)
+        segment = self._smooth_slice(lo, self._smooth_end)
+        second_derivative = np.gradient(np.gradient(segment))[self._d2_end - lo:d2_limit - lo]
+
+        if self._last_d2 is not None:
+            second_derivative = np.concatenate([[self._last_d2], second_derivative])
+            offset = self._d2_end - 1
+        else:
+            offset = self._d2_end
+        sign_changes = np.where(np.diff(np.sign(second_derivative)))[0]
+
+        self._last_d2 = second_derivative[-1]
+        self._d2_end = d2_limit
+
+        points = []
+        for idx in sign_changes:
+            abs_idx = offset + int(idx)
+            points.append((abs_idx, float(self._smooth_slice(abs_idx, abs_idx + 1)[0]), "inflection"))
+        return points
+
+    def _trim(self):
+        # Données brutes : contexte de lissage pour les prochains indices
+        raw_keep = max(0, self._smooth_end - RADIUS)
+        if raw_keep > self._raw_start:
+            self._raw = self._raw[raw_keep - self._raw_start:]
+            self._raw_start = raw_keep
+        # Valeurs lissées : fenêtre des extrema et contexte de la dérivée seconde
+        smooth_keep = max(0, min(self._smooth_end - self.window, self._d2_end - 2))
+        if smooth_keep > self._smooth_start:
+            self._smooth = self._smooth[smooth_keep - self._smooth_start:]
+            self._smooth_start = smooth_keep
+        self._emitted_extrema = {key for key in self._emitted_extrema if key[0] >= self._smooth_start}
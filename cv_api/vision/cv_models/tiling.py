@@ -0,0 +1,132 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+import cv2
+import numpy as np
+
+from .dedup import suppress_duplicates
+from .points import PointArray
+
+# Paramètres Shi-Tomasi identiques à extract_points_with_cv
+MAX_CORNERS = 100
+QUALITY_LEVEL = 0.01
+MIN_DISTANCE = 10
+CANNY_LOW = 50
+CANNY_HIGH = 150
+
+
+def tile_grid(height: int, width: int, tile_size: int, overlap: int) -> List[Tuple[Tuple[int, int, int, int], Tuple[int, int, int, int]]]:
+    """
+    Découpe l'image en tuiles : pour chaque tuile, la zone traitée (avec
+    recouvrement) et la zone « propriétaire » dont elle garde les points,
+    sous forme (y0, y1, x0, x1). Les zones propriétaires forment une partition.
+    """
+    tiles = []
+    for y0 in range(0, height, tile_size):
+        for x0 in range(0, width, tile_size):
+            y1, x1 = min(y0 + tile_size, height), min(x0 + tile_size, width)
+            padded = (max(0, y0 - overlap), min(height, y1 + overlap), max(0, x0 - overlap), min(width, x1 + overlap))
+            tiles.append((padded, (y0, y1, x0, x1)))
+    return tiles
+
+
+def _tile_corners(gray: np.ndarray, padded, core, image_shape):
+    """
+    Candidats Shi-Tomasi d'une tuile : maxima locaux de la plus petite valeur
+    propre (comme goodFeaturesToTrack), restreints à la zone propriétaire.
+    Renvoie (xs, ys, réponses, réponse max de la tuile).
+    """
+    py0, py1, px0, px1 = padded
+    cy0, cy1, cx0, cx1 = core
+    eig = cv2.cornerMinEigenVal(gray[py0:py1, px0:px1], blockSize=3, ksize=3)
+    max_response = float(eig.max()) if eig.size else 0.0
+    if max_response <= 0:
+        return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, np.float32), 0.0
+
+    # Le seuil de la tuile est <= seuil global : on garde un sur-ensemble
+    eig[eig <= QUALITY_LEVEL * max_response] = 0
+    local_max = (eig == cv2.dilate(eig, None)) & (eig > 0)
+
+    # goodFeaturesToTrack ignore le pixel de bord de l'image
+    height, width = image_shape
+    y_lo, y_hi = max(cy0, 1), min(cy1, height - 1)
+    x_lo, x_hi = max(cx0, 1), min(cx1, width - 1)
+    region = local_max[y_lo - py0:y_hi - py0, x_lo - px0:x_hi - px0]
+    ys, xs = np.nonzero(region)
+    ys, xs = ys + y_lo, xs + x_lo
+    responses = eig[ys - py0, xs - px0]
+
+    # Pré-sélection locale : au plus MAX_CORNERS coins espacés par tuile
+    order = np.argsort(-responses, kind="stable")
+    xs, ys, responses = xs[order], ys[order], responses[order]
+    keep = suppress_duplicates(xs, ys, MIN_DISTANCE, radius_2d=True)[:MAX_CORNERS]
+    return xs[keep], ys[keep], responses[keep], max_response
+
+
+def _tile_contour_vertices(gray: np.ndarray, padded, core):
+    """
+    Sommets des contours approximés d'une tuile, limités à sa zone
+    propriétaire : les sommets artificiels créés au bord de la tuile tombent
+    dans le recouvrement et sont écartés, les doublons entre tuiles aussi.
+    """
+    py0, py1, px0, px1 = padded
+    cy0, cy1, cx0, cx1 = core
+    edges = cv2.Canny(gray[py0:py1, px0:px1], CANNY_LOW, CANNY_HIGH)
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    approximations = [cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
+                      for contour in contours]
+    if not approximations:
+        return np.empty((0, 2), np.int32)
+    vertices = np.concatenate(approximations).reshape(-1, 2) + (px0, py0)
+    inside = ((vertices[:, 0] >= cx0) & (vertices[:, 0] < cx1) &
+              (vertices[:, 1] >= cy0) & (vertices[:, 1] < cy1))
+    return vertices[inside]
+
+
+# Détecteurs (noms de DETECTION_TYPES) pris en charge par le mode tuiles
+TILED_DETECTORS = ("corners", "edges")
+
+
+def extract_points_tiled(gray: np.ndarray, detectors: List[str], tile_size: int = 1024,
+                         overlap: int = 32, workers: int = None) -> PointArray:
+    """
+    Extraction CV par tuiles en parallèle (OpenCV relâche le GIL).
+
+    Les coins de toutes les tuiles sont reclassés globalement (seuil de
+    qualité relatif au maximum global, espacement MIN_DISTANCE, budget
+    MAX_CORNERS), ce qui reproduit goodFeaturesToTrack sur l'image entière.
+    Les contours d'un objet coupé par une couture peuvent différer
+    légèrement de l'extraction globale.
+    """
+    height, width = gray.shape[:2]
+    tiles = tile_grid(height, width, tile_size, overlap)
+    want_corners = "corners" in detectors
+    want_edges = "edges" in detectors
+
+    def process(tile):
+        padded, core = tile
+        corners = _tile_corners(gray, padded, core, (height, width)) if want_corners else None
+        vertices = _tile_contour_vertices(gray, padded, core) if want_edges else None
+        return corners, vertices
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        results = list(pool.map(process, tiles))
+
+    parts = []
+    if want_corners:
+        global_max = max((r[0][3] for r in results), default=0.0)
+        xs = np.concatenate([r[0][0] for r in results])
+        ys = np.concatenate([r[0][1] for r in results])
+        responses = np.concatenate([r[0][2] for r in results])
+        strong = responses > QUALITY_LEVEL * global_max
+        xs, ys, responses = xs[strong], ys[strong], responses[strong]
+        order = np.argsort(-responses, kind="stable")
+        xs, ys = xs[order], ys[order]
+        keep = suppress_duplicates(xs, ys, MIN_DISTANCE, radius_2d=True)[:MAX_CORNERS]
+        parts.append(PointArray.of_kind(xs[keep], ys[keep], "corner"))
+
+    if want_edges:
+        vertices = np.concatenate([r[1] for r in results])
+        parts.append(PointArray.of_kind(vertices[:, 0], vertices[:, 1], "contour_feature"))
+    return PointArray.concat(parts)
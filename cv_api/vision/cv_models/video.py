@@ -0,0 +1,153 @@
+from typing import Dict, Iterable, Iterator
+
+import cv2
+import numpy as np
+
+from .analysis_context import ImageAnalysisContext
+from .detectors import detect_corners
+from .pointinteret import InterestPointExtractor
+from .points import PointArray
+
+
+def iter_video_frames(path: str, step: int = 1, max_frames: int = None) -> Iterator[np.ndarray]:
+    """
+    Images BGR d'une vidéo (une sur `step`), au plus `max_frames`
+    """
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        raise ValueError(f"Impossible d'ouvrir la vidéo : {path}")
+    try:
+        index = emitted = 0
+        while max_frames is None or emitted < max_frames:
+            # grab() seul pour les images sautées : pas de décodage complet
+            if not capture.grab():
+                break
+            if index % step == 0:
+                ok, frame = capture.retrieve()
+                if not ok:
+                    break
+                emitted += 1
+                yield frame
+            index += 1
+    finally:
+        capture.release()
+
+
+class FrameResult:
+    """Points d'intérêt d'une image du flux"""
+
+    __slots__ = ("index", "visual_type", "points", "scene_change", "redetected")
+
+    def __init__(self, index: int, visual_type: str, points: PointArray, scene_change: bool, redetected: bool):
+        self.index = index
+        self.visual_type = visual_type
+        self.points = points
+        # Vrai si le visuel a été reclassé (changement de scène)
+        self.scene_change = scene_change
+        # Vrai si les coins viennent d'une détection complète, faux s'ils sont suivis par flot optique
+        self.redetected = redetected
+
+    def to_dict(self) -> Dict:
+        return {
+            "frame": self.index,
+            "visual_type": self.visual_type,
+            "scene_change": self.scene_change,
+            "redetected": self.redetected,
+            "interest_points": self.points.to_dicts(),
+            "count": len(self.points),
+        }
+
+
+class FrameStreamExtractor:
+    """
+    Extraction sur un flux d'images (enregistrement d'écran, vidéo).
+
+    Le visuel n'est reclassé (identify_visual_type) qu'aux changements de
+    scène, détectés par l'écart moyen entre les vignettes en niveaux de gris
+    de deux images consécutives. Les coins de
+    Shi-Tomasi sont détectés complètement (goodFeaturesToTrack) au changement
+    de scène, toutes les `redetect_interval` images ou quand moins de
+    `min_tracked` des coins détectés survivent ; entre deux détections ils
+    sont propagés par flot optique de Lucas-Kanade. Le coût par image se
+    réduit alors à la conversion en gris, la vignette et le suivi.
+
+    Les points statistiques demandent des données extraites et ne sont pas
+    produits ici.
+    """
+
+    THUMBNAIL_SIZE = (64, 36)
+    LK_WINDOW = 21
+    LK_LEVELS = 3
+
+    def __init__(self, extractor: InterestPointExtractor = None, redetect_interval: int = 30,
+                 scene_threshold: float = 12.0, min_tracked: float = 0.5, max_corners: int = 100):
+        self.extractor = extractor or InterestPointExtractor()
+        self.redetect_interval = redetect_interval
+        # Écart moyen (niveaux de gris 0-255) de la vignette au-delà duquel la scène a changé
+        self.scene_threshold = scene_threshold
+        self.min_tracked = min_tracked
+        self.max_corners = max_corners
+        self.reset()
+
+    def reset(self):
+        self.index = 0
+        self.visual_type = None
+        self._thumbnail = None
+        self._prev_gray = None
+        # Positions suivies (N, 1, 2) en float32, format de calcOpticalFlowPyrLK
+        self._corners = None
+        self._detected_count = 0
+        self._since_detection = 0
+
+    def _scene_changed(self, gray: np.ndarray) -> bool:
+        # Comparaison à l'image précédente : une coupure franche change la
+        # scène, un défilement progressif ne provoque pas de reclassement
+        thumbnail = cv2.resize(gray, self.THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+        previous, self._thumbnail = self._thumbnail, thumbnail
+        return previous is None or cv2.absdiff(thumbnail, previous).mean() > self.scene_threshold
+
+    def _track(self, gray: np.ndarray) -> bool:
+        """Propage les coins depuis l'image précédente ; faux si le suivi est trop dégradé"""
+        if self._corners is None or self._since_detection >= self.redetect_interval:
+            return False
+        if len(self._corners) == 0:
+            return self._detected_count == 0
+
+        corners, status, _ = cv2.calcOpticalFlowPyrLK(
+            self._prev_gray, gray, self._corners, None,
+            winSize=(self.LK_WINDOW, self.LK_WINDOW), maxLevel=self.LK_LEVELS)
+        height, width = gray.shape[:2]
+        xy = corners.reshape(-1, 2)
+        keep = ((status.reshape(-1) == 1) & (xy[:, 0] >= 0) & (xy[:, 0] < width)
+                & (xy[:, 1] >= 0) & (xy[:, 1] < height))
+        self._corners = corners[keep]
+        return len(self._corners) >= self.min_tracked * self._detected_count
+
+    def process_frame(self, frame: np.ndarray) -> FrameResult:
+        context = ImageAnalysisContext(frame)
+        gray = context.gray
+
+        scene_change = self._scene_changed(gray)
+        if scene_change:
+            self.visual_type = self.extractor.identify_visual_type(frame, context)
+
+        redetected = scene_change or not self._track(gray)
+        if redetected:
+            points = detect_corners(context, max_corners=self.max_corners)
+            self._corners = np.stack([points.x, points.y], axis=1).astype(np.float32).reshape(-1, 1, 2)
+            self._detected_count = len(points)
+            self._since_detection = 0
+        else:
+            xy = self._corners.reshape(-1, 2)
+            points = PointArray.of_kind(xy[:, 0], xy[:, 1].astype(np.int32), "corner")
+
+        self._since_detection += 1
+        self._prev_gray = gray
+        result = FrameResult(self.index, self.visual_type, points, scene_change, redetected)
+        self.index += 1
+        return result
+
+    def process(self, frames: Iterable[np.ndarray]) -> Iterator[FrameResult]:
+        """Traite un itérable d'images (par exemple iter_video_frames) au fil de l'eau"""
+        for frame in frames:
+            yield self.process_frame(frame)
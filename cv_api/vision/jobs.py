@@ -0,0 +1,306 @@
+import logging
+import multiprocessing
+import os
+import queue
+import socket
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+from .models import InterestPointJob
+from .persistence import try_persist_result
+from .services import get_pipeline_metrics
+from .workers import init_worker, process_stored_image
+
+logger = logging.getLogger(__name__)
+
+class QueueFull(Exception):
+    """Raised when the job queue has reached its backpressure limit"""
+
+
+class QueueUnavailable(Exception):
+    """Raised when a job cannot be handed to the worker pool"""
+
+
+def _owner():
+    """Identifies the process running a job (host:pid), for recovery after a restart"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_gone(owner):
+    """True if `owner` is this process or a process of this host that no longer exists"""
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname() or not pid.isdigit():
+        # Rows from before owners were recorded are orphans; other hosts are left alone
+        return not owner
+    if int(pid) == os.getpid():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass
+    return False
+
+
+class JobQueue:
+    """
+    Job queue backed by InterestPointJob rows, feeding a process pool of warm
+    InterestPointExtractor workers.
+
+    Submitted jobs are stored "pending"; a web process with a free worker
+    claims the oldest pending row with a conditional UPDATE (pending ->
+    running), so several processes share one queue and waiting jobs survive
+    a restart. At most `workers` jobs run per process; submissions beyond
+    `max_pending` unfinished jobs (all processes together) are rejected with
+    QueueFull. Claimed rows record their owner (host:pid) so recover() can
+    fail the jobs of a process that died. Batch images (submit_image) use
+    the same workers without a row.
+
+    Outcomes are recorded by a dedicated thread with its own database
+    connection, not by the pool's management thread. Workers are started
+    with `start_method` (the platform default if None); they run
+    vision.workers, which does not need the Django app registry.
+    """
+
+    def __init__(self, workers=2, max_pending=32, extractor_config=None, cache_config=None,
+                 track_memory=False, opencv_config=None, track_rss=False, memory_config=None,
+                 start_method=None):
+        self.workers = workers
+        self.max_pending = max_pending
+        # Workers share the on-disk cache tier; each keeps its own memory tier
+        self._init_args = (extractor_config or {}, cache_config, track_memory, opencv_config,
+                           track_rss, memory_config)
+        self._mp_context = multiprocessing.get_context(start_method) if start_method else None
+        self._executor = None
+        self._running = 0
+        self._lock = threading.RLock()
+        # Finished futures, handed from the pool's management thread to the recorder
+        self._outcomes = queue.SimpleQueue()
+        self._recorder = None
+
+    def get_executor(self):
+        """Process pool of warm workers, shared with batch processing"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=self._mp_context,
+                    initializer=init_worker, initargs=self._init_args,
+                )
+            if self._recorder is None:
+                self._recorder = threading.Thread(target=self._record_outcomes, name="vision-job-recorder",
+                                                  daemon=True)
+                self._recorder.start()
+            return self._executor
+
+    def _reset_executor(self, broken):
+        """Drop a pool whose worker died (e.g. OOM-killed); the next call builds a new one"""
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+                broken.shutdown(wait=False, cancel_futures=True)
+
+    def _submit_to_pool(self, image_path):
+        """(executor, future) of the job; a broken pool is replaced once"""
+        executor = self.get_executor()
+        try:
+            return executor, executor.submit(process_stored_image, image_path)
+        except BrokenProcessPool:
+            logger.warning("Interest-point worker pool is broken, starting a new one")
+            self._reset_executor(executor)
+            executor = self.get_executor()
+            return executor, executor.submit(process_stored_image, image_path)
+
+    def submit_image(self, image_path):
+        """
+        Run one stored image on the pool without a job row (batch processing)
+        and return its future. The image takes one of this process's workers
+        until it finishes, so queued jobs wait behind it; a broken pool is
+        replaced like for jobs. Raises QueueUnavailable when the pool cannot
+        take the image.
+        """
+        with self._lock:
+            try:
+                executor, future = self._submit_to_pool(image_path)
+            except Exception as e:
+                raise QueueUnavailable("The interest-point workers are unavailable") from e
+            self._running += 1
+        future.add_done_callback(lambda f: self._outcomes.put((None, executor, f)))
+        return future
+
+    def submit(self, storage_path):
+        """
+        Create a pending job row and start it if this process has a free
+        worker; raises QueueFull when saturated and QueueUnavailable when the
+        worker pool cannot take the job
+        """
+        unfinished = (InterestPointJob.STATUS_PENDING, InterestPointJob.STATUS_RUNNING)
+        with self._lock:
+            if InterestPointJob.objects.filter(status__in=unfinished).count() >= self.max_pending:
+                raise QueueFull(f"Job queue is full ({self.max_pending} jobs in flight)")
+            job = InterestPointJob.objects.create(image_path=storage_path)
+            try:
+                self._dispatch_pending()
+            except QueueUnavailable:
+                InterestPointJob.objects.filter(pk=job.pk, status=InterestPointJob.STATUS_PENDING).update(
+                    status=InterestPointJob.STATUS_FAILED, error="The interest-point workers are unavailable",
+                    finished_at=timezone.now(),
+                )
+                raise
+        job.refresh_from_db(fields=["status"])
+        return job
+
+    def _claim(self):
+        """(job id, storage path) of the oldest pending job, now marked running by this process"""
+        pending = (InterestPointJob.objects.filter(status=InterestPointJob.STATUS_PENDING)
+                   .order_by("created_at").values_list("id", "image_path"))
+        for job_id, storage_path in pending[:self.workers + 1]:
+            # Only one process wins the conditional update
+            claimed = InterestPointJob.objects.filter(pk=job_id, status=InterestPointJob.STATUS_PENDING).update(
+                status=InterestPointJob.STATUS_RUNNING, started_at=timezone.now(), owner=_owner()
+            )
+            if claimed:
+                return job_id, storage_path
+        return None
+
+    def _dispatch_pending(self):
+        """Start pending jobs while this process has free workers"""
+        with self._lock:
+            while self._running < self.workers:
+                claimed = self._claim()
+                if claimed is None:
+                    return
+                self._dispatch(*claimed)
+
+    def _dispatch(self, job_id, storage_path):
+        # Caller holds self._lock; the row is already claimed (running)
+        try:
+            executor, future = self._submit_to_pool(default_storage.path(storage_path))
+        except Exception as e:
+            InterestPointJob.objects.filter(pk=job_id).update(
+                status=InterestPointJob.STATUS_FAILED, error=f"Could not start the job: {e}",
+                finished_at=timezone.now(),
+            )
+            raise QueueUnavailable("The interest-point workers are unavailable") from e
+        self._running += 1
+        # Runs on the pool's management thread: only hand the future over
+        future.add_done_callback(lambda f: self._outcomes.put((job_id, executor, f)))
+
+    def _record_outcomes(self):
+        """Recorder thread: store each finished job, then start pending ones"""
+        while True:
+            item = self._outcomes.get()
+            if item is None:
+                return
+            job_id, executor, future = item
+            try:
+                self._record_outcome(job_id, executor, future)
+            except Exception:
+                logger.exception("Could not record the outcome of job %s", job_id)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    try:
+                        self._dispatch_pending()
+                    except Exception:
+                        logger.exception("Could not dispatch pending interest-point jobs")
+                # This thread keeps its connection; honour CONN_MAX_AGE and drop broken ones
+                close_old_connections()
+
+    def _record_outcome(self, job_id, executor, future):
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool):
+            # The worker died mid-job; later jobs get a fresh pool
+            self._reset_executor(executor)
+            error = "The worker processing this job exited unexpectedly"
+        if job_id is None:
+            # Image of a batch (submit_image): the batch stream reports it
+            return
+        if error is None:
+            result = future.result()
+            get_pipeline_metrics().observe(result.get("profile", {}))
+            InterestPointJob.objects.filter(pk=job_id).update(
+                status=InterestPointJob.STATUS_DONE, result=result, finished_at=timezone.now()
+            )
+            image_path = InterestPointJob.objects.values_list("image_path", flat=True).get(pk=job_id)
+            try_persist_result(default_storage, image_path, result)
+        else:
+            InterestPointJob.objects.filter(pk=job_id).update(
+                status=InterestPointJob.STATUS_FAILED, error=str(error), finished_at=timezone.now()
+            )
+
+    def recover(self):
+        """
+        Fail the running jobs left by dead processes of this host (their
+        worker is gone), then start pending jobs. Called once when the
+        process-wide queue is created.
+        """
+        running = InterestPointJob.objects.filter(status=InterestPointJob.STATUS_RUNNING)
+        for job_id, owner in running.values_list("id", "owner"):
+            if _owner_gone(owner):
+                InterestPointJob.objects.filter(pk=job_id, status=InterestPointJob.STATUS_RUNNING).update(
+                    status=InterestPointJob.STATUS_FAILED, finished_at=timezone.now(),
+                    error="Interrupted: the process running this job exited",
+                )
+        try:
+            self._dispatch_pending()
+        except QueueUnavailable:
+            logger.exception("Could not resume pending interest-point jobs")
+
+    def shutdown(self, wait=True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        if self._recorder is not None:
+            # Queued after the outcomes of the jobs the pool finished
+            self._outcomes.put(None)
+            if wait:
+                self._recorder.join()
+            self._recorder = None
+
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue():
+    """Process-wide job queue configured from settings.INTEREST_POINT_JOBS"""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            config = getattr(settings, "INTEREST_POINT_JOBS", {})
+            metrics_config = getattr(settings, "INTEREST_POINT_METRICS", {})
+            _job_queue = JobQueue(
+                workers=config.get("WORKERS", 2),
+                max_pending=config.get("MAX_PENDING", 32),
+                extractor_config=getattr(settings, "INTEREST_POINT_EXTRACTORS", {}).get(
+                    config.get("EXTRACTOR", "default"), {}),
+                cache_config=getattr(settings, "INTEREST_POINT_CACHE", None),
+                track_memory=metrics_config.get("TRACK_MEMORY", False),
+                opencv_config=getattr(settings, "INTEREST_POINT_OPENCV", None),
+                track_rss=metrics_config.get("TRACK_RSS", False),
+                memory_config=getattr(settings, "INTEREST_POINT_MEMORY", None),
+                start_method=config.get("START_METHOD"),
+            )
+            _job_queue.recover()
+        return _job_queue
+
+
+def resume_jobs():
+    """
+    Start the queue at process startup when unfinished jobs are stored, so
+    jobs queued before a restart do not wait for the next submission
+    """
+    unfinished = (InterestPointJob.STATUS_PENDING, InterestPointJob.STATUS_RUNNING)
+    try:
+        if InterestPointJob.objects.filter(status__in=unfinished).exists():
+            get_job_queue()
+    except DatabaseError:
+        # Tables not migrated yet
+        logger.exception("Could not resume interest-point jobs")
@@ -0,0 +1,58 @@
+import math
+
+# Peak memory of one request per decoded pixel: the BGR image itself (3 bytes)
+# plus the pipeline's transient planes (grayscale, Canny edges, HSV and masks of
+# the digitization stage, contour lists). Measured as the VmHWM increase of
+# process_image on the benchmark corpus (up to ~18 bytes/pixel), rounded up.
+WORKING_BYTES_PER_PIXEL = 24
+
+# Bytes per pixel of a full-resolution BGR decode
+DECODED_BYTES_PER_PIXEL = 3
+
+
+class ImageTooLarge(ValueError):
+    """The upload cannot be decoded within the memory budget"""
+
+
+class MemoryBudget:
+    """
+    Per-request memory limits of the interest-point pipeline.
+
+    max_pixels caps the decoded image; max_bytes caps the estimated working
+    set (WORKING_BYTES_PER_PIXEL per decoded pixel). None disables a limit.
+    Images over budget are decoded at reduced resolution (see
+    uploads.decode_image); those that would need more than max_bytes just to
+    be decoded at full size first are rejected.
+    """
+
+    def __init__(self, max_pixels=None, max_bytes=None, bytes_per_pixel=WORKING_BYTES_PER_PIXEL):
+        self.max_pixels = max_pixels
+        self.max_bytes = max_bytes
+        self.bytes_per_pixel = bytes_per_pixel
+
+    @property
+    def pixel_limit(self):
+        """Largest decoded pixel count allowed by both limits (None if unlimited)"""
+        limits = [limit for limit in (self.max_pixels,
+                                      self.max_bytes // self.bytes_per_pixel if self.max_bytes else None)
+                  if limit]
+        return min(limits) if limits else None
+
+    def working_bytes(self, width, height):
+        return width * height * self.bytes_per_pixel
+
+    def downscale_factor(self, width, height):
+        """Smallest linear downscale (>= 1) that brings width x height within budget"""
+        limit = self.pixel_limit
+        if limit is None or width * height <= limit:
+            return 1
+        return math.sqrt(width * height / limit)
+
+    def can_decode_full(self, width, height):
+        """Whether a full-resolution decode (before any resize) fits in max_bytes"""
+        return not self.max_bytes or width * height * DECODED_BYTES_PER_PIXEL <= self.max_bytes
+
+    @classmethod
+    def from_config(cls, config):
+        """Budget from an INTEREST_POINT_MEMORY-style dict"""
+        return cls(max_pixels=config.get("MAX_PIXELS"), max_bytes=config.get("MAX_BYTES"))
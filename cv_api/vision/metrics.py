@@ -0,0 +1,98 @@
+import threading
+from bisect import bisect_left
+
+# Latency buckets (seconds) shared by every stage histogram
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Histogram:
+    def __init__(self, buckets):
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class PipelineMetrics:
+    """
+    Process-wide aggregation of PipelineProfiler reports, rendered in the
+    Prometheus text exposition format: one latency histogram per stage, the
+    points each stage produced, the largest per-stage memory peak seen and
+    the largest process resident set size reported by a request.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._stages = {}
+        self._points = {}
+        self._peak_bytes = {}
+        self._peak_rss_bytes = None
+        self._requests = _Histogram(self.buckets)
+        self._lock = threading.Lock()
+
+    def _observe(self, histogram, seconds):
+        histogram.counts[bisect_left(self.buckets, seconds)] += 1
+        histogram.sum += seconds
+        histogram.count += 1
+
+    def observe(self, profile):
+        """Record one PipelineProfiler.to_dict() report"""
+        with self._lock:
+            for stage in profile.get("stages", []):
+                name = stage["stage"]
+                histogram = self._stages.get(name)
+                if histogram is None:
+                    histogram = self._stages[name] = _Histogram(self.buckets)
+                self._observe(histogram, stage["seconds"])
+                if stage.get("points") is not None:
+                    self._points[name] = self._points.get(name, 0) + stage["points"]
+                if stage.get("peak_bytes") is not None:
+                    self._peak_bytes[name] = max(self._peak_bytes.get(name, 0), stage["peak_bytes"])
+            self._observe(self._requests, profile.get("total_seconds", 0.0))
+            if profile.get("peak_rss_bytes") is not None:
+                self._peak_rss_bytes = max(self._peak_rss_bytes or 0, profile["peak_rss_bytes"])
+
+    def _histogram_lines(self, metric, histogram, labels=""):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, histogram.counts):
+            cumulative += count
+            lines.append(f'{metric}_bucket{{{labels}le="{bound}"}} {cumulative}')
+        lines.append(f'{metric}_bucket{{{labels}le="+Inf"}} {histogram.count}')
+        suffix = f"{{{labels.rstrip(',')}}}" if labels else ""
+        lines.append(f"{metric}_sum{suffix} {histogram.sum}")
+        lines.append(f"{metric}_count{suffix} {histogram.count}")
+        return lines
+
+    def render(self):
+        with self._lock:
+            lines = [
+                "# HELP vision_pipeline_seconds Wall time of the instrumented pipeline stages per request.",
+                "# TYPE vision_pipeline_seconds histogram",
+            ]
+            lines += self._histogram_lines("vision_pipeline_seconds", self._requests)
+            lines += [
+                "# HELP vision_pipeline_stage_seconds Wall time of each interest-point pipeline stage.",
+                "# TYPE vision_pipeline_stage_seconds histogram",
+            ]
+            for name in sorted(self._stages):
+                lines += self._histogram_lines("vision_pipeline_stage_seconds", self._stages[name],
+                                               f'stage="{name}",')
+            lines += [
+                "# HELP vision_pipeline_stage_points_total Points produced by each pipeline stage.",
+                "# TYPE vision_pipeline_stage_points_total counter",
+            ]
+            lines += [f'vision_pipeline_stage_points_total{{stage="{name}"}} {count}'
+                      for name, count in sorted(self._points.items())]
+            lines += [
+                "# HELP vision_pipeline_stage_peak_bytes Largest traced allocation peak seen in each stage.",
+                "# TYPE vision_pipeline_stage_peak_bytes gauge",
+            ]
+            lines += [f'vision_pipeline_stage_peak_bytes{{stage="{name}"}} {peak}'
+                      for name, peak in sorted(self._peak_bytes.items())]
+            if self._peak_rss_bytes is not None:
+                lines += [
+                    "# HELP vision_pipeline_peak_rss_bytes Largest process resident set size reported by a request.",
+                    "# TYPE vision_pipeline_peak_rss_bytes gauge",
+                    f"vision_pipeline_peak_rss_bytes {self._peak_rss_bytes}",
+                ]
+        return "\n".join(lines) + "\n"
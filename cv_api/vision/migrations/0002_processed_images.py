@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vision', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProcessedImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('image_path', models.CharField(help_text='Path of the image in default storage', max_length=255)),
+                ('visual_type', models.CharField(blank=True, db_index=True, default='', max_length=32)),
+                ('extraction_method', models.CharField(blank=True, default='', max_length=64)),
+                ('point_count', models.PositiveIntegerField(default=0)),
+                ('uploaded_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('processed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-uploaded_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='InterestPoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('type', models.CharField(choices=[('corner', 'Corner'), ('contour_feature', 'Contour feature'), ('maximum', 'Maximum'), ('minimum', 'Minimum'), ('inflection', 'Inflection'), ('blob', 'Blob'), ('keypoint', 'Keypoint')], max_length=16)),
+                ('x', models.FloatField()),
+                ('y', models.FloatField()),
+                ('x_index', models.IntegerField(blank=True, null=True)),
+                ('image', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='points', to='vision.processedimage')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['type', 'x'], name='vision_point_type_x'), models.Index(fields=['type', 'y'], name='vision_point_type_y'), models.Index(fields=['image', 'x'], name='vision_point_image_x')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vision', '0002_processed_images'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interestpointjob',
+            name='owner',
+            field=models.CharField(blank=True, default='', help_text='host:pid of the process running the job', max_length=128),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vision', '0003_job_owner'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='processedimage',
+            name='decode_factor',
+            field=models.FloatField(default=1.0, help_text='Downscale applied when decoding; point coordinates are in original pixels'),
+        ),
+    ]
@@ -0,0 +1,121 @@
+import uuid
+
+from django.db import models
+
+
+class InterestPointJob(models.Model):
+    """Asynchronous interest-point extraction job, polled by the client"""
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    image_path = models.CharField(max_length=255, help_text="Path of the uploaded image in default storage")
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    owner = models.CharField(max_length=128, blank=True, default="", help_text="host:pid of the process running the job")
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"InterestPointJob({self.id}, {self.status})"
+
+
+class ProcessedImage(models.Model):
+    """An image processed by the interest-point pipeline, identified by the SHA-256 of its file"""
+    content_hash = models.CharField(max_length=64, unique=True)
+    image_path = models.CharField(max_length=255, help_text="Path of the image in default storage")
+    visual_type = models.CharField(max_length=32, blank=True, default="", db_index=True)
+    extraction_method = models.CharField(max_length=64, blank=True, default="")
+    point_count = models.PositiveIntegerField(default=0)
+    decode_factor = models.FloatField(
+        default=1.0, help_text="Downscale applied when decoding; point coordinates are in original pixels")
+    uploaded_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    processed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-uploaded_at"]
+
+    def __str__(self):
+        return f"ProcessedImage({self.content_hash[:12]}, {self.point_count} points)"
+
+
+class InterestPointQuerySet(models.QuerySet):
+    def of_type(self, *types):
+        return self.filter(type__in=types)
+
+    def x_range(self, x_min=None, x_max=None):
+        if x_min is not None:
+            self = self.filter(x__gte=x_min)
+        if x_max is not None:
+            self = self.filter(x__lte=x_max)
+        return self
+
+    def y_range(self, y_min=None, y_max=None):
+        if y_min is not None:
+            self = self.filter(y__gt=y_min)
+        if y_max is not None:
+            self = self.filter(y__lt=y_max)
+        return self
+
+    def uploaded_since(self, since):
+        return self.filter(image__uploaded_at__gte=since)
+
+
+class InterestPoint(models.Model):
+    """
+    One interest point of a ProcessedImage. x and y hold the data coordinates
+    (x_value, y_value) when the image was processed with extracted data, the
+    pixel coordinates otherwise.
+    """
+    # Same labels as vision.cv_models.points.POINT_TYPES (not imported: it pulls in NumPy)
+    TYPE_CHOICES = [
+        ("corner", "Corner"),
+        ("contour_feature", "Contour feature"),
+        ("maximum", "Maximum"),
+        ("minimum", "Minimum"),
+        ("inflection", "Inflection"),
+        ("blob", "Blob"),
+        ("keypoint", "Keypoint"),
+    ]
+
+    image = models.ForeignKey(ProcessedImage, on_delete=models.CASCADE, related_name="points")
+    type = models.CharField(max_length=16, choices=TYPE_CHOICES)
+    x = models.FloatField()
+    y = models.FloatField()
+    x_index = models.IntegerField(null=True, blank=True)
+
+    objects = InterestPointQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["type", "x"], name="vision_point_type_x"),
+            models.Index(fields=["type", "y"], name="vision_point_type_y"),
+            models.Index(fields=["image", "x"], name="vision_point_image_x"),
+        ]
+
+    @classmethod
+    def from_result_point(cls, image, point):
+        """Unsaved row for one point dict of InterestPointResult.points"""
+        return cls(
+            image=image,
+            type=point["type"],
+            x=point.get("x_value", point.get("x")),
+            y=point.get("y_value", point.get("y")),
+            x_index=point.get("x_index"),
+        )
+
+    def __str__(self):
+        return f"InterestPoint({self.type}, {self.x}, {self.y})"
@@ -0,0 +1,76 @@
+import hashlib
+import logging
+
+from django.conf import settings
+from django.db import transaction
+
+from .models import InterestPoint, ProcessedImage
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT when storing the points of one image
+BULK_BATCH_SIZE = 1000
+
+
+def stored_content_hash(storage, name):
+    """
+    SHA-256 of a stored file: read from the blob name for content-addressed
+    storage, computed from the file otherwise
+    """
+    if hasattr(storage, "content_hash"):
+        digest = storage.content_hash(name)
+        if digest is not None:
+            return digest
+    hasher = hashlib.sha256()
+    with storage.open(name, "rb") as f:
+        for chunk in f.chunks():
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def persist_result(storage, image_path, result):
+    """
+    Store the result of process_image for a stored image (an
+    InterestPointResult or its to_dict()). Processing the same content again
+    replaces its points. Returns the ProcessedImage, or None when persistence
+    is disabled or the result is an error.
+    """
+    if not getattr(settings, "INTEREST_POINT_PERSIST", True):
+        return None
+    data = result if isinstance(result, dict) else result.to_dict()
+    if "error" in data:
+        return None
+
+    points = data.get("interest_points", [])
+    content_hash = stored_content_hash(storage, image_path)
+    with transaction.atomic():
+        image, created = ProcessedImage.objects.update_or_create(
+            content_hash=content_hash,
+            defaults={
+                "image_path": image_path,
+                "visual_type": data.get("visual_type") or "",
+                "extraction_method": data.get("extraction_method", ""),
+                "point_count": len(points),
+                "decode_factor": data.get("decode_factor", 1),
+            },
+        )
+        if not created:
+            image.points.all().delete()
+        InterestPoint.objects.bulk_create(
+            [InterestPoint.from_result_point(image, point) for point in points],
+            batch_size=BULK_BATCH_SIZE,
+        )
+    return image
+
+
+def try_persist_result(storage, image_path, result):
+    """
+    persist_result for callers that already hold a successful result: a
+    storage or database failure is logged and None returned, so the result
+    is still delivered
+    """
+    try:
+        return persist_result(storage, image_path, result)
+    except Exception:
+        logger.exception("Could not persist the interest points of %s", image_path)
+        return None
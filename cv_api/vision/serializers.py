@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from .models import InterestPoint
+
 
 class ImageUploadSerializer(serializers.Serializer):
     """Serializer for image upload requests"""
@@ -129,6 +131,12 @@ class InterestPointRequestSerializer(serializers.Serializer):
         default='corners',
         help_text="Type of interest point detection to perform"
     )
+    plot_area_only = serializers.BooleanField(
+        allow_null=True,
+        default=None,
+        help_text="Only search the plot area bounded by the chart axes (skips title, legend and tick labels); "
+                  "defaults to the extractor's crop_plot_area option"
+    )
 
 
 class InterestPointResponseSerializer(serializers.Serializer):
@@ -140,3 +148,33 @@ class InterestPointResponseSerializer(serializers.Serializer):
     detection_type = serializers.CharField(help_text="Type of detection performed")
     image_url = serializers.URLField(help_text="URL to the uploaded image")
     processing_time = serializers.FloatField(help_text="Time taken for detection in seconds")
+
+
+class InterestPointQuerySerializer(serializers.Serializer):
+    """Filters for querying stored interest points"""
+    type = serializers.MultipleChoiceField(
+        choices=InterestPoint.TYPE_CHOICES,
+        required=False,
+        help_text="Point types to return (repeat the parameter for several types)"
+    )
+    since = serializers.DateTimeField(required=False, help_text="Images uploaded at or after this time")
+    last_days = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        help_text="Images uploaded during the last N days (ignored when since is given)"
+    )
+    image = serializers.CharField(required=False, max_length=64, help_text="Content hash (SHA-256) of one image")
+    x_min = serializers.FloatField(required=False, help_text="Minimum x (inclusive)")
+    x_max = serializers.FloatField(required=False, help_text="Maximum x (inclusive)")
+    y_gt = serializers.FloatField(required=False, help_text="Only points with y strictly above this value")
+    y_lt = serializers.FloatField(required=False, help_text="Only points with y strictly below this value")
+
+
+class StoredInterestPointSerializer(serializers.ModelSerializer):
+    """Serializer for stored interest points"""
+    image = serializers.CharField(source="image.content_hash")
+    uploaded_at = serializers.DateTimeField(source="image.uploaded_at")
+
+    class Meta:
+        model = InterestPoint
+        fields = ["type", "x", "y", "x_index", "image", "uploaded_at"]
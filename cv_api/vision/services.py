@@ -0,0 +1,159 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+# cv2, NumPy and SciPy are imported on first use only, so that management
+# commands and the template views do not pay for them
+from .cv_models.profiling import PipelineProfiler
+from .metrics import DEFAULT_BUCKETS, PipelineMetrics
+
+_result_cache = None
+_result_cache_lock = threading.Lock()
+_api_result_cache = None
+_api_result_cache_lock = threading.Lock()
+_cpu_executor = None
+_cpu_executor_lock = threading.Lock()
+_pipeline_metrics = None
+_pipeline_metrics_lock = threading.Lock()
+_extractors = {}
+_extractors_lock = threading.Lock()
+_opencv_configured = False
+
+
+def build_result_cache(config):
+    """Build a ResultCache from an INTEREST_POINT_CACHE-style dict (None disables caching)"""
+    if config is None:
+        return None
+    from .cv_models.result_cache import ResultCache
+    return ResultCache(
+        memory_items=config.get("MEMORY_ITEMS", 256),
+        disk_dir=config.get("DIR"),
+        disk_max_bytes=config.get("MAX_BYTES", 256 * 1024 * 1024),
+    )
+
+
+def get_result_cache():
+    """Process-wide result cache configured from settings.INTEREST_POINT_CACHE"""
+    global _result_cache
+    with _result_cache_lock:
+        if _result_cache is None:
+            _result_cache = build_result_cache(getattr(settings, "INTEREST_POINT_CACHE", None))
+        return _result_cache
+
+
+def get_api_result_cache():
+    """
+    Cache of the point lists paged by the JSON API, configured like
+    INTEREST_POINT_CACHE but separate from the process_image cache (own
+    memory tier, "api" subdirectory on disk): API results neither evict
+    pipeline results nor show up in their stats
+    """
+    global _api_result_cache
+    with _api_result_cache_lock:
+        if _api_result_cache is None:
+            config = getattr(settings, "INTEREST_POINT_CACHE", None)
+            if config is not None and config.get("DIR"):
+                config = dict(config, DIR=os.path.join(config["DIR"], "api"))
+            _api_result_cache = build_result_cache(config)
+        return _api_result_cache
+
+
+def get_cpu_executor():
+    """
+    Bounded thread pool for CPU-bound work (decoding, process_image) offloaded
+    by the async views; OpenCV releases the GIL so threads run in parallel.
+    """
+    global _cpu_executor
+    with _cpu_executor_lock:
+        if _cpu_executor is None:
+            _cpu_executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "INTEREST_POINT_ASYNC_WORKERS", 4),
+                thread_name_prefix="vision-cpu",
+            )
+        return _cpu_executor
+
+
+def get_pipeline_metrics():
+    """Process-wide per-stage metrics configured from settings.INTEREST_POINT_METRICS"""
+    global _pipeline_metrics
+    with _pipeline_metrics_lock:
+        if _pipeline_metrics is None:
+            config = getattr(settings, "INTEREST_POINT_METRICS", {})
+            _pipeline_metrics = PipelineMetrics(buckets=config.get("BUCKETS", DEFAULT_BUCKETS))
+        return _pipeline_metrics
+
+
+def new_profiler():
+    """
+    PipelineProfiler for one request (memory and RSS tracking per
+    INTEREST_POINT_METRICS). Requests share the process, so the RSS peak is
+    never reset here: it is the process peak since startup (rss_scope
+    "process" in the profile).
+    """
+    config = getattr(settings, "INTEREST_POINT_METRICS", {})
+    return PipelineProfiler(track_memory=config.get("TRACK_MEMORY", False),
+                            track_rss=config.get("TRACK_RSS", False))
+
+
+def get_memory_budget():
+    """Per-request MemoryBudget configured from settings.INTEREST_POINT_MEMORY"""
+    from .memory import MemoryBudget
+    return MemoryBudget.from_config(getattr(settings, "INTEREST_POINT_MEMORY", {}))
+
+
+def configure_opencv(config=None):
+    """
+    Apply an INTEREST_POINT_OPENCV-style dict once per process: OpenCV's
+    internal thread count (None keeps OpenCV's default) and optimized code paths
+    """
+    global _opencv_configured
+    if _opencv_configured:
+        return
+    import cv2
+
+    if config is None:
+        config = getattr(settings, "INTEREST_POINT_OPENCV", {})
+    if config.get("NUM_THREADS") is not None:
+        cv2.setNumThreads(config["NUM_THREADS"])
+    cv2.setUseOptimized(config.get("USE_OPTIMIZED", True))
+    _opencv_configured = True
+
+
+def build_extractor(config, cache=None):
+    """
+    InterestPointExtractor from an INTEREST_POINT_EXTRACTORS entry: OPTIONS
+    are passed to the constructor, `cache` is used unless CACHE is False
+    """
+    from .cv_models.pointinteret import InterestPointExtractor
+    return InterestPointExtractor(cache=cache if config.get("CACHE", True) else None, **config.get("OPTIONS", {}))
+
+
+def get_extractor(name="default"):
+    """
+    Process-wide InterestPointExtractor configured by
+    settings.INTEREST_POINT_EXTRACTORS[name], shared by every request
+    """
+    with _extractors_lock:
+        extractor = _extractors.get(name)
+        if extractor is None:
+            configure_opencv()
+            config = getattr(settings, "INTEREST_POINT_EXTRACTORS", {}).get(name, {})
+            cache = get_result_cache() if config.get("CACHE", True) else None
+            extractor = _extractors[name] = build_extractor(config, cache)
+        return extractor
+
+
+def warm_up():
+    """
+    Build and warm every configured extractor so the first request does not
+    pay for imports and OpenCV initialisation (called by the WSGI/ASGI entry
+    points when settings.INTEREST_POINT_WARMUP is set)
+    """
+    if not getattr(settings, "INTEREST_POINT_WARMUP", False):
+        return
+    from . import uploads  # noqa: F401  (decoding stack used by the views)
+
+    for name in getattr(settings, "INTEREST_POINT_EXTRACTORS", {"default": {}}):
+        get_extractor(name).warm_up()
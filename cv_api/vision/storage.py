@@ -0,0 +1,98 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File storage that writes each blob once, under the hash of its content.
+
+    Uploads are streamed to disk chunk by chunk while being hashed, so large
+    files are never held in memory. Saving bytes that already exist returns a
+    reference to the existing blob instead of writing a new copy. The name
+    passed to save() only contributes its extension.
+    """
+    blob_prefix = "uploads/blobs"
+
+    def blob_name(self, digest, name):
+        ext = os.path.splitext(name)[1].lower()
+        return f"{self.blob_prefix}/{digest[:2]}/{digest}{ext}"
+
+    def content_hash(self, name):
+        """SHA-256 of a blob, read from its name (None for names outside the blob tree)"""
+        if not name.startswith(self.blob_prefix + "/"):
+            return None
+        return os.path.splitext(os.path.basename(name))[0]
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is derived from the content in _save, never from the client name
+        return name
+
+    def _save(self, name, content):
+        hasher = hashlib.sha256()
+
+        if hasattr(content, "temporary_file_path"):
+            # Large uploads are already on disk: hash them, then move instead of copying
+            for chunk in content.chunks():
+                hasher.update(chunk)
+            final_name = self.blob_name(hasher.hexdigest(), name)
+            full_path = self.path(final_name)
+            if not os.path.exists(full_path):
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                file_move_safe(content.temporary_file_path(), full_path)
+                self._apply_permissions(full_path)
+            return final_name
+
+        tmp_dir = self.path(self.blob_prefix)
+        os.makedirs(tmp_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                for chunk in content.chunks():
+                    hasher.update(chunk)
+                    tmp.write(chunk)
+            final_name = self.blob_name(hasher.hexdigest(), name)
+            full_path = self.path(final_name)
+            if os.path.exists(full_path):
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                os.replace(tmp_path, full_path)
+                self._apply_permissions(full_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return final_name
+
+    def save_buffer(self, name, buffer):
+        """
+        Save bytes that are already in memory (or memory-mapped) without
+        another read of the upload; returns the blob name.
+        """
+        final_name = self.blob_name(hashlib.sha256(buffer).hexdigest(), name)
+        full_path = self.path(final_name)
+        if os.path.exists(full_path):
+            return final_name
+
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(full_path), suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(buffer)
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._apply_permissions(full_path)
+        return final_name
+
+    def _apply_permissions(self, full_path):
+        if self.file_permissions_mode is not None:
+            os.chmod(full_path, self.file_permissions_mode)
@@ -0,0 +1,60 @@
+import json
+
+from django.test import TestCase, override_settings
+
+from .. import services
+from .utils import MediaTestMixin, upload
+
+
+class InterestPointApiTests(MediaTestMixin, TestCase):
+    def post(self, **params):
+        response = self.client.post("/api/interest-points/?page_size=10", {"image": upload(), **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def page(self, result_id, number=2):
+        response = self.client.get(f"/api/interest-points/{result_id}/?page={number}&page_size=10")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_api_pages_through_cached_result(self):
+        data = self.post()
+        self.assertEqual(len(data["points"]), min(10, data["count"]))
+        self.assertIsNotNone(data["next"])
+        self.assertIn("profile", data)
+
+        page = self.page(data["result_id"])
+        self.assertEqual(page["count"], data["count"])
+        self.assertNotIn("profile", page)
+
+    def test_pages_are_recomputed_when_the_entry_is_gone(self):
+        data = self.post(plot_area_only=True)
+        expected = self.page(data["result_id"])
+        services.get_api_result_cache().clear()
+        page = self.page(data["result_id"])
+        self.assertEqual(page["points"], expected["points"])
+        self.assertEqual(page["plot_area"], data["plot_area"])
+
+    def test_pages_without_cache(self):
+        with override_settings(INTEREST_POINT_CACHE=None):
+            self._reset_services()
+            data = self.post()
+            page = self.page(data["result_id"])
+        self.assertEqual(page["count"], data["count"])
+        self.assertEqual(len(page["points"]), min(10, data["count"] - 10))
+
+    def test_api_results_do_not_use_the_pipeline_cache(self):
+        self.page(self.post()["result_id"])
+        self.assertEqual(services.get_result_cache().stats()["memory_items"], 0)
+        self.assertEqual(services.get_api_result_cache().stats()["hits_memory"], 1)
+        stats = self.client.get("/interest-point/cache/stats/").json()
+        self.assertEqual((stats["hits_memory"], stats["hits_disk"], stats["misses"]), (0, 0, 0))
+
+    def test_stream_and_unknown_result(self):
+        data = self.post()
+        response = self.client.get(f"/api/interest-points/{data['result_id']}/?stream=1")
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(lines[0]["count"], data["count"])
+        self.assertEqual(len(lines), data["count"] + 1)
+        self.assertEqual(self.client.get("/api/interest-points/unknown/").status_code, 404)
+        self.assertEqual(self.client.get(f"/api/interest-points/{data['result_id']}x/").status_code, 404)
@@ -0,0 +1,39 @@
+import threading
+from unittest import mock
+
+from django.test import TestCase
+
+from .. import views
+from ..models import ProcessedImage
+from .utils import MediaTestMixin, upload
+
+
+class AsyncInterestPointViewTests(MediaTestMixin, TestCase):
+    async def test_async_view_matches_sync_view(self):
+        expected = (await self.async_client.post("/interest-point/", {"image": upload()})).context["points"]
+        response = await self.async_client.post("/interest-point/async/", {"image": upload()})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["success"])
+        self.assertEqual(response.context["points"], expected)
+        self.assertEqual(await ProcessedImage.objects.acount(), 1)
+
+    async def test_extractor_is_built_off_the_event_loop(self):
+        threads = []
+
+        def get_extractor():
+            threads.append(threading.current_thread().name)
+            return real_get_extractor()
+
+        real_get_extractor = views.get_extractor
+        with mock.patch.object(views, "get_extractor", get_extractor):
+            response = await self.async_client.post("/interest-point/async/", {"image": upload()})
+        self.assertTrue(response.context["success"])
+        self.assertTrue(threads)
+        self.assertTrue(all(name.startswith("vision-cpu") for name in threads), threads)
+
+    async def test_unreadable_image_renders_error(self):
+        with self.assertLogs("vision.views", "ERROR"):
+            response = await self.async_client.post("/interest-point/async/",
+                                                    {"image": upload("notes.png", b"not an image")})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["error"], "Could not read the image file")
@@ -0,0 +1,64 @@
+import io
+import json
+import os
+import zipfile
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TransactionTestCase, override_settings
+
+from .. import uploads
+from ..models import ProcessedImage
+from .utils import JobQueueTestMixin, chart_png, upload
+
+CRASH_PNG = chart_png(seed=7)
+_decode_image = uploads.decode_image
+
+
+def decode_or_crash(buffer, *args, **kwargs):
+    """decode_image that kills its worker process on CRASH_PNG"""
+    if bytes(buffer) == CRASH_PNG:
+        os._exit(1)
+    return _decode_image(buffer, *args, **kwargs)
+
+
+class BatchTests(JobQueueTestMixin, TransactionTestCase):
+    # Workers inherit the patched decode_image
+    start_method = "fork"
+
+    def post_batch(self, *files):
+        response = self.client.post("/interest-point/batch/", {"images": list(files)})
+        self.assertEqual(response.status_code, 200)
+        records = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        return {record["name"]: record for record in records[:-1]}, records[-1]
+
+    def test_batch_streams_results_and_summary(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("a.png", chart_png(seed=1))
+            zf.writestr("big.png", b"\0" * (256 * 1024))
+            zf.writestr("b.png", chart_png(seed=2))
+            zf.writestr("c.png", chart_png(seed=3))
+        settings_jobs = {"BATCH_MAX_FILES": 3, "BATCH_MAX_MEMBER_SIZE": 128 * 1024}
+        with override_settings(INTEREST_POINT_JOBS=settings_jobs):
+            by_name, summary = self.post_batch(
+                SimpleUploadedFile("charts.zip", archive.getvalue(), content_type="application/zip"))
+        self.assertEqual(summary, {"summary": True, "count": 3, "done": 2, "failed": 1,
+                                   "truncated": True, "max_files": 3})
+        self.assertEqual(by_name["a.png"]["status"], "done")
+        self.assertEqual(by_name["big.png"]["status"], "failed")
+        self.assertNotIn("c.png", by_name)
+        self.assertEqual(ProcessedImage.objects.count(), 2)
+
+    @mock.patch("vision.uploads.decode_image", decode_or_crash)
+    def test_crashing_image_fails_alone(self):
+        by_name, summary = self.post_batch(upload("a.png", chart_png(seed=1)), upload("crash.png", CRASH_PNG),
+                                           upload("b.png", chart_png(seed=2)), upload("c.png", chart_png(seed=3)))
+        self.assertEqual(summary["done"], 3)
+        self.assertEqual(summary["failed"], 1)
+        self.assertEqual(by_name["crash.png"]["status"], "failed")
+        self.assertIn("exited unexpectedly", by_name["crash.png"]["error"])
+        # The broken pool was replaced: a later batch and jobs still run
+        by_name, summary = self.post_batch(upload("d.png", chart_png(seed=4)))
+        self.assertEqual(by_name["d.png"]["status"], "done")
+        self.assertEqual(self.submit_and_wait()["status"], "done")
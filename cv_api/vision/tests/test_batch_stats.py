@@ -0,0 +1,44 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from ..cv_models.pointinteret import InterestPointExtractor
+
+
+class BatchStatsTests(SimpleTestCase):
+    def setUp(self):
+        self.extractor = InterestPointExtractor()
+        self.targets = self.extractor.define_targets("graph2D")
+        rng = np.random.default_rng(0)
+        self.series = [np.cumsum(rng.normal(size=n)) for n in (300, 500, 300, 1)]
+
+    def per_series(self, series_id, series):
+        return [(series_id, x, y, label)
+                for x, y, label in self.extractor.extract_points_with_stats(series, self.targets).to_tuples()]
+
+    def batch(self, data):
+        out = self.extractor.extract_points_with_stats_batch(data, self.targets)
+        return list(zip(out["series"].tolist(), out["x"].tolist(), out["y"].tolist(), out["type"].tolist()))
+
+    def test_ragged_lists_match_per_series_extraction(self):
+        expected = [point for i, series in enumerate(self.series[:3]) for point in self.per_series(i, series)]
+        self.assertEqual(self.batch([series.tolist() for series in self.series[:3]]), expected)
+
+    def test_2d_array_matches_per_series_extraction(self):
+        block = np.stack([self.series[0], self.series[2]])
+        expected = self.per_series(0, block[0]) + self.per_series(1, block[1])
+        self.assertEqual(self.batch(block), expected)
+
+    def test_single_series_as_list_or_1d_array(self):
+        expected = self.per_series(0, self.series[1])
+        self.assertEqual(self.batch(self.series[1]), expected)
+        self.assertEqual(self.batch(self.series[1].tolist()), expected)
+
+    def test_too_short_and_empty_input(self):
+        self.assertEqual(self.batch([self.series[3]]), [])
+        self.assertEqual(self.batch([]), [])
+
+    def test_3d_input_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.batch(np.zeros((2, 3, 4)))
+        with self.assertRaises(ValueError):
+            self.batch([np.zeros((3, 4))])
@@ -0,0 +1,32 @@
+from django.test import SimpleTestCase
+
+from benchmarks.charts import make_histogram_chart, make_line_chart
+
+from ..cv_models.analysis_context import ImageAnalysisContext
+from ..cv_models.pointinteret import InterestPointExtractor
+
+
+class PyramidClassificationTests(SimpleTestCase):
+    def test_pyramid_agrees_with_full_resolution_on_charts(self):
+        full = InterestPointExtractor()
+        reduced = InterestPointExtractor(classify_max_side=512)
+        images = [(f"{make.__name__}_{seed}", make(1920, 1080, seed=seed))
+                  for make in (make_line_chart, make_histogram_chart) for seed in range(2)]
+        for name, image in images:
+            with self.subTest(image=name):
+                self.assertEqual(reduced.identify_visual_type(image), full.identify_visual_type(image))
+
+    def test_pyramid_levels_are_cached_on_the_context(self):
+        context = ImageAnalysisContext(make_line_chart(1600, 1200, seed=1))
+        level = context.downscaled(2)
+        self.assertEqual(level.scale, 0.25)
+        self.assertEqual(level.gray.shape, (300, 400))
+        self.assertIs(context.downscaled(2), level)
+        self.assertIs(context.downscaled(0), context)
+        InterestPointExtractor(classify_max_side=512).identify_visual_type(context.image, context)
+        self.assertIn(2, context._levels)
+
+    def test_small_image_is_classified_at_full_resolution(self):
+        image = make_line_chart(400, 300, seed=2)
+        self.assertEqual(InterestPointExtractor(classify_max_side=512).identify_visual_type(image),
+                         InterestPointExtractor().identify_visual_type(image))
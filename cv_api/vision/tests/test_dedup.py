@@ -0,0 +1,30 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from benchmarks.bench_dedup import quadratic_dedup
+
+from ..cv_models.dedup import suppress_duplicates
+
+
+class SuppressDuplicatesTests(SimpleTestCase):
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.xs = rng.integers(0, 2500, 1000)
+        self.ys = rng.integers(0, 200, 1000)
+
+    def test_grid_matches_quadratic_loop(self):
+        kept = suppress_duplicates(self.xs, self.ys, 5)
+        self.assertEqual(kept.tolist(), quadratic_dedup(self.xs.tolist(), 5))
+
+    def test_radius_2d_matches_quadratic_loop(self):
+        kept = suppress_duplicates(self.xs, self.ys, 5, radius_2d=True)
+        self.assertEqual(kept.tolist(), quadratic_dedup(self.xs.tolist(), 5, ys=self.ys.tolist()))
+
+    def test_fractional_coordinates_and_negative_cells(self):
+        xs = np.random.default_rng(3).uniform(-50, 50, 400)
+        kept = suppress_duplicates(xs, np.zeros(len(xs)), 2.5)
+        self.assertEqual(kept.tolist(), quadratic_dedup(xs.tolist(), 2.5))
+
+    def test_empty_input_and_zero_distance_keep_everything(self):
+        self.assertEqual(suppress_duplicates([], [], 5).tolist(), [])
+        self.assertEqual(suppress_duplicates([1, 1, 1], [0, 0, 0], 0).tolist(), [0, 1, 2])
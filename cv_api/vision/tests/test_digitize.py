@@ -0,0 +1,64 @@
+import cv2
+import numpy as np
+from django.test import SimpleTestCase
+
+from ..cv_models.analysis_context import ImageAnalysisContext
+from ..cv_models.digitize import digitize_curves
+from ..cv_models.pointinteret import InterestPointExtractor
+
+WIDTH, HEIGHT = 800, 600
+PLOT_AREA = (60, 40, 760, 540)
+
+
+def curve_heights(phase):
+    """Height above the x axis of a test curve, for every column of the plot area"""
+    xs = np.arange(PLOT_AREA[0], PLOT_AREA[2])
+    return xs, 250 + 150 * np.sin(np.linspace(0, 3 * np.pi, len(xs)) + phase)
+
+
+def chart(colors):
+    image = np.full((HEIGHT, WIDTH, 3), 255, np.uint8)
+    x0, y0, x1, y1 = PLOT_AREA
+    cv2.line(image, (x0 - 2, y0), (x0 - 2, y1 + 2), (0, 0, 0), 2)
+    cv2.line(image, (x0 - 2, y1 + 2), (x1, y1 + 2), (0, 0, 0), 2)
+    for phase, color in enumerate(colors):
+        xs, heights = curve_heights(phase)
+        points = np.stack([xs, y1 - heights], axis=1).round().astype(np.int32)
+        cv2.polylines(image, [points], False, color, 2)
+    return image
+
+
+class DigitizeCurvesTests(SimpleTestCase):
+    def test_coloured_curves_are_separated_by_hue(self):
+        curves = digitize_curves(ImageAnalysisContext(chart([(0, 0, 255), (255, 0, 0)])), PLOT_AREA)
+        self.assertEqual(len(curves), 2)
+        self.assertEqual({curve.to_dict()["color"] for curve in curves}, {"#ff0000", "#0000ff"})
+        for curve in curves:
+            phase = 0 if curve.color[2] > curve.color[0] else 1
+            xs, heights = curve_heights(phase)
+            expected = np.interp(curve.x_values, xs, heights)
+            # Within the stroke width, a little more where the curves cross
+            self.assertLess(np.median(np.abs(curve.y_values - expected)), 1.5)
+            self.assertLess(np.abs(curve.y_values - expected).max(), 4)
+            self.assertGreater(curve.coverage, 0.9)
+
+    def test_dark_curve_without_colour(self):
+        curves = digitize_curves(ImageAnalysisContext(chart([(40, 40, 40)])), PLOT_AREA)
+        self.assertEqual(len(curves), 1)
+        self.assertIsNone(curves[0].color)
+        self.assertEqual(curves[0].to_dict()["x_range"], [PLOT_AREA[0], PLOT_AREA[2] - 1])
+
+    def test_max_curves_and_empty_area(self):
+        image = chart([(0, 0, 255), (255, 0, 0), (0, 160, 0)])
+        self.assertEqual(len(digitize_curves(ImageAnalysisContext(image), PLOT_AREA, max_curves=2)), 2)
+        self.assertEqual(digitize_curves(ImageAnalysisContext(image), (10, 10, 10, 10)), [])
+
+    def test_process_image_extracts_points_per_curve(self):
+        image = chart([(0, 0, 255), (255, 0, 0)])
+        result = InterestPointExtractor(digitize=True).process_image(image, output="result")
+        self.assertEqual(result.visual_type, "graph2D")
+        self.assertEqual(len(result.curves), 2)
+        self.assertEqual({point["curve"] for point in result.points}, {0, 1})
+        maxima = [point for point in result.points if point["type"] == "maximum" and point["curve"] == 0]
+        self.assertTrue(maxima)
+        self.assertTrue(all(point["y_value"] > 350 for point in maxima))
@@ -0,0 +1,55 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TransactionTestCase
+
+from ..models import InterestPointJob
+from .utils import JobQueueTestMixin, upload
+
+
+class JobQueueTests(JobQueueTestMixin, TransactionTestCase):
+    def test_job_matches_page_view(self):
+        expected = self.client.post("/interest-point/", {"image": upload()}).context["points"]
+        data = self.submit_and_wait()
+        self.assertEqual(data["status"], InterestPointJob.STATUS_DONE)
+        self.assertEqual(data["result"]["interest_points"], expected)
+
+    def test_full_queue_is_rejected(self):
+        InterestPointJob.objects.bulk_create(
+            [InterestPointJob(image_path="missing.png", status=InterestPointJob.STATUS_RUNNING,
+                              owner="elsewhere:1") for _ in range(4)])
+        response = self.client.post("/interest-point/jobs/", {"image": upload()})
+        self.assertEqual(response.status_code, 429)
+
+    def test_invalid_upload_is_rejected_before_queueing(self):
+        response = self.client.post("/interest-point/jobs/", {
+            "image": SimpleUploadedFile("notes.png", b"not an image", content_type="image/png"),
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(InterestPointJob.objects.exists())
+
+    def test_recover_fails_orphaned_jobs(self):
+        orphan = InterestPointJob.objects.create(image_path="missing.png", status=InterestPointJob.STATUS_RUNNING)
+        elsewhere = InterestPointJob.objects.create(image_path="missing.png", status=InterestPointJob.STATUS_RUNNING,
+                                                    owner="elsewhere:1")
+        self.queue.recover()
+        orphan.refresh_from_db()
+        elsewhere.refresh_from_db()
+        self.assertEqual(orphan.status, InterestPointJob.STATUS_FAILED)
+        self.assertEqual(elsewhere.status, InterestPointJob.STATUS_RUNNING)
+
+    def test_pending_jobs_run_in_submission_order(self):
+        first = self.client.post("/interest-point/jobs/", {"image": upload()}).json()
+        second = self.client.post("/interest-point/jobs/", {"image": upload("other.png")}).json()
+        self.assertEqual(self.wait_for(second["status_url"])["status"], InterestPointJob.STATUS_DONE)
+        self.assertEqual(self.wait_for(first["status_url"])["status"], InterestPointJob.STATUS_DONE)
+        first_job, second_job = (InterestPointJob.objects.get(pk=data["job_id"]) for data in (first, second))
+        self.assertLessEqual(first_job.started_at, second_job.started_at)
+
+
+class SpawnedWorkerTests(JobQueueTestMixin, TransactionTestCase):
+    """Workers started without fork do not inherit the loaded Django app registry"""
+    start_method = "spawn"
+
+    def test_job_runs_in_a_spawned_worker(self):
+        data = self.submit_and_wait()
+        self.assertEqual(data["status"], InterestPointJob.STATUS_DONE, data.get("error"))
+        self.assertTrue(data["result"]["interest_points"])
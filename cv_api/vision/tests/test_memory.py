@@ -0,0 +1,111 @@
+from unittest import mock
+
+import cv2
+import numpy as np
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from ..cv_models.profiling import PipelineProfiler
+from ..cv_models.results import InterestPointResult
+from ..memory import ImageTooLarge, MemoryBudget
+from ..models import ProcessedImage
+from ..uploads import decode_image, image_dimensions
+from .utils import MediaTestMixin, chart_png, upload
+
+
+def encode(ext, width=2000, height=1500):
+    image = np.zeros((height, width, 3), np.uint8)
+    cv2.circle(image, (width // 2, height // 2), height // 3, (255, 255, 255), -1)
+    return cv2.imencode(ext, image)[1].tobytes()
+
+
+class MemoryBudgetTests(SimpleTestCase):
+    def test_downscale_factor(self):
+        budget = MemoryBudget(max_pixels=1_000_000)
+        self.assertEqual(budget.downscale_factor(1000, 1000), 1)
+        self.assertAlmostEqual(budget.downscale_factor(4000, 1000), 2)
+        self.assertEqual(MemoryBudget(max_bytes=24_000_000).pixel_limit, 1_000_000)
+        self.assertIsNone(MemoryBudget().pixel_limit)
+
+    def test_jpeg_is_decoded_reduced_within_budget(self):
+        budget = MemoryBudget(max_pixels=500_000)
+        with mock.patch("vision.uploads.cv2.imdecode", wraps=cv2.imdecode) as imdecode:
+            image, factor = decode_image(encode(".jpg"), budget=budget)
+        self.assertEqual(imdecode.call_args[0][1], cv2.IMREAD_REDUCED_COLOR_2)
+        self.assertLessEqual(image.shape[0] * image.shape[1], 500_000)
+        self.assertAlmostEqual(factor, 2000 / image.shape[1], places=6)
+
+    def test_full_decode_over_max_bytes_is_rejected(self):
+        with self.assertRaises(ImageTooLarge):
+            decode_image(encode(".png"), budget=MemoryBudget(max_bytes=4_000_000))
+        # JPEG is scaled while decoding, so the same budget is accepted
+        image, _ = decode_image(encode(".jpg"), budget=MemoryBudget(max_bytes=4_000_000))
+        self.assertIsNotNone(image)
+
+    def test_pillow_reads_the_other_headers(self):
+        data = encode(".tiff")
+        self.assertEqual(image_dimensions(data), (2000, 1500))
+        image, factor = decode_image(data, budget=MemoryBudget(max_pixels=750_000))
+        self.assertLessEqual(image.shape[0] * image.shape[1], 750_000)
+        self.assertGreater(factor, 1)
+
+    def test_unknown_size_is_not_decoded_under_a_budget(self):
+        data = cv2.imencode(".hdr", np.zeros((1500, 2000, 3), np.float32))[1].tobytes()
+        self.assertIsNone(image_dimensions(data))
+        with mock.patch("vision.uploads.cv2.imdecode") as imdecode:
+            self.assertEqual(decode_image(data, budget=MemoryBudget(max_pixels=750_000)), (None, 1))
+        imdecode.assert_not_called()
+        self.assertIsNotNone(decode_image(data)[0])
+
+
+class RescaledResultTests(SimpleTestCase):
+    def test_only_pixel_coordinates_are_scaled(self):
+        result = InterestPointResult([
+            {"type": "corner", "x": 10, "y": 20},
+            {"type": "maximum", "x_index": 3, "x_value": 0.5, "y_value": 7.0},
+        ])
+        self.assertEqual(result.rescaled(2).points, [
+            {"type": "corner", "x": 20, "y": 40},
+            {"type": "maximum", "x_index": 3, "x_value": 0.5, "y_value": 7.0},
+        ])
+
+    def test_digitized_values_are_pixels(self):
+        result = InterestPointResult([{"type": "maximum", "x_index": 3, "x_value": 50, "y_value": 7.5, "curve": 0}],
+                                     curves=[{"color": None, "x_range": [40, 90], "samples": 51, "coverage": 1.0}])
+        rescaled = result.rescaled(2)
+        self.assertEqual(rescaled.points, [{"type": "maximum", "x_index": 3, "x_value": 100, "y_value": 15.0,
+                                            "curve": 0}])
+        self.assertEqual(rescaled.curves[0]["x_range"], [80, 180])
+        self.assertEqual(rescaled.decode_factor, 2)
+
+
+class PeakRssScopeTests(SimpleTestCase):
+    def test_scope(self):
+        self.assertNotIn("rss_scope", PipelineProfiler().to_dict())
+        self.assertEqual(PipelineProfiler(track_rss=True).to_dict()["rss_scope"], "process")
+        with mock.patch("vision.cv_models.profiling.reset_peak_rss", return_value=True):
+            self.assertEqual(PipelineProfiler(track_rss=True, reset_rss=True).to_dict()["rss_scope"], "call")
+        with mock.patch("vision.cv_models.profiling.reset_peak_rss", return_value=False):
+            self.assertEqual(PipelineProfiler(track_rss=True, reset_rss=True).to_dict()["rss_scope"], "process")
+
+
+class DownscaledViewTests(MediaTestMixin, TestCase):
+    def test_downscaled_decode_reports_original_coordinates(self):
+        content = chart_png(1600, 1200)
+        full = self.client.post("/interest-point/", {"image": upload(content=content)}).context["points"]
+        with override_settings(INTEREST_POINT_MAX_SIDE=400):
+            response = self.client.post("/interest-point/", {"image": upload(content=content)})
+        self.assertEqual(response.context["decode_factor"], 4)
+        reduced = response.context["points"]
+        self.assertAlmostEqual(max(p["x_value"] for p in reduced), max(p["x_value"] for p in full), delta=16)
+        self.assertEqual(ProcessedImage.objects.get().decode_factor, 4)
+
+    def test_page_labels_the_process_peak(self):
+        with override_settings(INTEREST_POINT_METRICS={"TRACK_RSS": True}):
+            response = self.client.post("/interest-point/", {"image": upload()})
+        self.assertEqual(response.context["profile"]["rss_scope"], "process")
+        self.assertContains(response, "Process Peak Memory")
+
+    def test_api_rejects_images_over_budget(self):
+        with override_settings(INTEREST_POINT_MEMORY={"MAX_BYTES": 200_000}):
+            response = self.client.post("/api/interest-points/", {"image": upload()})
+        self.assertEqual(response.status_code, 413)
@@ -0,0 +1,65 @@
+import tracemalloc
+
+import numpy as np
+from django.test import SimpleTestCase, TestCase
+
+from .. import services
+from ..cv_models.profiling import PipelineProfiler
+from ..metrics import PipelineMetrics
+from .utils import MediaTestMixin, upload
+
+
+class PipelineProfilerTests(SimpleTestCase):
+    def test_stages_are_recorded_in_order(self):
+        profiler = PipelineProfiler()
+        with profiler.stage("decode"):
+            pass
+        with profiler.stage("filter") as stage:
+            stage.points = 3
+        data = profiler.to_dict()
+        self.assertEqual([stage["stage"] for stage in data["stages"]], ["decode", "filter"])
+        self.assertEqual(data["stages"][1]["points"], 3)
+        self.assertNotIn("points", data["stages"][0])
+        self.assertNotIn("peak_rss_bytes", data)
+        self.assertAlmostEqual(data["total_seconds"], sum(stage["seconds"] for stage in data["stages"]), places=5)
+
+    def test_track_memory_reports_stage_peak(self):
+        if not tracemalloc.is_tracing():
+            self.addCleanup(tracemalloc.stop)
+        profiler = PipelineProfiler(track_memory=True)
+        with profiler.stage("alloc"):
+            block = np.ones(1 << 20, np.uint8)
+            del block
+        self.assertGreaterEqual(profiler.to_dict()["stages"][0]["peak_bytes"], 1 << 20)
+
+
+class PipelineMetricsTests(SimpleTestCase):
+    def test_render_histograms_and_counters(self):
+        metrics = PipelineMetrics(buckets=(0.01, 0.1))
+        for seconds in (0.005, 0.05, 1.0):
+            metrics.observe({"stages": [{"stage": "filter", "seconds": seconds, "points": 2, "peak_bytes": 10}],
+                             "total_seconds": seconds})
+        lines = metrics.render().splitlines()
+        self.assertIn('vision_pipeline_stage_seconds_bucket{stage="filter",le="0.01"} 1', lines)
+        self.assertIn('vision_pipeline_stage_seconds_bucket{stage="filter",le="0.1"} 2', lines)
+        self.assertIn('vision_pipeline_stage_seconds_bucket{stage="filter",le="+Inf"} 3', lines)
+        self.assertIn('vision_pipeline_stage_seconds_count{stage="filter"} 3', lines)
+        self.assertIn("vision_pipeline_seconds_count 3", lines)
+        self.assertIn('vision_pipeline_stage_points_total{stage="filter"} 6', lines)
+        self.assertIn('vision_pipeline_stage_peak_bytes{stage="filter"} 10', lines)
+
+
+class MetricsEndpointTests(MediaTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        services._pipeline_metrics = None
+        self.addCleanup(setattr, services, "_pipeline_metrics", None)
+
+    def test_page_view_feeds_the_metrics(self):
+        self.client.post("/interest-point/", {"image": upload()})
+        response = self.client.get("/metrics/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        body = response.content.decode()
+        for stage in ("decode", "classify", "filter"):
+            self.assertIn(f'vision_pipeline_stage_seconds_count{{stage="{stage}"}} 1', body)
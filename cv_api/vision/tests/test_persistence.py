@@ -0,0 +1,49 @@
+from unittest import mock
+
+import numpy as np
+from django.db import OperationalError
+from django.test import TestCase
+
+from ..models import InterestPoint, ProcessedImage
+from .utils import MediaTestMixin, upload
+
+
+class PersistenceTests(MediaTestMixin, TestCase):
+    def post_page(self):
+        response = self.client.post("/interest-point/", {"image": upload()})
+        self.assertEqual(response.status_code, 200)
+        return response.context["points"]
+
+    def test_page_view_persists_points(self):
+        points = self.post_page()
+        self.assertTrue(points)
+        image = ProcessedImage.objects.get()
+        self.assertEqual(image.point_count, len(points))
+        self.assertEqual(image.points.count(), len(points))
+
+    def test_same_image_is_stored_once(self):
+        self.post_page()
+        self.post_page()
+        self.assertEqual(ProcessedImage.objects.count(), 1)
+        self.assertEqual(InterestPoint.objects.count(), ProcessedImage.objects.get().point_count)
+
+    def test_persistence_failure_still_returns_points(self):
+        with mock.patch("vision.persistence.ProcessedImage.objects.update_or_create",
+                        side_effect=OperationalError("database is locked")), \
+                self.assertLogs("vision.persistence", "ERROR"):
+            points = self.post_page()
+        self.assertTrue(points)
+        self.assertFalse(ProcessedImage.objects.exists())
+
+    def test_query_filters_stored_points(self):
+        self.post_page()
+        response = self.client.get("/api/interest-points/query/", {"type": "maximum"})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["count"], InterestPoint.objects.filter(type="maximum").count())
+        self.assertTrue(all(point["type"] == "maximum" for point in data["points"]))
+
+        y_gt = float(np.median([p["y"] for p in data["points"]]))
+        above = self.client.get("/api/interest-points/query/", {"type": "maximum", "y_gt": y_gt}).json()
+        self.assertTrue(all(point["y"] > y_gt for point in above["points"]))
+        self.assertEqual(self.client.get("/api/interest-points/query/", {"type": "bogus"}).status_code, 400)
@@ -0,0 +1,42 @@
+from unittest import mock
+
+import cv2
+import numpy as np
+from django.test import SimpleTestCase
+
+from ..cv_models.pointinteret import InterestPointExtractor
+from .utils import chart_png
+
+
+class PlanDetectorsTests(SimpleTestCase):
+    def setUp(self):
+        self.extractor = InterestPointExtractor()
+
+    def test_detectors_follow_targets(self):
+        graph_targets = self.extractor.define_targets("graph2D")
+        self.assertEqual(self.extractor.plan_detectors(graph_targets), ["corners", "edges"])
+        self.assertEqual(self.extractor.plan_detectors(self.extractor.define_targets("histogram")), ["edges"])
+        self.assertEqual(self.extractor.plan_detectors([], detection_type="blobs"), ["blobs"])
+
+    def test_detectors_whose_points_are_filtered_out_are_dropped(self):
+        for visual_type in ("graph2D", "histogram", "unknown"):
+            with self.subTest(visual_type=visual_type):
+                targets = self.extractor.define_targets(visual_type)
+                self.assertEqual(self.extractor.plan_detectors(targets, visual_type), [])
+
+    def test_pruned_plan_gives_the_same_result(self):
+        image = cv2.imdecode(np.frombuffer(chart_png(), np.uint8), cv2.IMREAD_COLOR)
+        data = {"x_values": list(range(80)), "y_values": np.sin(np.linspace(0, 8, 80)).tolist()}
+        pruned = self.extractor.process_image(image, data, output="result")
+        self.assertEqual(pruned.detector_timings, {})
+
+        plan = InterestPointExtractor.plan_detectors
+        with mock.patch.object(InterestPointExtractor, "plan_detectors",
+                               lambda extractor, targets, visual_type=None: plan(extractor, targets)):
+            full = self.extractor.process_image(image, data, output="result")
+        self.assertEqual(set(full.detector_timings), {"corners", "edges"})
+        self.assertEqual(full.points, pruned.points)
+
+    def test_unknown_detection_type(self):
+        with self.assertRaises(ValueError):
+            self.extractor.detect(np.zeros((10, 10, 3), np.uint8), "circles")
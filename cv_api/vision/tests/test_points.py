@@ -0,0 +1,68 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from ..cv_models.pointinteret import InterestPointExtractor
+from ..cv_models.points import PointArray
+
+
+def filter_tuples(points, visual_type, min_distance):
+    """Original list-of-tuples filter_points"""
+    keep = {"graph2D": ("maximum", "minimum", "inflection"), "histogram": ("maximum", "minimum")}
+    filtered = [point for point in points if point[2] in keep.get(visual_type, ())]
+    unique = []
+    for point in filtered:
+        if all(abs(point[0] - other[0]) >= min_distance for other in unique):
+            unique.append(point)
+    return unique
+
+
+def associate_tuples(points, extracted_data):
+    """Original list-of-tuples associate_with_data"""
+    associated = []
+    for x_idx, y_val, point_type in points:
+        if extracted_data and "x_values" in extracted_data and x_idx < len(extracted_data["x_values"]):
+            x_val = extracted_data["x_values"][x_idx]
+        else:
+            x_val = x_idx
+        associated.append({"type": point_type, "x_index": x_idx, "x_value": x_val, "y_value": y_val})
+    return associated
+
+
+class PointArrayTests(SimpleTestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        n = 2000
+        labels = ("corner", "maximum", "minimum", "inflection", "blob")
+        self.tuples = list(zip(rng.integers(0, 5000, n).tolist(), rng.normal(size=n).tolist(),
+                               rng.choice(labels, n).tolist()))
+        self.extractor = InterestPointExtractor()
+
+    def test_behaves_like_a_list_of_tuples(self):
+        points = PointArray.from_tuples(self.tuples)
+        self.assertEqual(len(points), len(self.tuples))
+        self.assertEqual(points[3], self.tuples[3])
+        self.assertEqual(list(points)[:5], self.tuples[:5])
+        self.assertEqual(points[10:20].to_tuples(), self.tuples[10:20])
+        self.assertEqual(PointArray.concat([points[:5], self.tuples[5:8]]).to_tuples(), self.tuples[:8])
+
+    def test_y_dtype(self):
+        self.assertEqual(PointArray([1], np.array([2], np.int32), [0]).y.dtype, np.float32)
+        self.assertEqual(PointArray([1], np.array([2], np.int64), [0]).y.dtype, np.float32)
+        self.assertEqual(PointArray([1], np.array([2.5], np.float32), [0]).y.dtype, np.float32)
+        # Statistical values keep their float64 precision
+        self.assertEqual(PointArray([1], np.array([2.5]), [0]).y.dtype, np.float64)
+        self.assertEqual(PointArray().y.dtype, np.float32)
+
+    def test_filter_points_matches_tuples(self):
+        for visual_type in ("graph2D", "histogram", "unknown"):
+            with self.subTest(visual_type=visual_type):
+                filtered = self.extractor.filter_points(PointArray.from_tuples(self.tuples), visual_type)
+                self.assertEqual(filtered.to_tuples(),
+                                 filter_tuples(self.tuples, visual_type, self.extractor.min_distance))
+
+    def test_associate_with_data_matches_tuples(self):
+        extracted_data = {"x_values": np.linspace(0, 1, 3000)}
+        points = PointArray.from_tuples(self.tuples)
+        self.assertEqual(self.extractor.associate_with_data(points, extracted_data),
+                         associate_tuples(self.tuples, {"x_values": extracted_data["x_values"].tolist()}))
+        self.assertEqual(self.extractor.associate_with_data(points, None), associate_tuples(self.tuples, None))
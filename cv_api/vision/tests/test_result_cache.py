@@ -0,0 +1,56 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..cv_models import result_cache
+from ..cv_models.result_cache import ResultCache
+
+
+class ResultCacheTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.disk_dir = tmp.name
+
+    def disk_files(self):
+        return sorted(name for name in os.listdir(self.disk_dir) if name.endswith(".json"))
+
+    def test_memory_then_disk_hits(self):
+        cache = ResultCache(memory_items=1, disk_dir=self.disk_dir)
+        cache.put("a", '{"a": 1}')
+        cache.put("b", '{"b": 2}')
+        self.assertEqual(cache.get("b"), '{"b": 2}')
+        # "a" left the memory LRU but is still on disk
+        self.assertEqual(cache.get("a"), '{"a": 1}')
+        self.assertIsNone(cache.get("c"))
+        stats = cache.stats()
+        self.assertEqual((stats["hits_memory"], stats["hits_disk"], stats["misses"]), (1, 1, 1))
+
+    def test_disk_evicted_down_to_low_water(self):
+        value = "x" * 100
+        cache = ResultCache(memory_items=1, disk_dir=self.disk_dir, disk_max_bytes=1000)
+        for i in range(11):
+            cache.put(f"k{i}", value)
+        self.assertLessEqual(cache.stats()["disk_bytes"], 1000 * result_cache.DISK_LOW_WATER)
+        self.assertEqual(len(self.disk_files()), 9)
+        # The most recent entries survive
+        self.assertEqual(cache.get("k10"), value)
+
+    def test_disk_write_error_falls_back_to_memory(self):
+        cache = ResultCache(disk_dir=self.disk_dir)
+        with mock.patch("vision.cv_models.result_cache.os.replace", side_effect=OSError("disk full")), \
+                self.assertLogs("vision.cv_models.result_cache", "WARNING"):
+            cache.put("a", '{"a": 1}')
+        self.assertEqual(cache.get("a"), '{"a": 1}')
+        self.assertEqual(os.listdir(self.disk_dir), [])
+        self.assertEqual(cache.stats()["disk_bytes"], 0)
+
+    def test_clear_empties_both_tiers(self):
+        cache = ResultCache(disk_dir=self.disk_dir)
+        cache.put("a", '{"a": 1}')
+        cache.clear()
+        self.assertEqual(self.disk_files(), [])
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["disk_bytes"], 0)
@@ -0,0 +1,53 @@
+import json
+
+import cv2
+import numpy as np
+from django.test import SimpleTestCase
+
+from ..cv_models.pointinteret import InterestPointExtractor
+from ..cv_models.results import InterestPointResult
+from .utils import chart_png
+
+
+class InterestPointResultTests(SimpleTestCase):
+    def setUp(self):
+        self.result = InterestPointResult(
+            points=[{"type": "maximum", "x_index": 3, "x_value": 1.5, "y_value": np.float32(2.5)},
+                    {"type": "corner", "x": np.int32(10), "y": 20}],
+            visual_type="graph2D", detector_timings={"corners": 0.01})
+
+    def test_dict_and_json_round_trip(self):
+        data = json.loads(self.result.to_json())
+        self.assertEqual(data["count"], 2)
+        self.assertEqual(data["visual_type"], "graph2D")
+        self.assertNotIn("decode_factor", data)
+        self.assertEqual(InterestPointResult.from_json(self.result.to_json()).to_dict(), data)
+        self.assertEqual(json.loads(self.result.to_json(indent=2)), data)
+
+    def test_error_result(self):
+        result = InterestPointResult(error="invalid")
+        self.assertEqual(result.to_dict(), {"error": "invalid"})
+        self.assertEqual(InterestPointResult.from_dict(result.to_dict()).error, "invalid")
+
+    def test_to_array_prefers_data_values(self):
+        array = self.result.to_array()
+        self.assertEqual(array.dtype.names, ("type", "x", "y"))
+        self.assertEqual(array["type"].tolist(), ["maximum", "corner"])
+        self.assertEqual(array["x"].tolist(), [1.5, 10.0])
+        self.assertEqual(array["y"].tolist(), [2.5, 20.0])
+
+
+class ProcessImageOutputTests(SimpleTestCase):
+    def test_result_mode_matches_json_mode(self):
+        extractor = InterestPointExtractor()
+        image = cv2.imdecode(np.frombuffer(chart_png(), np.uint8), cv2.IMREAD_COLOR)
+        data = {"x_values": list(range(50)), "y_values": np.sin(np.linspace(0, 6, 50)).tolist()}
+        result = extractor.process_image(image, data, output="result")
+        self.assertIsInstance(result, InterestPointResult)
+        expected = json.loads(extractor.process_image(image, data))
+        self.assertEqual(result.points, expected["interest_points"])
+        self.assertEqual(result.count, expected["count"])
+
+    def test_unknown_output_mode(self):
+        with self.assertRaises(ValueError):
+            InterestPointExtractor().process_image(None, output="xml")
@@ -0,0 +1,56 @@
+import numpy as np
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from benchmarks.charts import make_line_chart
+
+from ..cv_models.analysis_context import ImageAnalysisContext
+from ..cv_models.pointinteret import InterestPointExtractor
+from ..cv_models.roi import locate_plot_area
+from .utils import MediaTestMixin, upload
+
+
+class LocatePlotAreaTests(SimpleTestCase):
+    def test_plot_area_is_bounded_by_the_axes(self):
+        width, height = 1200, 800
+        context = ImageAnalysisContext(make_line_chart(width, height, n_points=20, seed=3, annotated=True))
+        x0, y0, x1, y1 = locate_plot_area(context)
+        margin_x, margin_y = width // 12, height // 8
+        self.assertTrue(margin_x < x0 <= margin_x + 12)
+        self.assertTrue(height - margin_y - 12 <= y1 < height - margin_y)
+        self.assertAlmostEqual(x1, width - margin_x, delta=4)
+        self.assertAlmostEqual(y0, margin_y, delta=4)
+
+    def test_pyramid_level_gives_original_coordinates(self):
+        context = ImageAnalysisContext(make_line_chart(1600, 1200, n_points=20, seed=3, annotated=True))
+        full, reduced = locate_plot_area(context), locate_plot_area(context.downscaled(1))
+        self.assertTrue(np.allclose(full, reduced, atol=8), (full, reduced))
+
+    def test_no_axes(self):
+        image = np.full((400, 600, 3), 255, np.uint8)
+        self.assertIsNone(locate_plot_area(ImageAnalysisContext(image)))
+
+    def test_cropped_extraction_stays_in_the_plot_area(self):
+        image = make_line_chart(1200, 800, n_points=20, seed=3, annotated=True)
+        context = ImageAnalysisContext(image)
+        x0, y0, x1, y1 = roi = locate_plot_area(context)
+        points = InterestPointExtractor().extract_points_with_cv(image, ["salient_points"], context, roi=roi)
+        self.assertTrue(len(points))
+        self.assertTrue(((points.x >= x0) & (points.x < x1) & (points.y >= y0) & (points.y < y1)).all())
+
+    def test_option_is_not_part_of_the_process_image_key(self):
+        self.assertEqual(InterestPointExtractor(crop_plot_area=True).cache_params(),
+                         InterestPointExtractor().cache_params())
+
+
+class PlotAreaApiTests(MediaTestMixin, TestCase):
+    def post(self, **params):
+        response = self.client.post("/api/interest-points/", {"image": upload(), **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_crop_plot_area_is_the_api_default(self):
+        self.assertNotIn("plot_area", self.post())
+        with override_settings(INTEREST_POINT_EXTRACTORS={"default": {"OPTIONS": {"crop_plot_area": True}}}):
+            self._reset_services()
+            self.assertIn("plot_area", self.post())
+            self.assertNotIn("plot_area", self.post(plot_area_only=False))
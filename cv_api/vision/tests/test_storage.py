@@ -0,0 +1,45 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.test import SimpleTestCase
+
+from ..storage import ContentAddressedStorage
+
+
+class ContentAddressedStorageTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.storage = ContentAddressedStorage(location=tmp.name)
+
+    def blobs(self):
+        root = self.storage.path(self.storage.blob_prefix)
+        return sorted(name for _, _, files in os.walk(root) for name in files)
+
+    def test_same_content_is_stored_once(self):
+        first = self.storage.save("uploads/a.PNG", ContentFile(b"chart"))
+        second = self.storage.save("uploads/other/b.png", ContentFile(b"chart"))
+        digest = hashlib.sha256(b"chart").hexdigest()
+        self.assertEqual(first, f"uploads/blobs/{digest[:2]}/{digest}.png")
+        self.assertEqual(second, first)
+        self.assertEqual(self.blobs(), [f"{digest}.png"])
+        self.assertEqual(self.storage.content_hash(first), digest)
+
+    def test_buffer_and_temporary_upload_share_the_blob(self):
+        name = self.storage.save_buffer("a.png", memoryview(b"chart"))
+        upload = TemporaryUploadedFile("b.png", "image/png", 5, None)
+        upload.write(b"chart")
+        upload.seek(0)
+        self.addCleanup(upload.close)
+        self.assertEqual(self.storage.save("b.png", upload), name)
+        self.assertEqual(self.storage.open(name).read(), b"chart")
+        self.assertEqual(len(self.blobs()), 1)
+
+    def test_different_content_gets_different_blobs(self):
+        self.assertNotEqual(self.storage.save("a.png", ContentFile(b"one")),
+                            self.storage.save("a.png", ContentFile(b"two")))
+        self.assertEqual(len(self.blobs()), 2)
+        self.assertIsNone(self.storage.content_hash("uploads/a.png"))
@@ -0,0 +1,39 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from ..cv_models.pointinteret import InterestPointExtractor
+from ..cv_models.streaming import StreamingInterestPointExtractor
+
+
+class StreamingExtractorTests(SimpleTestCase):
+    def setUp(self):
+        self.series = np.cumsum(np.random.default_rng(0).normal(size=3000))
+        self.extractor = InterestPointExtractor()
+        self.targets = self.extractor.define_targets("graph2D")
+
+    def stream(self, chunk, window):
+        stream = StreamingInterestPointExtractor(self.extractor, self.targets, window=window)
+        points = []
+        for start in range(0, len(self.series), chunk):
+            points.extend(stream.update(self.series[start:start + chunk]))
+        return points + stream.flush()
+
+    def test_streaming_matches_full_history(self):
+        expected = self.extractor.extract_points_with_stats(self.series, self.targets).to_tuples()
+        key = lambda point: (point[0], point[2])  # noqa: E731
+        self.assertEqual(sorted(self.stream(97, len(self.series)), key=key), sorted(expected, key=key))
+
+    def test_inflections_do_not_depend_on_the_window(self):
+        def inflections(points):
+            return sorted(point[0] for point in points if point[2] == "inflection")
+
+        self.assertEqual(inflections(self.stream(50, 64)), inflections(self.stream(500, 4096)))
+
+    def test_update_after_flush_is_rejected(self):
+        stream = StreamingInterestPointExtractor(self.extractor, self.targets)
+        stream.update(self.series[:100])
+        stream.flush()
+        with self.assertRaises(ValueError):
+            stream.update(self.series[100:200])
+        stream.reset()
+        self.assertEqual(stream.update(self.series[:5]), [])
@@ -0,0 +1,49 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from benchmarks.charts import make_line_chart
+
+from ..cv_models.analysis_context import ImageAnalysisContext
+from ..cv_models.pointinteret import InterestPointExtractor
+from ..cv_models.result_cache import ResultCache
+
+
+def noisy_chart():
+    # Noise breaks the response ties of synthetic charts, between which
+    # goodFeaturesToTrack and the tiled ranking may pick differently
+    image = make_line_chart(1600, 1200, n_points=40)
+    noise = np.random.default_rng(0).normal(0, 4, image.shape)
+    return np.clip(image + noise, 0, 255).astype(np.uint8)
+
+
+class TilingTests(SimpleTestCase):
+    def test_tiled_corners_match_global_extraction(self):
+        image = noisy_chart()
+        context = ImageAnalysisContext(image)
+
+        def corners(points):
+            points = points[points.mask_types(["corner"])]
+            return sorted(zip(points.x.tolist(), points.y.tolist()))
+
+        reference = InterestPointExtractor().extract_points_with_cv(image, ["salient_points"], context)
+        tiled = InterestPointExtractor(tile_size=512, tile_workers=2).extract_points_with_cv(
+            image, ["salient_points"], context)
+        self.assertEqual(corners(tiled), corners(reference))
+
+    def test_tiled_detect_matches_global_detect(self):
+        image = noisy_chart()
+        reference = InterestPointExtractor().detect(image, "corners")
+        tiled = InterestPointExtractor(tile_size=512, tile_workers=2).detect(image, "corners")
+        self.assertEqual(sorted(tiled.to_tuples()), sorted(reference.to_tuples()))
+
+    def test_process_image_result_and_cache_key_ignore_tiling(self):
+        # Tiling only applies to detect() (API): process_image's plan drops the tiled detectors
+        image = noisy_chart()
+        data = {"x_values": list(range(100)), "y_values": np.sin(np.linspace(0, 9, 100)).tolist()}
+        cache = ResultCache()
+        reference = InterestPointExtractor(cache=cache).process_image(image, data, output="result")
+        self.assertNotIn("corners", reference.detector_timings)
+        tiled = InterestPointExtractor(tile_size=512, cache=cache)
+        self.assertEqual(tiled.cache_params(), InterestPointExtractor().cache_params())
+        self.assertEqual(tiled.process_image(image, data, output="result").points, reference.points)
+        self.assertEqual(cache.stats()["hits_memory"], 1)
@@ -0,0 +1,69 @@
+import struct
+
+import cv2
+import numpy as np
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.test import SimpleTestCase
+
+from ..uploads import decode_image, image_dimensions, reduction_factor, upload_buffer
+
+
+def encode(ext, width=500, height=300, params=()):
+    image = np.zeros((height, width, 3), np.uint8)
+    cv2.rectangle(image, (50, 50), (width - 50, height - 50), (255, 255, 255), -1)
+    return cv2.imencode(ext, image, list(params))[1].tobytes()
+
+
+class ImageDimensionsTests(SimpleTestCase):
+    def test_headers_of_supported_formats(self):
+        for ext in (".png", ".jpg", ".bmp"):
+            with self.subTest(ext=ext):
+                self.assertEqual(image_dimensions(encode(ext)), (500, 300))
+
+    def test_webp_lossy_and_lossless(self):
+        self.assertEqual(image_dimensions(encode(".webp", params=(cv2.IMWRITE_WEBP_QUALITY, 80))), (500, 300))
+        self.assertEqual(image_dimensions(encode(".webp", params=(cv2.IMWRITE_WEBP_QUALITY, 101))), (500, 300))
+
+    def test_gif_header(self):
+        self.assertEqual(image_dimensions(b"GIF89a" + struct.pack("<HH", 640, 480) + b"\x00" * 8), (640, 480))
+
+    def test_progressive_jpeg(self):
+        data = encode(".jpg", 640, 480, (cv2.IMWRITE_JPEG_PROGRESSIVE, 1))
+        self.assertEqual(image_dimensions(data), (640, 480))
+
+    def test_unknown_or_truncated(self):
+        self.assertIsNone(image_dimensions(cv2.imencode(".hdr", np.zeros((30, 50, 3), np.float32))[1].tobytes()))
+        self.assertIsNone(image_dimensions(b"\x89PNG\r\n\x1a\n"))
+        self.assertIsNone(image_dimensions(b""))
+
+
+class DecodeImageTests(SimpleTestCase):
+    def test_reduction_factor_keeps_max_side(self):
+        self.assertEqual(reduction_factor(4000, 3000, None), 1)
+        self.assertEqual(reduction_factor(4000, 3000, 1000), 4)
+        self.assertEqual(reduction_factor(4000, 3000, 1500), 2)
+        self.assertEqual(reduction_factor(800, 600, 1000), 1)
+
+    def test_reduced_decode(self):
+        data = encode(".jpg", 2000, 1200)
+        image, factor = decode_image(memoryview(data), max_side=500)
+        self.assertEqual(factor, 4)
+        self.assertEqual(image.shape, (300, 500, 3))
+        image, factor = decode_image(data)
+        self.assertEqual((image.shape, factor), ((1200, 2000, 3), 1))
+
+    def test_empty_or_invalid_buffer(self):
+        self.assertEqual(decode_image(b""), (None, 1))
+        self.assertIsNone(decode_image(b"not an image")[0])
+
+
+class UploadBufferTests(SimpleTestCase):
+    def test_in_memory_and_temporary_uploads(self):
+        data = encode(".png")
+        temporary = TemporaryUploadedFile("a.png", "image/png", len(data), None)
+        temporary.write(data)
+        temporary.flush()
+        self.addCleanup(temporary.close)
+        for uploaded in (SimpleUploadedFile("a.png", data), temporary):
+            with self.subTest(upload=type(uploaded).__name__), upload_buffer(uploaded) as buffer:
+                self.assertEqual(bytes(buffer), data)
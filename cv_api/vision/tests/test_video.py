@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+
+import cv2
+import numpy as np
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase
+
+from benchmarks.charts import make_histogram_chart, make_line_chart
+
+from ..cv_models.video import FrameStreamExtractor, iter_video_frames
+from .utils import MediaTestMixin
+
+
+def scrolling_frames(count, width=640, height=480):
+    """A chart scrolling one pixel per frame, then a cut to another chart"""
+    chart = make_line_chart(width + count, height, n_points=20, seed=3)
+    frames = [np.ascontiguousarray(chart[:, i:i + width]) for i in range(count)]
+    return frames + [make_histogram_chart(width, height, seed=4)]
+
+
+def write_video(path, frames):
+    height, width = frames[0].shape[:2]
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (width, height))
+    for frame in frames:
+        writer.write(frame)
+    writer.release()
+
+
+class FrameStreamExtractorTests(SimpleTestCase):
+    def test_corners_are_tracked_between_detections(self):
+        frames = scrolling_frames(8)
+        results = list(FrameStreamExtractor(redetect_interval=4).process(frames))
+        self.assertEqual([result.index for result in results], list(range(9)))
+        self.assertEqual([result.scene_change for result in results], [True] + [False] * 7 + [True])
+        self.assertEqual([result.redetected for result in results],
+                         [True, False, False, False, True, False, False, False, True])
+
+        # Tracked corners stay close to the corners detected from scratch
+        tracked, fresh = results[3].points, FrameStreamExtractor().process_frame(frames[3]).points
+        distances = np.hypot(tracked.x[:, None] - fresh.x[None, :], tracked.y[:, None] - fresh.y[None, :])
+        self.assertLess(np.median(distances.min(axis=1)), 2)
+
+    def test_results_serialize(self):
+        result = FrameStreamExtractor().process_frame(scrolling_frames(1)[0])
+        data = result.to_dict()
+        self.assertEqual(data["frame"], 0)
+        self.assertEqual(data["count"], len(data["interest_points"]))
+        self.assertTrue(all(point["type"] == "corner" for point in data["interest_points"]))
+
+    def test_iter_video_frames_step_and_limit(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "chart.avi")
+            write_video(path, scrolling_frames(9))
+            self.assertEqual(len(list(iter_video_frames(path))), 10)
+            self.assertEqual(len(list(iter_video_frames(path, step=3))), 4)
+            self.assertEqual(len(list(iter_video_frames(path, step=2, max_frames=2))), 2)
+            with self.assertRaises(ValueError):
+                next(iter_video_frames(os.path.join(tmp, "missing.avi")))
+
+
+class VideoEndpointTests(MediaTestMixin, TestCase):
+    def test_video_streams_frames_and_summary(self):
+        path = os.path.join(self.media_root, "chart.avi")
+        write_video(path, scrolling_frames(5))
+        with open(path, "rb") as f:
+            video = SimpleUploadedFile("chart.avi", f.read(), content_type="video/x-msvideo")
+        response = self.client.post("/interest-point/video/?step=2", {"video": video})
+        self.assertEqual(response.status_code, 200)
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        summary = lines.pop()
+        self.assertEqual([line["frame"] for line in lines], [0, 1, 2])
+        self.assertEqual(summary["frames"], 3)
+        self.assertTrue(summary["summary"])
+
+    def test_unreadable_video(self):
+        video = SimpleUploadedFile("notes.avi", b"not a video", content_type="video/x-msvideo")
+        self.assertEqual(self.client.post("/interest-point/video/", {"video": video}).status_code, 400)
@@ -0,0 +1,75 @@
+import shutil
+import tempfile
+import time
+from unittest import mock
+
+import cv2
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+
+from benchmarks.charts import make_line_chart
+
+from .. import jobs, services
+from ..models import InterestPointJob
+
+EXTRACTORS = {"default": {"OPTIONS": {"digitize": True}, "CACHE": True}}
+
+
+def chart_png(width=800, height=600, n_points=12, seed=1):
+    return cv2.imencode(".png", make_line_chart(width, height, n_points, seed))[1].tobytes()
+
+
+def upload(name="chart.png", content=None):
+    return SimpleUploadedFile(name, content if content is not None else chart_png(), content_type="image/png")
+
+
+class MediaTestMixin:
+    """Temporary MEDIA_ROOT and result cache, fresh process-wide extractors"""
+
+    def setUp(self):
+        super().setUp()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        overrides = override_settings(
+            MEDIA_ROOT=self.media_root,
+            INTEREST_POINT_CACHE={"MEMORY_ITEMS": 64, "DIR": f"{self.media_root}/cache"},
+            INTEREST_POINT_EXTRACTORS=EXTRACTORS,
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self._reset_services()
+        self.addCleanup(self._reset_services)
+
+    @staticmethod
+    def _reset_services():
+        services._result_cache = None
+        services._api_result_cache = None
+        services._extractors.clear()
+
+
+class JobQueueTestMixin(MediaTestMixin):
+    """A real worker pool installed as the process-wide queue"""
+    start_method = None
+
+    def setUp(self):
+        super().setUp()
+        self.queue = jobs.JobQueue(workers=1, max_pending=4, extractor_config=EXTRACTORS["default"],
+                                   start_method=self.start_method)
+        self.addCleanup(self.queue.shutdown)
+        patcher = mock.patch.object(jobs, "_job_queue", self.queue)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def wait_for(self, status_url, timeout=60):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            data = self.client.get(status_url).json()
+            if data["status"] in (InterestPointJob.STATUS_DONE, InterestPointJob.STATUS_FAILED):
+                return data
+            time.sleep(0.2)
+        self.fail(f"Job still {data['status']} after {timeout} s")
+
+    def submit_and_wait(self):
+        response = self.client.post("/interest-point/jobs/", {"image": upload()})
+        self.assertEqual(response.status_code, 202)
+        return self.wait_for(response.json()["status_url"])
@@ -0,0 +1,200 @@
+import io
+import mmap
+import struct
+from contextlib import contextmanager
+
+import cv2
+import numpy as np
+from django.core.files.base import ContentFile
+
+from .memory import ImageTooLarge
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow (also used by the upload serializers) reads the other headers
+    Image = None
+
+# IMREAD_REDUCED_* flags by downscale factor
+_REDUCED_FLAGS = {
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+@contextmanager
+def upload_buffer(uploaded_file):
+    """
+    Expose the bytes of an uploaded file as a single read-only buffer.
+
+    In-memory uploads yield a view of their BytesIO (no copy); uploads Django
+    spooled to a temporary file are memory-mapped instead of being read.
+    """
+    if hasattr(uploaded_file, "temporary_file_path"):
+        with open(uploaded_file.temporary_file_path(), "rb") as f:
+            if uploaded_file.size == 0:
+                yield memoryview(b"")
+                return
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+                mapped.close()
+        return
+
+    uploaded_file.seek(0)
+    inner = uploaded_file.file
+    if hasattr(inner, "getbuffer"):
+        view = inner.getbuffer()
+        try:
+            yield view
+        finally:
+            view.release()
+    else:
+        yield memoryview(uploaded_file.read())
+
+
+def image_dimensions(buffer):
+    """
+    Read (width, height) from a PNG, JPEG, WebP, GIF or BMP header without
+    decoding; other formats (TIFF, PNM...) are identified by Pillow, which
+    also reads only the header. Returns None for unknown or malformed data.
+    """
+    dims = _parse_dimensions(buffer)
+    if dims is None and Image is not None and len(buffer):
+        try:
+            with Image.open(io.BytesIO(buffer)) as image:
+                dims = image.size
+        except Exception:
+            # Unidentified, truncated or over Pillow's decompression-bomb limit
+            dims = None
+    return dims
+
+
+def _parse_dimensions(buffer):
+    data = memoryview(buffer)
+    head = bytes(data[:30])
+    if head.startswith(b"\x89PNG\r\n\x1a\n") and len(head) >= 24:
+        return struct.unpack(">II", head[16:24])
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return struct.unpack("<HH", head[6:10])
+    if head.startswith(b"BM") and len(head) >= 26:
+        width, height = struct.unpack("<ii", head[18:26])
+        return width, abs(height)
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP" and len(head) >= 30:
+        chunk = head[12:16]
+        if chunk == b"VP8X":
+            width = int.from_bytes(head[24:27], "little") + 1
+            height = int.from_bytes(head[27:30], "little") + 1
+            return width, height
+        if chunk == b"VP8 ":
+            width, height = struct.unpack("<HH", head[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b"VP8L":
+            bits = struct.unpack("<I", head[21:25])[0]
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        return None
+    if head.startswith(b"\xff\xd8"):
+        # Walk JPEG segments up to the first start-of-frame marker
+        i, n = 2, len(data)
+        while i + 9 < n:
+            if data[i] != 0xFF:
+                i += 1
+                continue
+            marker = data[i + 1]
+            if marker == 0xFF:
+                i += 1
+                continue
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+                i += 2
+                continue
+            length = struct.unpack(">H", bytes(data[i + 2:i + 4]))[0]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack(">HH", bytes(data[i + 5:i + 9]))
+                return width, height
+            i += 2 + length
+    return None
+
+
+def reduction_factor(width, height, max_side):
+    """Largest IMREAD_REDUCED factor that keeps the longest side >= max_side"""
+    if not max_side:
+        return 1
+    factor = 1
+    for candidate in sorted(_REDUCED_FLAGS):
+        if max(width, height) // candidate >= max_side:
+            factor = candidate
+    return factor
+
+
+def budget_reduction_factor(width, height, budget, buffer):
+    """
+    IMREAD_REDUCED factor for an image over a MemoryBudget: the largest one
+    not beyond the downscale the budget requires (the remainder is resized
+    after decoding). Only JPEG is scaled while decoding; other formats are
+    decoded at full size first, so they are rejected with ImageTooLarge when
+    that decode alone exceeds the budget.
+    """
+    needed = budget.downscale_factor(width, height)
+    if needed <= 1:
+        return 1
+    if bytes(memoryview(buffer)[:2]) != b"\xff\xd8" and not budget.can_decode_full(width, height):
+        raise ImageTooLarge(f"Image too large to process ({width}x{height} pixels)")
+    factor = 1
+    for candidate in sorted(_REDUCED_FLAGS):
+        if candidate <= needed:
+            factor = candidate
+    return factor
+
+
+def decode_image(buffer, max_side=None, budget=None):
+    """
+    Decode an image from a buffer without copying it.
+
+    When max_side is set and the header reports a larger image, a reduced
+    resolution decode (IMREAD_REDUCED_COLOR_2/4/8) is used. With a
+    MemoryBudget, the header dimensions are checked before decoding and
+    images over budget are decoded reduced, then resized (INTER_AREA) to fit;
+    an image whose size cannot be read is not decoded at all (None), since
+    nothing would bound its decode. Returns (image, factor) where factor is
+    the downscale applied (1 if none; a float once the budget resized the
+    image).
+    """
+    if len(buffer) == 0:
+        return None, 1
+
+    flags, factor = cv2.IMREAD_COLOR, 1
+    dims = image_dimensions(buffer) if max_side or budget is not None else None
+    if dims is None and budget is not None and budget.pixel_limit is not None:
+        return None, 1
+    if dims is not None:
+        factor = reduction_factor(dims[0], dims[1], max_side)
+        if budget is not None:
+            factor = max(factor, budget_reduction_factor(dims[0], dims[1], budget, buffer))
+        flags = _REDUCED_FLAGS.get(factor, cv2.IMREAD_COLOR)
+
+    array = np.frombuffer(buffer, np.uint8)
+    try:
+        image = cv2.imdecode(array, flags)
+    finally:
+        # Drop the export so an mmap-backed buffer can be closed
+        del array
+
+    # The header size can differ from the decoded one (e.g. multi-page TIFF)
+    if image is not None and budget is not None:
+        height, width = image.shape[:2]
+        remaining = budget.downscale_factor(width, height)
+        if remaining > 1:
+            size = (max(1, int(width / remaining)), max(1, int(height / remaining)))
+            image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+            factor *= width / size[0]
+    return image, factor
+
+
+def save_upload_buffer(storage, name, buffer):
+    """Persist an upload from its already-read buffer"""
+    if hasattr(storage, "save_buffer"):
+        return storage.save_buffer(name, buffer)
+    return storage.save(name, ContentFile(bytes(buffer)))
@@ -1,14 +1,29 @@
 from django.urls import path
 from .views import (
     home_view, upload_and_predict, ocr_view, model2d_view, model3d_view,
-    gui2code_view, interest_point_view,
+    gui2code_view, interest_point_view, interest_point_job_submit,
+    interest_point_job_status, interest_point_cache_stats, interest_point_batch,
+    upload_and_predict_async, interest_point_view_async, interest_point_api,
+    interest_point_api_result, interest_point_query, interest_point_video, pipeline_metrics_view,
 )
 
 urlpatterns = [
     path("", home_view, name="home"),
     path("predict/", upload_and_predict, name="predict"),
+    path("predict/async/", upload_and_predict_async, name="predict_async"),
     path("ocr/", ocr_view, name="ocr"),
     path("2d/", model2d_view, name="model2d"),
     path("3d/", model3d_view, name="model3d"),
     path("gui2code/", gui2code_view, name="gui2code"),
-    path("interest-point/", interest_point_view, name="interest_point"),]
+    path("interest-point/", interest_point_view, name="interest_point"),
+    path("interest-point/async/", interest_point_view_async, name="interest_point_async"),
+    path("interest-point/jobs/", interest_point_job_submit, name="interest_point_job_submit"),
+    path("interest-point/jobs/<uuid:job_id>/", interest_point_job_status, name="interest_point_job_status"),
+    path("interest-point/batch/", interest_point_batch, name="interest_point_batch"),
+    path("interest-point/video/", interest_point_video, name="interest_point_video"),
+    path("interest-point/cache/stats/", interest_point_cache_stats, name="interest_point_cache_stats"),
+    path("metrics/", pipeline_metrics_view, name="pipeline_metrics"),
+    path("api/interest-points/", interest_point_api, name="interest_point_api"),
+    path("api/interest-points/query/", interest_point_query, name="interest_point_query"),
+    path("api/interest-points/<str:result_id>/", interest_point_api_result, name="interest_point_api_result"),
+]
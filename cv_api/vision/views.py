@@ -1,14 +1,49 @@
 from django.conf import settings
 from django.shortcuts import render
+from django.core.paginator import Paginator
+from django.http import HttpResponse, StreamingHttpResponse
 from django.core.files.storage import default_storage
+from django.core import signing
+import asyncio
+import hashlib
+import itertools
+from datetime import timedelta
+import logging
 import os
-import time, json, cv2, numpy as np
-from rest_framework.decorators import api_view, parser_classes
+import time, json
+from asgiref.sync import sync_to_async
+from rest_framework.decorators import api_view, parser_classes, throttle_classes
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 from rest_framework import status
 from django.urls import reverse
-from .cv_models.pointinteret import InterestPointExtractor
+from django.utils import timezone
+from .jobs import QueueFull, QueueUnavailable, get_job_queue
+from .models import InterestPoint, InterestPointJob
+from .persistence import try_persist_result
+from .serializers import (
+    ImageUploadSerializer, InterestPointQuerySerializer, InterestPointRequestSerializer,
+    InterestPointResponseSerializer, StoredInterestPointSerializer,
+)
+from .services import (
+    get_api_result_cache, get_cpu_executor, get_extractor, get_memory_budget, get_pipeline_metrics,
+    get_result_cache, new_profiler,
+)
+
+# The CV stack (cv2, NumPy, SciPy via vision.cv_models and vision.uploads) is
+# imported inside the views that need it, keeping this module cheap to import
+
+logger = logging.getLogger(__name__)
+
+# Salt of the signed API result ids (see _api_result_id)
+API_RESULT_SALT = "vision.interest_point_api.result"
+
+
+def _decode_upload(profiler, buffer):
+    from .uploads import decode_image
+
+    with profiler.stage("decode"):
+        return decode_image(buffer, max_side=settings.INTEREST_POINT_MAX_SIDE, budget=get_memory_budget())
 
 # # Template-based views 
 def home_view(request):
@@ -45,46 +80,497 @@ def upload_and_predict(request):
 
 
 def interest_point_view(request):
+    from .uploads import save_upload_buffer, upload_buffer
+
     context = {}
     
     if request.method == 'POST' and request.FILES.get('image'):
+        start_time = time.perf_counter()
+        profiler = new_profiler()
         try:
             image_file = request.FILES['image']
             
-            # Read the file content
-            file_bytes = np.frombuffer(image_file.read(), np.uint8)
-            img = cv2.imdecode(file_bytes, cv2.IMREAD_COLOR)
+            # Read the upload once: the same buffer feeds decoding and storage
+            with upload_buffer(image_file) as buffer:
+                img, decode_factor = _decode_upload(profiler, buffer)
+                
+                if img is None:
+                    raise ValueError("Could not read the image file")
+                
+                # Save original image for reference
+                file_path = save_upload_buffer(default_storage, f'uploads/interest_points/{image_file.name}', buffer)
             
-            if img is None:
-                raise ValueError("Could not read the image file")
+            # Use the shared, pre-warmed InterestPointExtractor (structured result, no JSON round-trip)
+            result = get_extractor().process_image(img, output="result", profiler=profiler)
             
-            # Save original image for reference
-            file_path = default_storage.save(f'uploads/interest_points/{image_file.name}', image_file)
-            image_file.seek(0)
+            if result.error is not None:
+                raise ValueError(result.error)
+            # Report coordinates in the original image
+            result = result.rescaled(decode_factor)
+            # A storage failure is logged; the user still gets the points
+            try_persist_result(default_storage, file_path, result)
             
-            # Use the InterestPointExtractor model
-            extractor = InterestPointExtractor()
-            results = extractor.process_image(img)
+            profile = profiler.to_dict()
+            get_pipeline_metrics().observe(profile)
+            context = {
+                'points': result.points,
+                'image_url': settings.MEDIA_URL + file_path,
+                'processing_time': round(time.perf_counter() - start_time, 3),
+                'decode_factor': decode_factor,
+                'profile': profile,
+                'success': True
+            }
             
-            # Debug the results
-            print("Type of results:", type(results))
-            print("Results value:", results)
+        except Exception as e:
+            logger.exception("Interest point extraction failed")
+            context = {'error': str(e)}
+    
+    return render(request, 'vision/interest_point.html', context)
+
+
+# # Async (ASGI) views: CPU work goes to a bounded executor, storage I/O to threads
+async def upload_and_predict_async(request):
+    prediction = None
+    uploaded_image_url = None
+    
+    files = await sync_to_async(lambda: request.FILES)()
+    if request.method == "POST" and files.get("image"):
+        img_file = files["image"]
+        file_path = await asyncio.to_thread(default_storage.save, f'uploads/{img_file.name}', img_file)
+        prediction = "cat"
+        uploaded_image_url = settings.MEDIA_URL + file_path
+
+    return await sync_to_async(render)(request, "vision/upload.html",
+                                       {"prediction": prediction,
+                                        "uploaded_image_url": uploaded_image_url})
+
+
+async def interest_point_view_async(request):
+    from .uploads import save_upload_buffer, upload_buffer
+
+    context = {}
+    
+    files = await sync_to_async(lambda: request.FILES)()
+    if request.method == 'POST' and files.get('image'):
+        start_time = time.perf_counter()
+        profiler = new_profiler()
+        loop = asyncio.get_running_loop()
+        executor = get_cpu_executor()
+        try:
+            image_file = files['image']
+            
+            # Decode on the CPU executor while the same buffer is written to storage
+            # (both tasks finish before the buffer is released)
+            with upload_buffer(image_file) as buffer:
+                decoded, file_path = await asyncio.gather(
+                    loop.run_in_executor(executor, _decode_upload, profiler, buffer),
+                    asyncio.to_thread(save_upload_buffer, default_storage,
+                                      f'uploads/interest_points/{image_file.name}', buffer),
+                    return_exceptions=True,
+                )
+            for outcome in (decoded, file_path):
+                if isinstance(outcome, Exception):
+                    raise outcome
+            img, decode_factor = decoded
+            
+            if img is None:
+                raise ValueError("Could not read the image file")
+            
+            # The first call builds and warms the extractor: keep it off the event loop
+            result = await loop.run_in_executor(
+                executor, lambda: get_extractor().process_image(img, output="result", profiler=profiler))
             
-            # Check if results is a dictionary
-            if not isinstance(results, dict):
-                raise ValueError(f"Model returned {type(results)} instead of dictionary: {results}")
+            if result.error is not None:
+                raise ValueError(result.error)
+            # Report coordinates in the original image
+            result = result.rescaled(decode_factor)
+            await sync_to_async(try_persist_result)(default_storage, file_path, result)
             
+            profile = profiler.to_dict()
+            get_pipeline_metrics().observe(profile)
             context = {
-                'points': results.get('points', []),
-                'image_url': settings.MEDIA_URL + results.get('output_image_path', ''),
-                'processing_time': results.get('processing_time', 0),
+                'points': result.points,
+                'image_url': settings.MEDIA_URL + file_path,
+                'processing_time': round(time.perf_counter() - start_time, 3),
+                'decode_factor': decode_factor,
+                'profile': profile,
                 'success': True
             }
             
         except Exception as e:
-            print("Error occurred:", str(e))
-            import traceback
-            print("Traceback:", traceback.format_exc())
+            logger.exception("Interest point extraction failed")
             context = {'error': str(e)}
     
-    return render(request, 'vision/interest_point.html', context)
\ No newline at end of file
+    return await sync_to_async(render)(request, 'vision/interest_point.html', context)
+
+
+# # Asynchronous interest-point jobs
+@api_view(["POST"])
+@parser_classes([MultiPartParser, FormParser])
+def interest_point_job_submit(request):
+    # Same checks as the other upload endpoints (image type, size, decodable)
+    # before anything is stored or queued
+    serializer = ImageUploadSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    image_file = serializer.validated_data["image"]
+
+    file_path = default_storage.save(f'uploads/interest_points/{image_file.name}', image_file)
+    try:
+        job = get_job_queue().submit(file_path)
+    except QueueFull as e:
+        # The blob may be shared with other uploads, so it is kept
+        return Response({"error": str(e)}, status=status.HTTP_429_TOO_MANY_REQUESTS,
+                        headers={"Retry-After": "5"})
+    except QueueUnavailable as e:
+        return Response({"error": str(e)}, status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        headers={"Retry-After": "5"})
+
+    return Response(
+        {
+            "job_id": str(job.id),
+            "status": job.status,
+            "status_url": reverse("interest_point_job_status", args=[job.id]),
+        },
+        status=status.HTTP_202_ACCEPTED,
+    )
+
+
+@api_view(["GET"])
+@throttle_classes([])
+def interest_point_job_status(request, job_id):
+    try:
+        job = InterestPointJob.objects.get(pk=job_id)
+    except InterestPointJob.DoesNotExist:
+        return Response({"error": "Unknown job"}, status=status.HTTP_404_NOT_FOUND)
+
+    data = {
+        "job_id": str(job.id),
+        "status": job.status,
+        "image_url": settings.MEDIA_URL + job.image_path,
+    }
+    if job.status == InterestPointJob.STATUS_DONE:
+        data["result"] = job.result
+        data["processing_time"] = (job.finished_at - job.started_at).total_seconds()
+    elif job.status == InterestPointJob.STATUS_FAILED:
+        data["error"] = job.error
+    return Response(data)
+
+
+@api_view(["POST"])
+@parser_classes([MultiPartParser])
+def interest_point_batch(request):
+    """Process many images (files and/or zip archives) and stream NDJSON results"""
+    from .batch import stream_batch
+
+    files = request.FILES.getlist("images") + request.FILES.getlist("image")
+    if not files:
+        return Response({"error": "No images provided"}, status=status.HTTP_400_BAD_REQUEST)
+
+    max_files = settings.INTEREST_POINT_JOBS.get("BATCH_MAX_FILES", 1000)
+    max_member_size = settings.INTEREST_POINT_JOBS.get("BATCH_MAX_MEMBER_SIZE")
+    return StreamingHttpResponse(
+        stream_batch(files, default_storage, max_files=max_files, max_member_size=max_member_size),
+        content_type="application/x-ndjson",
+    )
+
+
+@api_view(["GET"])
+@throttle_classes([])
+def interest_point_cache_stats(request):
+    cache = get_result_cache()
+    if cache is None:
+        return Response({"enabled": False})
+    return Response({"enabled": True, **cache.stats()})
+
+
+@api_view(["POST"])
+@parser_classes([MultiPartParser])
+def interest_point_video(request):
+    """
+    Track interest points through a video (e.g. a dashboard screen recording)
+    and stream one NDJSON line per frame, then a summary line. ?step=N keeps
+    one frame in N.
+    """
+    from .cv_models.results import encode_json
+    from .cv_models.video import FrameStreamExtractor, iter_video_frames
+
+    video_file = request.FILES.get("video")
+    if video_file is None:
+        return Response({"error": "No video provided"}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        step = max(1, int(request.query_params.get("step", 1)))
+    except ValueError:
+        return Response({"error": "step must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+
+    # OpenCV reads videos from a path: the upload is stored first
+    file_path = default_storage.save(f'uploads/videos/{video_file.name}', video_file)
+    config = settings.INTEREST_POINT_VIDEO
+    try:
+        frames = iter_video_frames(default_storage.path(file_path), step=step, max_frames=config["MAX_FRAMES"])
+        first = next(frames, None)
+    except ValueError:
+        return Response({"error": "Could not open the video file"}, status=status.HTTP_400_BAD_REQUEST)
+    if first is None:
+        return Response({"error": "Could not read any frame from the video"}, status=status.HTTP_400_BAD_REQUEST)
+
+    stream = FrameStreamExtractor(get_extractor(), redetect_interval=config["REDETECT_INTERVAL"],
+                                  scene_threshold=config["SCENE_THRESHOLD"])
+
+    def lines():
+        start_time = time.perf_counter()
+        count = scene_changes = detections = 0
+        for result in stream.process(itertools.chain([first], frames)):
+            count += 1
+            scene_changes += result.scene_change
+            detections += result.redetected
+            yield encode_json(result.to_dict()) + "\n"
+        elapsed = time.perf_counter() - start_time
+        yield encode_json({
+            "summary": True,
+            "frames": count,
+            "scene_changes": scene_changes,
+            "full_detections": detections,
+            "processing_time": round(elapsed, 3),
+            "frames_per_second": round(count / elapsed, 1) if elapsed > 0 else None,
+            "video_url": settings.MEDIA_URL + file_path,
+        }) + "\n"
+
+    return StreamingHttpResponse(lines(), content_type="application/x-ndjson")
+
+
+def pipeline_metrics_view(request):
+    """Per-stage latency histograms and counters in the Prometheus text format"""
+    return HttpResponse(get_pipeline_metrics().render(),
+                        content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+
+# # JSON API for interest points
+def _page_size(request):
+    """?page_size= clamped to INTEREST_POINT_API limits"""
+    api_settings = settings.INTEREST_POINT_API
+    try:
+        page_size = int(request.query_params.get("page_size", api_settings["PAGE_SIZE"]))
+    except ValueError:
+        page_size = api_settings["PAGE_SIZE"]
+    return max(1, min(page_size, api_settings["MAX_PAGE_SIZE"]))
+
+
+def _points_page(request, result_id, stored):
+    """One page of a stored point list, shaped by InterestPointResponseSerializer"""
+    page_size = _page_size(request)
+    paginator = Paginator(stored["points"], page_size)
+    page = paginator.get_page(request.query_params.get("page", 1))
+    base_url = request.build_absolute_uri(reverse("interest_point_api_result", args=[result_id]))
+
+    data = InterestPointResponseSerializer({
+        "points": list(page.object_list),
+        "detection_type": stored["detection_type"],
+        "image_url": stored["image_url"],
+        "processing_time": stored["processing_time"],
+    }).data
+    for key in ("profile", "plot_area"):
+        if key in stored:
+            data[key] = stored[key]
+    data.update({
+        "result_id": result_id,
+        "count": paginator.count,
+        "detector_timings": stored.get("detector_timings", {}),
+        "next": f"{base_url}?page={page.next_page_number()}&page_size={page_size}" if page.has_next() else None,
+        "previous": f"{base_url}?page={page.previous_page_number()}&page_size={page_size}" if page.has_previous() else None,
+    })
+    return data
+
+
+def _stream_points(result_id, stored):
+    """NDJSON: a header line with the response metadata, then one line per point"""
+    from .cv_models.results import encode_json
+
+    header = {key: value for key, value in stored.items() if key != "points"}
+    header.update(result_id=result_id, count=len(stored["points"]))
+    yield encode_json(header) + "\n"
+    for point in stored["points"]:
+        yield encode_json(point) + "\n"
+
+
+def _api_result_id(file_path, detection_type, plot_area_only):
+    """
+    Signed reference to an API result: the stored image and the detector
+    parameters, enough to recompute the points when they are not cached
+    """
+    return signing.Signer(salt=API_RESULT_SALT).sign_object([file_path, detection_type, plot_area_only])
+
+
+def _api_cache_key(result_id):
+    return hashlib.blake2b(result_id.encode(), digest_size=20).hexdigest()
+
+
+def _detect_points(request, img, decode_factor, file_path, detection_type, plot_area_only, profiler):
+    """Run one detector on a decoded image and build the stored API result"""
+    from .cv_models.analysis_context import ImageAnalysisContext
+    from .cv_models.points import PointArray
+    from .cv_models.roi import locate_plot_area
+
+    start_time = time.perf_counter()
+    timings = {}
+    plot_area = None
+    with profiler.stage("cv_extract") as stage:
+        context = ImageAnalysisContext(img)
+        # Falls back to the whole image when no axes are found
+        roi = locate_plot_area(context) if plot_area_only else None
+        points = get_extractor().detect(img, detection_type, context, timings=timings, roi=roi)
+        if roi is not None:
+            plot_area = [int(value * decode_factor) for value in roi]
+        if decode_factor != 1:
+            # Report coordinates in the original image
+            points = PointArray(points.x * decode_factor, points.y * decode_factor, points.kind)
+        stage.points = len(points)
+
+    stored = {
+        "points": points.to_dicts(),
+        "detection_type": detection_type,
+        "image_url": request.build_absolute_uri(settings.MEDIA_URL + file_path),
+        "processing_time": round(time.perf_counter() - start_time, 3),
+        "detector_timings": {name: round(seconds, 4) for name, seconds in timings.items()},
+    }
+    if plot_area_only:
+        stored["plot_area"] = plot_area
+    return stored
+
+
+def _cache_api_result(result_id, stored, profiler):
+    """Keep the full list so later pages are usually served without recomputation"""
+    from .cv_models.results import encode_json
+
+    cache = get_api_result_cache()
+    if cache is not None:
+        with profiler.stage("serialize"):
+            encoded = encode_json(stored)
+        cache.put(_api_cache_key(result_id), encoded)
+
+
+@api_view(["POST"])
+@parser_classes([MultiPartParser, FormParser])
+def interest_point_api(request):
+    """
+    Run only the requested detector (detection_type) on the uploaded image.
+    Returns the first page of points, or the whole list as NDJSON with ?stream=1.
+    """
+    from .memory import ImageTooLarge
+    from .uploads import save_upload_buffer, upload_buffer
+
+    serializer = InterestPointRequestSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    image_file = serializer.validated_data["image"]
+    detection_type = serializer.validated_data["detection_type"]
+    plot_area_only = serializer.validated_data["plot_area_only"]
+    if plot_area_only is None:
+        plot_area_only = get_extractor().crop_plot_area
+
+    start_time = time.perf_counter()
+    profiler = new_profiler()
+    with upload_buffer(image_file) as buffer:
+        try:
+            img, decode_factor = _decode_upload(profiler, buffer)
+        except ImageTooLarge as e:
+            return Response({"error": str(e)}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        if img is None:
+            return Response({"error": "Could not read the image file"}, status=status.HTTP_400_BAD_REQUEST)
+        file_path = save_upload_buffer(default_storage, f'uploads/interest_points/{image_file.name}', buffer)
+
+    stored = _detect_points(request, img, decode_factor, file_path, detection_type, plot_area_only, profiler)
+    stored["processing_time"] = round(time.perf_counter() - start_time, 3)
+    result_id = _api_result_id(file_path, detection_type, plot_area_only)
+    _cache_api_result(result_id, stored, profiler)
+
+    # Only the response that computed the result carries its profile
+    stored["profile"] = profiler.to_dict()
+    get_pipeline_metrics().observe(stored["profile"])
+
+    if request.query_params.get("stream") in ("1", "true"):
+        return StreamingHttpResponse(_stream_points(result_id, stored), content_type="application/x-ndjson")
+    return Response(_points_page(request, result_id, stored))
+
+
+@api_view(["GET"])
+@throttle_classes([])
+def interest_point_api_result(request, result_id):
+    """
+    Further pages (or an NDJSON stream with ?stream=1) of a previous API
+    result. Served from the API result cache; when the entry is missing
+    (cache disabled or evicted), the detector runs again on the stored image
+    with the same parameters.
+    """
+    from .memory import ImageTooLarge
+
+    try:
+        file_path, detection_type, plot_area_only = signing.Signer(salt=API_RESULT_SALT).unsign_object(result_id)
+    except (signing.BadSignature, TypeError, ValueError):
+        return Response({"error": "Unknown result"}, status=status.HTTP_404_NOT_FOUND)
+
+    cache = get_api_result_cache()
+    cached = cache.get(_api_cache_key(result_id)) if cache is not None else None
+    if cached is not None:
+        stored = json.loads(cached)
+    else:
+        try:
+            with default_storage.open(file_path, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return Response({"error": "The image of this result no longer exists"},
+                            status=status.HTTP_404_NOT_FOUND)
+        profiler = new_profiler()
+        try:
+            img, decode_factor = _decode_upload(profiler, content)
+        except ImageTooLarge as e:
+            return Response({"error": str(e)}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        if img is None:
+            return Response({"error": "Could not read the image file"}, status=status.HTTP_400_BAD_REQUEST)
+        stored = _detect_points(request, img, decode_factor, file_path, detection_type, plot_area_only, profiler)
+        _cache_api_result(result_id, stored, profiler)
+        get_pipeline_metrics().observe(profiler.to_dict())
+
+    if request.query_params.get("stream") in ("1", "true"):
+        return StreamingHttpResponse(_stream_points(result_id, stored), content_type="application/x-ndjson")
+    return Response(_points_page(request, result_id, stored))
+
+
+def _page_url(request, number):
+    params = request.query_params.copy()
+    params["page"] = number
+    return request.build_absolute_uri(f"{request.path}?{params.urlencode()}")
+
+
+@api_view(["GET"])
+@throttle_classes([])
+def interest_point_query(request):
+    """
+    Stored interest points across processed images, filtered by type, upload
+    date, image and x/y range, e.g. ?type=maximum&last_days=7&y_gt=0.5
+    """
+    serializer = InterestPointQuerySerializer(data=request.query_params)
+    serializer.is_valid(raise_exception=True)
+    filters = serializer.validated_data
+
+    points = InterestPoint.objects.select_related("image")
+    if filters.get("type"):
+        points = points.of_type(*filters["type"])
+    since = filters.get("since")
+    if since is None and "last_days" in filters:
+        since = timezone.now() - timedelta(days=filters["last_days"])
+    if since is not None:
+        points = points.uploaded_since(since)
+    if "image" in filters:
+        points = points.filter(image__content_hash=filters["image"])
+    points = (points.x_range(filters.get("x_min"), filters.get("x_max"))
+              .y_range(filters.get("y_gt"), filters.get("y_lt"))
+              .order_by("image_id", "x", "id"))
+
+    paginator = Paginator(points, _page_size(request))
+    page = paginator.get_page(request.query_params.get("page", 1))
+    return Response({
+        "count": paginator.count,
+        "next": _page_url(request, page.next_page_number()) if page.has_next() else None,
+        "previous": _page_url(request, page.previous_page_number()) if page.has_previous() else None,
+        "points": StoredInterestPointSerializer(page.object_list, many=True).data,
+    })
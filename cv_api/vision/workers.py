@@ -0,0 +1,53 @@
+"""
+Entry points of the interest-point worker processes.
+
+The pool pickles these functions by reference, so a worker imports this
+module before anything else: it must not import the Django app registry
+(models, storage, persistence), which is not loaded in processes started
+with the spawn or forkserver methods. Everything a worker needs arrives
+through init_worker's arguments.
+"""
+
+# Per-process extractor, created once by the pool initializer and reused across jobs
+_worker_extractor = None
+_worker_track_memory = False
+_worker_track_rss = False
+_worker_budget = None
+
+
+def init_worker(extractor_config, cache_config, track_memory=False, opencv_config=None,
+                track_rss=False, memory_config=None):
+    global _worker_extractor, _worker_track_memory, _worker_track_rss, _worker_budget
+    from .memory import MemoryBudget
+    from .services import build_extractor, build_result_cache, configure_opencv
+    configure_opencv(opencv_config or {})
+    # Same options as the request-serving extractor, so jobs and views agree
+    _worker_extractor = build_extractor(extractor_config, build_result_cache(cache_config))
+    _worker_extractor.warm_up()
+    _worker_track_memory = track_memory
+    # One job at a time per worker: the RSS peak is reset per job (reset_rss)
+    _worker_track_rss = track_rss
+    _worker_budget = MemoryBudget.from_config(memory_config or {})
+
+
+def process_stored_image(image_path):
+    """
+    Runs in a pool worker: decode the stored image within the memory budget
+    and run the full pipeline. The result dict carries the per-stage "profile"
+    so the parent process can feed its metrics, and the "decode_factor" when
+    the budget downscaled the image (points are rescaled to the original).
+    """
+    import numpy as np
+    from .cv_models.profiling import PipelineProfiler
+    from .uploads import decode_image
+
+    profiler = PipelineProfiler(track_memory=_worker_track_memory, track_rss=_worker_track_rss,
+                                reset_rss=True)
+    with profiler.stage("decode"):
+        img, decode_factor = decode_image(np.fromfile(image_path, np.uint8), budget=_worker_budget)
+    if img is None:
+        raise ValueError("Could not read the image file")
+    result = _worker_extractor.process_image(img, output="result", profiler=profiler)
+    data = result.rescaled(decode_factor).to_dict()
+    data["profile"] = profiler.to_dict()
+    return data